@@ -0,0 +1,62 @@
+"""Benchmark of the write throughput of :class:`~graphxplore.Basis.GraphCSVWriter`.
+
+Compares writing single rows (equivalent to the former writer) with batch, compressed and parallel writing. Run with
+``python benchmark/bench_graph_csv_writer.py [nof_nodes]``.
+"""
+import sys
+import time
+import tempfile
+import multiprocessing
+import pathlib
+ROOT_DIR = str(pathlib.Path(__file__).parents[1])
+sys.path.append(ROOT_DIR)
+from graphxplore.Basis import GraphCSVWriter, GraphCSVCompression, GraphType
+from graphxplore.Basis.BaseGraph import BaseGraph, BaseNode, BaseEdge, BaseLabels, BaseNodeType, BaseEdgeType
+
+def generate_graph(nof_nodes : int) -> BaseGraph:
+    graph = BaseGraph()
+    for node_id in range(nof_nodes):
+        table = 'Table' + str(node_id % 10)
+        if node_id % 10 == 0:
+            graph.nodes.append(BaseNode(node_id, BaseLabels((table,), BaseNodeType.Key), 'pk', node_id))
+        elif node_id % 3 == 0:
+            graph.nodes.append(BaseNode(node_id, BaseLabels((table,), BaseNodeType.Attribute), 'str_var',
+                                        'value_' + str(node_id), 'description'))
+        elif node_id % 3 == 1:
+            graph.nodes.append(BaseNode(node_id, BaseLabels((table,), BaseNodeType.Attribute), 'float_var',
+                                        node_id / 7))
+        else:
+            graph.nodes.append(BaseNode(node_id, BaseLabels((table,), BaseNodeType.Attribute), 'int_var', node_id))
+        if node_id % 10 != 0:
+            graph.edges.append(BaseEdge(node_id - node_id % 10, node_id, BaseEdgeType.HAS_ATTR_VAL))
+    return graph
+
+def time_write(graph : BaseGraph, batch : bool, compression=None) -> float:
+    with tempfile.TemporaryDirectory() as graph_dir:
+        start = time.perf_counter()
+        with GraphCSVWriter(graph_dir, GraphType.Base, compression) as writer:
+            if batch:
+                writer.write_nodes(graph.nodes)
+                writer.write_edges(graph.edges)
+            else:
+                for node in graph.nodes:
+                    writer.write_node(node)
+                for edge in graph.edges:
+                    writer.write_edge(edge)
+        return time.perf_counter() - start
+
+if __name__ == '__main__':
+    nof_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    bench_graph = generate_graph(nof_nodes)
+    nof_rows = len(bench_graph.nodes) + len(bench_graph.edges)
+    for name, use_batch, comp in [('single rows', False, None), ('batch', True, None),
+                                  ('batch gzip', True, GraphCSVCompression.GZip)]:
+        duration = time_write(bench_graph, use_batch, comp)
+        print(name + ': ' + str(round(duration, 3)) + 's, ' + str(round(nof_rows / duration)) + ' rows/s')
+    nof_cpus = multiprocessing.cpu_count()
+    with tempfile.TemporaryDirectory() as bench_dir:
+        start_time = time.perf_counter()
+        GraphCSVWriter.write_graph(bench_dir, bench_graph, nof_processes=nof_cpus)
+        duration = time.perf_counter() - start_time
+    print('parallel (' + str(nof_cpus) + ' processes): ' + str(round(duration, 3)) + 's, '
+          + str(round(nof_rows / duration)) + ' rows/s')
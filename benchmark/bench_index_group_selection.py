@@ -0,0 +1,56 @@
+"""Benchmark of group selection query latency with and without range indexes on table label and name/value.
+
+Requires a running Neo4J DBMS with APOC. The database "benchindex" is overwritten. Run with
+``python benchmark/bench_index_group_selection.py <bolt address> <user> <password> [nof_patients]``.
+"""
+import sys
+import time
+import random
+import pathlib
+ROOT_DIR = str(pathlib.Path(__file__).parents[1])
+sys.path.append(ROOT_DIR)
+from graphxplore.Basis import GraphDatabaseUtils, GraphOutputType
+from graphxplore.MetaDataHandling import MetaDataGenerator, DataType
+from graphxplore.GraphTranslation import GraphTranslator
+from graphxplore.DataMapping.Conditionals import (AndOperator, MetricOperator, MetricOperatorType, StringOperator,
+                                                  StringOperatorType)
+from graphxplore.GraphDataScience import GroupSelector
+
+DB_NAME = 'benchindex'
+
+def generate_data(nof_patients : int) -> dict:
+    rng = random.Random(42)
+    patients = []
+    labs = []
+    for patient_id in range(nof_patients):
+        patients.append({'patient_id': str(patient_id), 'age': str(rng.randint(18, 95)),
+                         'sex': rng.choice(['female', 'male']), 'smoker': rng.choice(['yes', 'no', 'unknown'])})
+        for lab_idx in range(3):
+            labs.append({'lab_id': str(3 * patient_id + lab_idx), 'patient_id': str(patient_id),
+                         'crp': str(round(rng.lognormvariate(1, 1), 1)),
+                         'lab_site': rng.choice(['north', 'south', 'east', 'west'])})
+    return {'patients': patients, 'labs': labs}
+
+def time_query(query : str, address : str, auth : tuple, repetitions : int = 10) -> float:
+    GraphDatabaseUtils.execute_query(query, DB_NAME, address, auth)
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        GraphDatabaseUtils.execute_query(query, DB_NAME, address, auth)
+    return (time.perf_counter() - start) / repetitions
+
+if __name__ == '__main__':
+    neo4j_address = sys.argv[1]
+    neo4j_auth = (sys.argv[2], sys.argv[3])
+    nof_bench_patients = int(sys.argv[4]) if len(sys.argv) > 4 else 20000
+    data = generate_data(nof_bench_patients)
+    meta = MetaDataGenerator(data).gather_meta_data()
+    GraphTranslator(meta).transform_to_graph(data, DB_NAME, GraphOutputType.Database, overwrite=True,
+                                             address=neo4j_address, auth=neo4j_auth)
+    group_filter = AndOperator([
+        MetricOperator('patients', 'age', 65, DataType.Integer, MetricOperatorType.Larger),
+        StringOperator('patients', 'smoker', 'yes', StringOperatorType.Equals)])
+    group_query = GroupSelector('patients', meta, group_filter).get_cypher_query()
+
+    print('without indexes: ' + str(round(1000 * time_query(group_query, neo4j_address, neo4j_auth), 1)) + 'ms')
+    GraphDatabaseUtils.create_indexes(DB_NAME, meta.get_table_names(), address=neo4j_address, auth=neo4j_auth)
+    print('with indexes: ' + str(round(1000 * time_query(group_query, neo4j_address, neo4j_auth), 1)) + 'ms')
@@ -0,0 +1,107 @@
+"""Benchmark of the throughput and peak memory of the pipeline stages on synthetic datasets of growing size.
+
+Datasets are generated with :mod:`synthetic_dataset` as CSV files. Each stage is timed once without memory tracing,
+and its peak of traced Python allocations is measured in a second run with :mod:`tracemalloc`. Stages:
+
+- metadata: :meth:`~graphxplore.MetaDataHandling.MetaDataGenerator.gather_meta_data`
+- translation: :meth:`~graphxplore.GraphTranslation.GraphTranslator.transform_to_graph` to CSV files
+- transformation: one-to-one copy with :class:`~graphxplore.DataMapping.DataTransformation`
+- cleaning: :meth:`~graphxplore.DataMapping.DataMappingUtils.copy_dataset` deleting artifacts
+
+Run with ``python benchmark/bench_pipeline.py [--json results.json] [nof_patients ...]``.
+"""
+import io
+import sys
+import json
+import time
+import argparse
+import tempfile
+import pathlib
+import tracemalloc
+import contextlib
+from typing import Callable, Dict, List
+ROOT_DIR = str(pathlib.Path(__file__).parents[1])
+sys.path.append(ROOT_DIR)
+from graphxplore.MetaDataHandling import MetaDataGenerator, MetaData
+from graphxplore.GraphTranslation import GraphTranslator
+from graphxplore.DataMapping import DataMappingUtils, DataTransformation, SourceDataType
+from synthetic_dataset import SyntheticDatasetGenerator, TableSpec, get_default_specs
+
+def gather_meta_data(csv_dir : str, specs : List[TableSpec]) -> MetaData:
+    meta = MetaDataGenerator(csv_dir).gather_meta_data()
+    # make sure the generated lattice is used, even if keys are inferred differently
+    for spec in specs:
+        if meta.get_primary_key(spec.name) != spec.get_primary_key():
+            meta.change_primary_key(spec.name, spec.get_primary_key())
+    for spec in specs:
+        for foreign_table in spec.foreign_tables:
+            foreign_key = meta.get_primary_key(foreign_table)
+            if meta.get_foreign_keys(spec.name).get(foreign_key) != foreign_table:
+                meta.add_foreign_key(spec.name, foreign_table, foreign_key)
+    return meta
+
+def get_stages(csv_dir : str, specs : List[TableSpec], meta : MetaData) -> Dict[str, Callable[[str], None]]:
+    def translate(out_dir : str) -> None:
+        GraphTranslator(meta).transform_to_graph(csv_dir, out_dir)
+
+    def transform(out_dir : str) -> None:
+        mapping = DataMappingUtils.get_copy_mapping(meta, MetaData(meta.get_table_names()))
+        DataTransformation(mapping).transform_to_target(SourceDataType.CSV, csv_dir, out_dir)
+
+    def clean(out_dir : str) -> None:
+        DataMappingUtils.copy_dataset(meta, csv_dir, out_dir, delete_artifacts=True)
+
+    return {'metadata' : lambda out_dir: gather_meta_data(csv_dir, specs), 'translation' : translate,
+            'transformation' : transform, 'cleaning' : clean}
+
+def run_stage(stage : Callable[[str], None], trace_memory : bool) -> float:
+    """Runs a stage with suppressed progress output
+
+    :param stage: The stage taking an output directory
+    :param trace_memory: If ``True``, the peak of traced allocations in bytes is returned instead of the duration
+    :return: Returns the duration in seconds or the peak memory in bytes
+    """
+    with tempfile.TemporaryDirectory() as out_dir, contextlib.redirect_stdout(io.StringIO()):
+        if trace_memory:
+            tracemalloc.start()
+            try:
+                stage(out_dir)
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        start = time.perf_counter()
+        stage(out_dir)
+        return time.perf_counter() - start
+
+def benchmark(nof_patients : int) -> List[dict]:
+    specs = get_default_specs(nof_patients)
+    generator = SyntheticDatasetGenerator(specs)
+    nof_rows = generator.get_total_row_count()
+    results = []
+    with tempfile.TemporaryDirectory() as csv_dir:
+        generator.write_csv(csv_dir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            meta = gather_meta_data(csv_dir, specs)
+        for name, stage in get_stages(csv_dir, specs, meta).items():
+            duration = run_stage(stage, False)
+            peak_memory = run_stage(stage, True)
+            results.append({'stage' : name, 'nof_patients' : nof_patients, 'nof_rows' : nof_rows,
+                            'seconds' : duration, 'rows_per_second' : nof_rows / duration,
+                            'peak_memory_mb' : peak_memory / 2 ** 20})
+            print(name + ' (' + str(nof_rows) + ' rows): ' + str(round(duration, 3)) + 's, '
+                  + str(round(nof_rows / duration)) + ' rows/s, peak ' + str(round(peak_memory / 2 ** 20, 1))
+                  + ' MB')
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the pipeline stages on synthetic datasets')
+    parser.add_argument('sizes', nargs='*', type=int, default=[1000, 10000, 100000],
+                        help='numbers of rows of the root table')
+    parser.add_argument('--json', help='file the results are written to as JSON')
+    args = parser.parse_args()
+    all_results = []
+    for size in args.sizes:
+        all_results += benchmark(size)
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            json.dump(all_results, f, indent=2)
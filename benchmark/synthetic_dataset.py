@@ -0,0 +1,188 @@
+"""Generator of synthetic relational datasets for benchmarks.
+
+A dataset is described by a list of :class:`TableSpec` objects forming a lattice of tables: Each table has an integer
+primary key named ``<table>_id`` and can reference previously specified tables. A foreign key column carries the name
+of the primary key of the referenced table. Row counts of referencing tables are derived from the fan-out, i.e. the
+average number of rows per row of the first referenced table. Columns have a data type, a cardinality and rates of
+missing values and artifacts. Generation is deterministic for a fixed seed and streams rows, such that datasets larger
+than memory can be written as CSV files.
+"""
+import os
+import csv
+import random
+import pathlib
+import sys
+from dataclasses import dataclass, field
+from typing import List, Dict, Iterator, Optional
+ROOT_DIR = str(pathlib.Path(__file__).parents[1])
+sys.path.append(ROOT_DIR)
+from graphxplore.MetaDataHandling import DataType
+
+@dataclass
+class ColumnSpec:
+    """Specification of a non-key column.
+
+    :param name: The column name
+    :param data_type: The data type of the valid values
+    :param cardinality: The number of distinct valid values. Values are (almost) unique, if ``None`` is specified,
+        defaults to None
+    :param missing_rate: The share of empty cells, defaults to 0
+    :param artifact_rate: The share of artifacts, i.e. strings like "invalid" in integer and decimal columns and rare
+        typos in string columns, defaults to 0
+    """
+    name : str
+    data_type : DataType
+    cardinality : Optional[int] = None
+    missing_rate : float = 0.0
+    artifact_rate : float = 0.0
+
+@dataclass
+class TableSpec:
+    """Specification of a table.
+
+    :param name: The table name
+    :param columns: The non-key columns
+    :param nof_rows: The number of rows. Must be specified for tables without foreign tables, defaults to None
+    :param foreign_tables: The referenced tables, which must be specified before this table, defaults to no tables
+    :param fan_out: The average number of rows per row of the first foreign table, used if ``nof_rows`` is ``None``,
+        defaults to 1
+    """
+    name : str
+    columns : List[ColumnSpec]
+    nof_rows : Optional[int] = None
+    foreign_tables : List[str] = field(default_factory=list)
+    fan_out : float = 1.0
+
+    def get_primary_key(self) -> str:
+        return self.name + '_id'
+
+class SyntheticDatasetGenerator:
+    """Generates the rows of all tables of a lattice of :class:`TableSpec` objects.
+
+    :param tables: The table specifications, referenced tables first
+    :param seed: The random seed, defaults to 42
+    """
+    def __init__(self, tables : List[TableSpec], seed : int = 42):
+        self.tables = tables
+        self.seed = seed
+        self.row_counts = {}
+        primary_keys = set()
+        for table in tables:
+            if table.name in self.row_counts:
+                raise AttributeError('Table "' + table.name + '" is specified multiple times')
+            for foreign_table in table.foreign_tables:
+                if foreign_table not in self.row_counts:
+                    raise AttributeError('Foreign table "' + foreign_table + '" of table "' + table.name
+                                         + '" must be specified before it')
+            if table.nof_rows is not None:
+                self.row_counts[table.name] = table.nof_rows
+            elif len(table.foreign_tables) > 0:
+                self.row_counts[table.name] = max(round(table.fan_out * self.row_counts[table.foreign_tables[0]]), 1)
+            else:
+                raise AttributeError('Number of rows of table "' + table.name + '" without foreign tables must be '
+                                     'specified')
+            for column in table.columns:
+                if column.name in primary_keys or column.name == table.get_primary_key():
+                    raise AttributeError('Column "' + column.name + '" of table "' + table.name
+                                         + '" collides with a primary key')
+            primary_keys.add(table.get_primary_key())
+
+    def get_total_row_count(self) -> int:
+        return sum(self.row_counts.values())
+
+    def get_header(self, table : TableSpec) -> List[str]:
+        return ([table.get_primary_key()] + [self.__get_table(foreign).get_primary_key()
+                                             for foreign in table.foreign_tables]
+                + [column.name for column in table.columns])
+
+    def generate_rows(self, table : TableSpec) -> Iterator[List[str]]:
+        """Generates the rows of a table in header order
+
+        :param table: The table specification
+        :return: Returns an iterator over the rows
+        """
+        rng = random.Random(str(self.seed) + '_' + table.name)
+        foreign_counts = [self.row_counts[foreign] for foreign in table.foreign_tables]
+        for row_idx in range(self.row_counts[table.name]):
+            row = [str(row_idx)]
+            for foreign_count in foreign_counts:
+                row.append(str(rng.randrange(foreign_count)))
+            for column in table.columns:
+                row.append(SyntheticDatasetGenerator.__generate_value(column, rng))
+            yield row
+
+    def generate(self) -> Dict[str, List[Dict[str, str]]]:
+        """Generates the whole dataset in memory
+
+        :return: Returns a dictionary of table name and list of row dicts
+        """
+        result = {}
+        for table in self.tables:
+            header = self.get_header(table)
+            result[table.name] = [dict(zip(header, row)) for row in self.generate_rows(table)]
+        return result
+
+    def write_csv(self, directory : str) -> None:
+        """Writes all tables as CSV files to a directory
+
+        :param directory: The existing target directory
+        """
+        if not os.path.isdir(directory):
+            raise AttributeError('"' + directory + '" is not a valid directory')
+        for table in self.tables:
+            with open(os.path.join(directory, table.name + '.csv'), 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow(self.get_header(table))
+                writer.writerows(self.generate_rows(table))
+
+    def __get_table(self, name : str) -> TableSpec:
+        for table in self.tables:
+            if table.name == name:
+                return table
+        raise AttributeError('Table "' + name + '" not specified')
+
+    @staticmethod
+    def __generate_value(column : ColumnSpec, rng : random.Random) -> str:
+        draw = rng.random()
+        if draw < column.missing_rate:
+            return ''
+        if draw < column.missing_rate + column.artifact_rate:
+            if column.data_type == DataType.String:
+                return 'typo_' + str(rng.randrange(1000000))
+            return rng.choice(['invalid', 'error', '?'])
+        if column.cardinality is not None:
+            idx = rng.randrange(column.cardinality)
+            if column.data_type == DataType.Integer:
+                return str(idx)
+            if column.data_type == DataType.Decimal:
+                return str(idx / 4)
+            return column.name + '_' + str(idx)
+        if column.data_type == DataType.Integer:
+            return str(int(rng.gauss(1000, 150)))
+        if column.data_type == DataType.Decimal:
+            return str(round(rng.gauss(50, 10), 3))
+        return column.name + '_' + str(rng.getrandbits(48))
+
+def get_default_specs(nof_patients : int) -> List[TableSpec]:
+    """Get a clinical-style lattice of patients with visits, lab values per visit and medications
+
+    :param nof_patients: The number of rows of the root table
+    :return: Returns the table specifications
+    """
+    return [
+        TableSpec('patient', [ColumnSpec('sex', DataType.String, 3, missing_rate=0.01),
+                              ColumnSpec('age', DataType.Integer, 80, missing_rate=0.02, artifact_rate=0.001),
+                              ColumnSpec('weight', DataType.Decimal, missing_rate=0.05, artifact_rate=0.001),
+                              ColumnSpec('note', DataType.String, missing_rate=0.5)],
+                  nof_rows=nof_patients),
+        TableSpec('visit', [ColumnSpec('ward', DataType.String, 12, missing_rate=0.01, artifact_rate=0.001),
+                            ColumnSpec('duration', DataType.Integer, missing_rate=0.02)],
+                  foreign_tables=['patient'], fan_out=3),
+        TableSpec('lab', [ColumnSpec('crp', DataType.Decimal, missing_rate=0.1, artifact_rate=0.002),
+                          ColumnSpec('leukocytes', DataType.Decimal, missing_rate=0.1),
+                          ColumnSpec('flag', DataType.String, 4, missing_rate=0.2)],
+                  foreign_tables=['visit'], fan_out=2),
+        TableSpec('medication', [ColumnSpec('substance', DataType.String, 50, artifact_rate=0.001),
+                                 ColumnSpec('dose', DataType.Integer, 10, missing_rate=0.05)],
+                  foreign_tables=['patient'], fan_out=1.5)
+    ]
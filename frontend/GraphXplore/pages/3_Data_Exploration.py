@@ -49,7 +49,8 @@ def refresh_existing_databases() -> List[str]:
     curr_address = VariableHandle(NEO4J_ADDRESS_KEY).get_attr()
     current_auth = VariableHandle(NEO4J_AUTH_KEY).get_attr()
     dbs_handle = VariableHandle(EXISTING_DATABASES_KEY)
-    dbs_handle.set_attr(GraphDatabaseUtils.get_existing_databases(curr_address, current_auth))
+    descriptions = GraphDatabaseUtils.describe_databases(curr_address, current_auth, refresh=True)
+    dbs_handle.set_attr(list(descriptions.keys()))
     assign_neo4j_browser_styling()
     return dbs_handle.get_attr()
 
@@ -106,9 +107,12 @@ def select_db(parent_obj, db_name_key: str, databases: List[str], db_name_select
     else:
         try:
             if not write:
+                descriptions = GraphDatabaseUtils.describe_databases(current_address, current_auth)
+                if db_name_select not in descriptions:
+                    raise AttributeError('Database "' + db_name_select + '" not found in Neo4J DBMS')
+                description = descriptions[db_name_select]
                 if graph_type is not None:
-                    if graph_type != GraphDatabaseUtils.check_graph_type_of_db(
-                            db_name_select, current_address, current_auth):
+                    if graph_type != description.graph_type:
                         raise AttributeError('Graph type of database "' + db_name_select + '" is not '
                                              + graph_type)
                 # if DATABASE_READ_EDGE_THRESHOLD < GraphDatabaseUtils.get_nof_edges_in_database(
@@ -117,8 +121,7 @@ def select_db(parent_obj, db_name_key: str, databases: List[str], db_name_select
                 #                          + '" is too large for exploration in frontend. Please refer to '
                 #                            'the python package "graphxplore" for handling of large datasets')
                 if meta_to_check is not None:
-                    if not GraphDatabaseUtils.database_contains_labels(
-                            db_name_select, meta_to_check.get_table_names(), current_address, current_auth):
+                    if not description.contains_labels(meta_to_check.get_table_names()):
                         raise AttributeError('Database does not match the assigned metadata')
             VariableHandle(db_name_key).set_attr(db_name_select)
             parent_obj.success('Database "' + db_name_select + '" successfully selected')
@@ -161,8 +164,8 @@ def assign_metadata(parent_obj, db_name_key: str, meta_key: str, lattice_key: st
     curr_main_meta = VariableHandle(MAIN_META_KEY).get_attr()
     current_address = VariableHandle(NEO4J_ADDRESS_KEY).get_attr()
     current_auth = VariableHandle(NEO4J_AUTH_KEY).get_attr()
-    if not GraphDatabaseUtils.database_contains_labels(
-            db_name, curr_main_meta.get_table_names(), current_address, current_auth):
+    descriptions = GraphDatabaseUtils.describe_databases(current_address, current_auth)
+    if db_name not in descriptions or not descriptions[db_name].contains_labels(curr_main_meta.get_table_names()):
         parent_obj.error('Metadata does not match base graph')
     else:
         VariableHandle(meta_key).set_attr(copy.deepcopy(curr_main_meta))
@@ -6,6 +6,7 @@ import zipfile
 import chardet
 from typing import Optional, List, Any, Dict
 from graphxplore.MetaDataHandling import MetaData
+from graphxplore.Basis import LazyCSVTable
 
 class CSVUploader:
     def __init__(self, table_data_store_location: str, upload_text: str, upload_help: Optional[str]= None,
@@ -45,6 +46,11 @@ class CSVUploader:
                                 enc = 'utf-8-sig'
                         else:
                             enc = file_enc
+                        # keep only the raw bytes and an index of row offsets in the session
+                        if LazyCSVTable.supports_encoding(enc):
+                            loaded_data[table_name] = LazyCSVTable(raw_bytes, enc,
+                                                                   None if delimiter == 'auto' else delimiter)
+                            continue
                         csv_str = raw_bytes.decode(enc)
                         str_file = StringIO(csv_str)
                         if delimiter == 'auto':
@@ -1,7 +1,16 @@
 from .graph_classes import Graph, GraphType
-from .graph_io_handlers import (GraphCSVIODevice, GraphCSVReader, GraphCSVWriter, GraphDatabaseWriter, GraphOutputType,
-                                GraphDatabaseUtils, RelationalDataIODevice)
-from .utils import BaseUtils
+from .graph_io_handlers import (GraphCSVIODevice, GraphCSVCompression, GraphCSVReader, GraphCSVWriter,
+                                GraphDatabaseWriter, GraphOutputType, GraphDatabaseUtils, DatabaseDescription,
+                                RelationalDataIODevice)
+from .utils import BaseUtils, CSVFileFormat, CSVFormatCache, LazyCSVTable
+from .value_distribution import ValueDistribution
+from .table_sources import (TableSource, TableSourceWriter, SQLiteTableSource, SQLiteTableWriter, ArrowTableSource,
+                            ArrowTableWriter, ParquetTableSource)
+from .columnar_table import StringPool, ColumnarTable, ColumnarDataset, ColumnarTableWriter
 
-__all__ = ['Graph', 'GraphType', 'GraphCSVIODevice', 'GraphCSVReader', 'GraphCSVWriter', 'GraphDatabaseWriter',
-           'BaseUtils', 'GraphOutputType', 'GraphDatabaseUtils', 'RelationalDataIODevice']
+__all__ = ['Graph', 'GraphType', 'GraphCSVIODevice', 'GraphCSVCompression', 'GraphCSVReader', 'GraphCSVWriter',
+           'GraphDatabaseWriter', 'BaseUtils', 'GraphOutputType', 'GraphDatabaseUtils', 'DatabaseDescription',
+           'RelationalDataIODevice', 'CSVFileFormat', 'CSVFormatCache', 'LazyCSVTable', 'TableSource',
+           'TableSourceWriter', 'SQLiteTableSource', 'SQLiteTableWriter', 'ArrowTableSource', 'ArrowTableWriter',
+           'ParquetTableSource', 'StringPool', 'ColumnarTable', 'ColumnarDataset', 'ColumnarTableWriter',
+           'ValueDistribution']
@@ -0,0 +1,238 @@
+from array import array
+from typing import Dict, List, Optional, Sequence, Iterator, Union, Iterable
+from .table_sources import TableSource, TableSourceWriter
+from .graph_io_handlers import RelationalDataIODevice
+
+class StringPool:
+    """This class interns strings and assigns each distinct string an integer code. The pool is shared by all
+    columns of a :class:`ColumnarDataset`, such that each distinct value is only stored once. The empty string has
+    the code 0.
+    """
+    def __init__(self):
+        """Constructor method
+        """
+        self.strings = ['']
+        self.codes = {'' : 0}
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def encode(self, value : Optional[str]) -> int:
+        """Get the code of a string and add it to the pool, if it is not contained yet
+
+        :param value: The string. ``None`` is stored as empty string
+        :return: Returns the code
+        """
+        if value is None:
+            return 0
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.strings)
+            self.strings.append(value)
+            self.codes[value] = code
+        return code
+
+    def decode(self, code : int) -> str:
+        """Get the string of a code
+
+        :param code: The code
+        :return: Returns the string
+        """
+        return self.strings[code]
+
+class ColumnarTable:
+    """This class stores a relational table column by column. Each column is a dictionary-encoded array of unsigned
+    integer codes that reference strings in a :class:`StringPool`. Rows are read as dicts of variable name and string
+    value, as in a CSV file
+
+    :param header: The column names of the table
+    :param string_pool: The pool of interned strings. Is created, if ``None`` is specified, defaults to None
+    """
+    def __init__(self, header : Iterable[str], string_pool : Optional[StringPool] = None):
+        """Constructor method
+        """
+        self.header = list(header)
+        if len(set(self.header)) != len(self.header):
+            raise AttributeError('Column names of columnar table must be unique')
+        self.string_pool = string_pool if string_pool is not None else StringPool()
+        self.columns = {column : array('I') for column in self.header}
+        self.nof_rows = 0
+
+    def __len__(self) -> int:
+        return self.nof_rows
+
+    def __getitem__(self, idx : int) -> Dict[str, str]:
+        if idx < 0:
+            idx += self.nof_rows
+        if idx < 0 or idx >= self.nof_rows:
+            raise IndexError('Row index out of range')
+        strings = self.string_pool.strings
+        return {column : strings[codes[idx]] for column, codes in self.columns.items()}
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        return self.iterate_rows()
+
+    def append_row(self, row : Dict[str, Union[str, int, float, None]]):
+        """Append a single row. Values are cast to string, ``None`` is stored as empty string
+
+        :param row: The data row as a dict of variable name and value
+        """
+        encode = self.string_pool.encode
+        for column in self.header:
+            if column not in row:
+                raise AttributeError('There is not value for key "' + column + '" in input data')
+        for column, codes in self.columns.items():
+            value = row[column]
+            codes.append(encode(value if value is None or isinstance(value, str) else str(value)))
+        self.nof_rows += 1
+
+    def get_column_values(self, column : str) -> List[str]:
+        """Get all values of a column
+
+        :param column: The column name
+        :return: Returns the decoded values as list of strings
+        """
+        if column not in self.columns:
+            raise AttributeError('Column "' + column + '" does not exist in columnar table')
+        return [self.string_pool.strings[code] for code in self.columns[column]]
+
+    def iterate_rows(self, columns : Optional[Sequence[str]] = None,
+                     batch_size : int = 10000) -> Iterator[Dict[str, str]]:
+        """Iterate over the rows of the table. Values are decoded column-wise in batches
+
+        :param columns: The columns to retrieve. All columns are retrieved if ``None`` is specified, defaults to None
+        :param batch_size: The number of rows decoded per batch, defaults to 10000
+        :return: Returns an iterator over the table rows as dicts of column name and string value
+        """
+        columns = list(self.header) if columns is None else list(columns)
+        for column in columns:
+            if column not in self.columns:
+                raise AttributeError('Column "' + column + '" does not exist in columnar table')
+        return self.__iterate_batches(columns, batch_size)
+
+    def __iterate_batches(self, columns : List[str], batch_size : int) -> Iterator[Dict[str, str]]:
+        strings = self.string_pool.strings
+        selected = [self.columns[column] for column in columns]
+        for start in range(0, self.nof_rows, batch_size):
+            decoded = [[strings[code] for code in codes[start:start + batch_size]] for codes in selected]
+            if len(decoded) == 0:
+                for _ in range(start, min(start + batch_size, self.nof_rows)):
+                    yield {}
+                continue
+            for values in zip(*decoded):
+                yield dict(zip(columns, values))
+
+    def get_memory_size(self) -> int:
+        """Get the number of bytes used by the code arrays of the table, excluding the shared string pool
+
+        :return: Returns the number of bytes
+        """
+        return sum(codes.itemsize * len(codes) for codes in self.columns.values())
+
+    @staticmethod
+    def from_rows(rows : Iterable[Dict[str, Union[str, int, float, None]]], header : Optional[List[str]] = None,
+                  string_pool : Optional[StringPool] = None) -> 'ColumnarTable':
+        """Create a columnar table from row dicts
+
+        :param rows: The rows as dicts of variable name and value
+        :param header: The column names. Taken from the keys of the first row if ``None`` is specified, defaults to
+            None
+        :param string_pool: The pool of interned strings. Is created, if ``None`` is specified, defaults to None
+        :return: Returns the columnar table
+        """
+        row_iter = iter(rows)
+        first_row = next(row_iter, None)
+        if header is None:
+            if first_row is None:
+                raise AttributeError('Header must be specified for empty tables')
+            header = list(first_row.keys())
+        table = ColumnarTable(header, string_pool)
+        if first_row is not None:
+            table.append_row(first_row)
+            for row in row_iter:
+                table.append_row(row)
+        return table
+
+class ColumnarDataset(TableSource):
+    """This class is a compact in-memory store of relational tables as :class:`ColumnarTable` with one shared
+    :class:`StringPool`. It can be used wherever a data dictionary of table name and list of row dicts is accepted,
+    since :class:`~graphxplore.Basis.RelationalDataIODevice` reads from and writes to it natively. Each distinct value
+    is only stored once and each table cell only takes four bytes.
+
+    :param tables: A dictionary of table name and list of row dicts to convert, defaults to None
+    """
+    def __init__(self, tables : Optional[Dict[str, Iterable[Dict[str, str]]]] = None):
+        """Constructor method
+        """
+        self.string_pool = StringPool()
+        self.tables = {}
+        if tables is not None:
+            for table, rows in tables.items():
+                self.tables[table] = ColumnarTable.from_rows(rows, string_pool=self.string_pool)
+
+    def __getitem__(self, table : str) -> ColumnarTable:
+        if table not in self.tables:
+            raise AttributeError('Table "' + table + '" does not exist in columnar dataset')
+        return self.tables[table]
+
+    def __contains__(self, table : str) -> bool:
+        return table in self.tables
+
+    def __len__(self) -> int:
+        return len(self.tables)
+
+    def get_table_names(self) -> List[str]:
+        return sorted(self.tables.keys())
+
+    def get_header(self, table : str) -> List[str]:
+        return list(self[table].header)
+
+    def read_rows(self, table : str, columns : Optional[Sequence[str]] = None) -> Iterator[Dict[str, str]]:
+        return self[table].iterate_rows(self.check_columns(table, columns))
+
+    def open_writer(self, table : str, header : List[str]) -> TableSourceWriter:
+        return ColumnarTableWriter(self, table, header)
+
+    def to_dict(self) -> Dict[str, List[Dict[str, str]]]:
+        """Convert the dataset to a dictionary of table name and list of row dicts
+
+        :return: Returns the data dictionary
+        """
+        return {table : list(columnar_table) for table, columnar_table in self.tables.items()}
+
+    @staticmethod
+    def from_data_location(data_location : Union[str, Dict[str, List[Dict[str, str]]], TableSource],
+                           file_encoding : Optional[str] = None) -> 'ColumnarDataset':
+        """Read all tables of a CSV directory, data dictionary or table source into a columnar dataset
+
+        :param data_location: A directory path, a dictionary of table name and list of row dicts, or a table source
+        :param file_encoding: The file encoding of the CSV files, detected if ``None`` is specified, defaults to None
+        :return: Returns the columnar dataset
+        """
+        dataset = ColumnarDataset()
+        for table in RelationalDataIODevice.get_available_table_names(data_location):
+            print('Loading data from table "' + table + '"')
+            with RelationalDataIODevice(data_location, table, file_encoding=file_encoding) as reader:
+                dataset.tables[table] = ColumnarTable.from_rows(reader, reader.get_header(), dataset.string_pool)
+        return dataset
+
+class ColumnarTableWriter(TableSourceWriter):
+    """This class writes rows into a new :class:`ColumnarTable` of a :class:`ColumnarDataset`. An existing table with
+    the same name is replaced
+
+    :param dataset: The columnar dataset
+    :param table: The name of the table
+    :param header: The column names of the table
+    """
+    def __init__(self, dataset : ColumnarDataset, table : str, header : List[str]):
+        """Constructor method
+        """
+        super().__init__(table, header)
+        self.columnar_table = ColumnarTable(header, dataset.string_pool)
+        dataset.tables[table] = self.columnar_table
+
+    def writerow(self, row : Dict[str, Union[str, int, float, None]]):
+        self.columnar_table.append_row(row)
+
+    def close(self):
+        pass
@@ -7,6 +7,11 @@ import math
 import contextlib
 import re
 import base64
+import gzip
+import io
+import time
+import concurrent.futures
+import operator
 try:
     import pyodide.http
     import pyodide.webloop
@@ -15,12 +20,18 @@ try:
     # from streamlit.web.server.server import Server
     # import base64
     USE_PYODIDE = True
+    HTTPRequestError = pyodide.ffi.JsException
 except (ModuleNotFoundError, ImportError):
     from neo4j import GraphDatabase, exceptions
+    import urllib.request
+    import urllib.error
     USE_PYODIDE = False
-from typing import Union, Tuple, List, Iterable, Dict, Any, Optional
+    HTTPRequestError = OSError
+from typing import Union, Tuple, List, Iterable, Dict, Any, Optional, FrozenSet
 from enum import Enum
-from .utils import BaseUtils
+from dataclasses import dataclass
+from .utils import BaseUtils, CSVFormatCache
+from .table_sources import TableSource
 from .graph_classes import Graph, GraphType
 from .BaseGraph.base_classes import BaseNode, BaseEdge, NodeDataType, BaseGraph, BaseNodeType
 from .AttributeAssociationGraph.attribute_association_graph_classes import (AttributeAssociationGraph, FrequencyLabel,
@@ -33,33 +44,72 @@ class GraphOutputType(str, Enum):
     CSV = 'CSV'
     Database = 'Database'
 
+class GraphCSVCompression(str, Enum):
+    """The compression applied to the CSV files of a graph
+    """
+    GZip = 'gzip'
+    ZStandard = 'zstd'
+
 class GraphCSVIODevice:
     """This is a parent class for reading and writing CSV files containing generated :class:`Graph` objects.
 
     :param graph_dir: The directory to which the graph is written or from which it is read
     :param graph_type: The type of :class:`Graph`.
+    :param compression: The compression of the CSV files. The files are not compressed, if ``None``
     """
-    def __init__(self, graph_dir : str, graph_type : GraphType):
+    def __init__(self, graph_dir : str, graph_type : GraphType, compression : Optional[GraphCSVCompression] = None):
         """Constructor method
         """
         self.graph_dir = graph_dir
         if not os.path.isdir(self.graph_dir):
             raise NotADirectoryError('Path "' + self.graph_dir + '" is not a valid directory')
         self.graph_type = graph_type
+        self.compression = compression
         self.file_paths = {'String' : 'Node_Table_String.csv', 'Integer' : 'Node_Table_Integer.csv',
                            'Decimal' : 'Node_Table_Decimal.csv', 'Bin' : 'Node_Table_Bin.csv',
                            'EdgeMain' : 'Relationship_Table_Main.csv'}
+        if self.compression == GraphCSVCompression.GZip:
+            self.file_paths = {file_type : path + '.gz' for file_type, path in self.file_paths.items()}
+        elif self.compression == GraphCSVCompression.ZStandard:
+            self.file_paths = {file_type : path + '.zst' for file_type, path in self.file_paths.items()}
+        elif self.compression is not None:
+            raise AttributeError('Compression "' + str(self.compression) + '" not recognized')
+
+    def _open_file(self, path : str, mode : str):
+        """Opens a (possibly compressed) CSV file of the graph in text mode.
+
+        :param path: The path to the file
+        :param mode: The mode, either 'r' or 'w'
+        :return: Returns the opened file object
+        """
+        if self.compression == GraphCSVCompression.GZip:
+            # the lowest compression level is several times faster than the default and the files are only slightly
+            # larger
+            return gzip.open(path, mode + 't', compresslevel=1)
+        if self.compression == GraphCSVCompression.ZStandard:
+            try:
+                from compression import zstd
+                return zstd.open(path, mode + 't')
+            except ImportError:
+                pass
+            try:
+                import zstandard
+            except ImportError:
+                raise AttributeError('Zstandard compression requires Python 3.14 or the package "zstandard"')
+            return zstandard.open(path, mode + 't')
+        return open(path, mode)
 
 class GraphCSVReader(GraphCSVIODevice):
     """This class reads :class:`Graph` objects from CSV files.
 
     :param graph_dir: The directory containing the CSV files that will be read
     :param graph_type: The type of :class:`Graph`.
+    :param compression: The compression of the CSV files. The files are not compressed, if ``None``
     """
-    def __init__(self, graph_dir : str, graph_type : GraphType):
+    def __init__(self, graph_dir : str, graph_type : GraphType, compression : Optional[GraphCSVCompression] = None):
         """Constructor method
         """
-        super().__init__(graph_dir, graph_type)
+        super().__init__(graph_dir, graph_type, compression)
         if self.graph_type == GraphType.Base:
             self.result = BaseGraph()
         elif self.graph_type == GraphType.AttributeAssociation:
@@ -77,7 +127,7 @@ class GraphCSVReader(GraphCSVIODevice):
                 full_path = os.path.join(self.graph_dir, path)
                 if not os.path.isfile(full_path):
                     raise FileNotFoundError('Path ' + full_path + ' to file not found')
-                file = stack.enter_context(open(full_path))
+                file = stack.enter_context(self._open_file(full_path, 'r'))
                 reader = csv.DictReader(file)
                 self.__process_reader(reader, 'Edge' not in file_type)
             return self.result
@@ -112,17 +162,18 @@ class GraphCSVWriter(GraphCSVIODevice):
 
     :param graph_dir: The directory the CSV files are written to
     :param graph_type: The type of :class:`Graph`.
+    :param compression: The compression of the CSV files. The files are not compressed, if ``None``
     """
-    def __init__(self, graph_dir : str, graph_type : GraphType):
+    def __init__(self, graph_dir : str, graph_type : GraphType, compression : Optional[GraphCSVCompression] = None):
         """Constructor method
         """
-        super().__init__(graph_dir, graph_type)
+        super().__init__(graph_dir, graph_type, compression)
         self.files = []
         self.writers = {'String' : None, 'Integer' : None, 'Decimal' : None, 'Bin' : None, 'EdgeMain' : None}
 
     def __enter__(self):
         for file_type, path in self.file_paths.items():
-            file = open(os.path.join(self.graph_dir, path), 'w').__enter__()
+            file = self._open_file(os.path.join(self.graph_dir, path), 'w').__enter__()
             self.files.append(file)
             writer = csv.writer(file)
             if self.graph_type == GraphType.Base:
@@ -157,13 +208,30 @@ class GraphCSVWriter(GraphCSVIODevice):
 
         writer.writerow(node.to_csv_row())
 
+    def write_nodes(self, nodes : Iterable[Union[BaseNode, AttributeAssociationNode]]) -> None:
+        """Writes multiple nodes to the CSV files based on their datatype. The nodes are grouped by datatype and each
+        group is written in a single batch.
+
+        :param nodes: The nodes to write
+        """
+        if self.writers['EdgeMain'] is None:
+            raise AttributeError('Writer not yet initialized')
+        nodes_per_type = {file_type : [] for file_type in self.writers if 'Edge' not in file_type}
+        for node in nodes:
+            if self.graph_type != node.graph_type:
+                raise AttributeError('type mismatch of writer (' + self.graph_type + ') and node (' + node.graph_type
+                                     + ')')
+            nodes_per_type[node.data_type].append(node)
+        for data_type, nodes_of_type in nodes_per_type.items():
+            self.writers[data_type].writerows(node.to_csv_row() for node in nodes_of_type)
+
     def write_edge(self, edge : Union[BaseEdge, AttributeAssociationEdge]) -> None:
         """Writes a single edge to a CSV file.
 
         :param edge: The edge to write
         """
         if self.graph_type != edge.graph_type:
-            raise AttributeError('type mismatch of writer (' + self.graph_type + ') and node (' + edge.graph_type + ')')
+            raise AttributeError('type mismatch of writer (' + self.graph_type + ') and edge (' + edge.graph_type + ')')
 
         writer = self.writers['EdgeMain']
         if writer is None:
@@ -171,21 +239,138 @@ class GraphCSVWriter(GraphCSVIODevice):
 
         writer.writerow(edge.to_csv_row())
 
+    def write_edges(self, edges : Iterable[Union[BaseEdge, AttributeAssociationEdge]]) -> None:
+        """Writes multiple edges to the CSV file in a single batch.
+
+        :param edges: The edges to write
+        """
+        writer = self.writers['EdgeMain']
+        if writer is None:
+            raise AttributeError('Writer not yet initialized')
+        graph_type = self.graph_type
+
+        def get_rows():
+            for edge in edges:
+                if graph_type != edge.graph_type:
+                    raise AttributeError('type mismatch of writer (' + graph_type + ') and edge (' + edge.graph_type
+                                         + ')')
+                yield edge.to_csv_row()
+
+        writer.writerows(get_rows())
+
     @staticmethod
-    def write_graph(graph_dir : str, graph : Graph) -> None:
-        """Writes a whole graph to a specified target directory in the form of CSV files.
+    def write_graph(graph_dir : str, graph : Graph, compression : Optional[GraphCSVCompression] = None,
+                    nof_processes : int = 1, chunk_size : int = 50000) -> None:
+        """Writes a whole graph to a specified target directory in the form of CSV files. With multiple processes, the
+        nodes and edges are split into chunks which are converted to CSV text in a process pool and concatenated in
+        their original order. The written files are identical to those written by a single process.
 
         :param graph_dir: The directory the CSV files are written to
         :param graph: The graph that will be written
+        :param compression: The compression of the CSV files. The files are not compressed, if ``None``
+        :param nof_processes: The number of processes used for converting nodes and edges to CSV text
+        :param chunk_size: The number of nodes or edges converted per task, if multiple processes are used
         """
-        with GraphCSVWriter(graph_dir, graph.type) as writer:
-            for node in graph.nodes:
-                writer.write_node(node)
+        if nof_processes < 1:
+            raise AttributeError('Number of processes must be at least 1')
+        if chunk_size < 1:
+            raise AttributeError('Chunk size must be at least 1')
+        with GraphCSVWriter(graph_dir, graph.type, compression) as writer:
+            if nof_processes == 1:
+                writer.write_nodes(graph.nodes)
+                writer.write_edges(graph.edges)
+            else:
+                writer.__write_graph_parallel(graph, nof_processes, chunk_size)
 
-            for edge in graph.edges:
-                writer.write_edge(edge)
+    def __write_graph_parallel(self, graph : Graph, nof_processes : int, chunk_size : int) -> None:
+        """Converts the nodes and edges of a graph to CSV text in a process pool and writes the results in order.
+
+        :param graph: The graph that will be written
+        :param nof_processes: The number of processes
+        :param chunk_size: The number of nodes or edges converted per task
+        """
+        objects_per_file = {file_type : [] for file_type in self.writers if 'Edge' not in file_type}
+        for node in graph.nodes:
+            if self.graph_type != node.graph_type:
+                raise AttributeError('type mismatch of writer (' + self.graph_type + ') and node (' + node.graph_type
+                                     + ')')
+            objects_per_file[node.data_type].append(node)
+        for edge in graph.edges:
+            if self.graph_type != edge.graph_type:
+                raise AttributeError('type mismatch of writer (' + self.graph_type + ') and edge (' + edge.graph_type
+                                     + ')')
+        objects_per_file['EdgeMain'] = graph.edges
+
+        tasks = []
+        for file_type, objects in objects_per_file.items():
+            for start in range(0, len(objects), chunk_size):
+                tasks.append((file_type, start, min(start + chunk_size, len(objects))))
+        files = dict(zip(self.file_paths, self.files))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=nof_processes,
+                                                    initializer=_init_csv_conversion_worker,
+                                                    initargs=(objects_per_file,)) as executor:
+            for (file_type, start, end), csv_text in zip(tasks, executor.map(_convert_chunk_to_csv, tasks)):
+                files[file_type].write(csv_text)
+
+_csv_conversion_objects = {}
+
+def _init_csv_conversion_worker(objects_per_file : Dict[str, List[Union[BaseNode, BaseEdge]]]) -> None:
+    """Stores the nodes and edges to convert in a worker process of the parallel CSV export.
+
+    :param objects_per_file: The nodes and edges per CSV file type
+    """
+    global _csv_conversion_objects
+    _csv_conversion_objects = objects_per_file
+
+def _convert_chunk_to_csv(task : Tuple[str, int, int]) -> str:
+    """Converts a chunk of nodes or edges to CSV text in a worker process of the parallel CSV export.
+
+    :param task: The CSV file type, and start and end index of the chunk
+    :return: Returns the CSV text
+    """
+    file_type, start, end = task
+    output = io.StringIO()
+    csv.writer(output).writerows(obj.to_csv_row() for obj in _csv_conversion_objects[file_type][start:end])
+    return output.getvalue()
+
+@dataclass
+class DatabaseDescription:
+    """Summary of the content of a Neo4J database as retrieved by :meth:`GraphDatabaseUtils.describe_databases`.
+
+    :param name: The name of the database
+    :param graph_type: The type of graph stored in the database, or ``None`` if it was not recognized
+    :param labels: All node labels found in the database
+    :param nof_nodes: The number of nodes in the database
+    :param nof_edges: The number of edges in the database
+    :param indexes: The online indexes of the database as dictionary of node label and indexed properties
+    """
+    name : str
+    graph_type : Optional[GraphType]
+    labels : FrozenSet[str]
+    nof_nodes : int
+    nof_edges : int
+    indexes : Dict[str, List[Tuple[str, ...]]]
+
+    def contains_labels(self, labels : Iterable[str]) -> bool:
+        """Checks if the nodes of the database contain all labels specified in ``labels``
+
+        :param labels: The labels that should be contained
+        :return: Returns True, if all labels are contained
+        """
+        return all(label in self.labels for label in labels)
+
+    def has_index(self, label : str, properties : Tuple[str, ...]) -> bool:
+        """Checks if the database has an online index on ``properties`` of nodes with label ``label``
+
+        :param label: The node label
+        :param properties: The indexed properties
+        :return: Returns True, if the index exists
+        """
+        return tuple(properties) in self.indexes.get(label, [])
 
 class GraphDatabaseUtils:
+    _description_cache = {}
+
     @staticmethod
     def get_neo4j_address(host: str = 'localhost', port: int = 7687, protocol : str = 'bolt') -> str:
         """Generates the address of a Neo4J DBMS with the given host, port and protocol.
@@ -217,10 +402,12 @@ class GraphDatabaseUtils:
         })
 
     @staticmethod
-    def _run_pyodide_neo4j_http_request(request_body: str, database: str, address: str = get_neo4j_address(),
-                                        auth: Tuple[str, str] = ("neo4j", ""), transaction_id : Optional[int] = None,
-                                        commit : bool = True) -> Tuple[bool, Dict[str, Any]]:
-        """Send a Neo4J Cypher query as HTTP POST request, when the desktop version of graphxplore is used
+    def _run_neo4j_http_request(request_body: str, database: str, address: str = get_neo4j_address(),
+                                auth: Tuple[str, str] = ("neo4j", ""), transaction_id : Optional[int] = None,
+                                commit : bool = True) -> Tuple[bool, Dict[str, Any]]:
+        """Send a Neo4J Cypher query as HTTP POST request. The desktop version of graphxplore uses the browser's
+        XMLHttpRequest, otherwise the request is sent with :mod:`urllib`. Raises an exception, if the Neo4J DBMS could
+        not be reached
 
         :param request_body: The body of the POST request
         :param database: The database the Cypher query should be sent to
@@ -237,14 +424,25 @@ class GraphDatabaseUtils:
             'Content-Type': 'application/json',
             'Authorization': 'Basic ' + base64.b64encode(':'.join(auth).encode('utf8')).decode('ascii')
         }
-        req = XMLHttpRequest.new()
-        req.open("POST", query_address, False)
-        for header, value in headers.items():
-            req.setRequestHeader(header, value)
-        blob = Blob.new([request_body], {type: 'application/json'})
-        req.send(blob)
-        return_data = json.loads(req.response)
-        return (200 <= req.status <= 299), return_data
+        if USE_PYODIDE:
+            req = XMLHttpRequest.new()
+            req.open("POST", query_address, False)
+            for header, value in headers.items():
+                req.setRequestHeader(header, value)
+            blob = Blob.new([request_body], {type: 'application/json'})
+            req.send(blob)
+            return_data = json.loads(req.response)
+            return (200 <= req.status <= 299), return_data
+        req = urllib.request.Request(query_address, data=request_body.encode('utf8'), headers=headers, method='POST')
+        try:
+            with urllib.request.urlopen(req) as response:
+                return (200 <= response.status <= 299), json.loads(response.read())
+        except urllib.error.HTTPError as error:
+            try:
+                return_data = json.loads(error.read())
+            except ValueError:
+                return_data = {'errors': [{'message': str(error)}]}
+            return False, return_data
 
     @staticmethod
     def test_connection(address: str = get_neo4j_address(), auth : Tuple[str, str] = ("neo4j", "")) -> None:
@@ -258,8 +456,8 @@ class GraphDatabaseUtils:
             try:
                 query = 'CALL db.ping()'
                 request_body = GraphDatabaseUtils._get_neo4j_http_request_body([query])
-                ok, data = GraphDatabaseUtils._run_pyodide_neo4j_http_request(request_body, 'system', address, auth)
-            except pyodide.ffi.JsException:
+                ok, data = GraphDatabaseUtils._run_neo4j_http_request(request_body, 'system', address, auth)
+            except HTTPRequestError:
                 raise AttributeError('Could not connect to Neo4J DBMS under address "' + address + '"')
             if not ok:
                 raise AttributeError(
@@ -285,7 +483,7 @@ class GraphDatabaseUtils:
         if USE_PYODIDE:
             try:
                 request_body = GraphDatabaseUtils._get_neo4j_http_request_body([query])
-                ok, data = GraphDatabaseUtils._run_pyodide_neo4j_http_request(
+                ok, data = GraphDatabaseUtils._run_neo4j_http_request(
                     request_body, database, address, auth, commit=True)
 
                 if not ok or len(data['errors']) > 0:
@@ -296,7 +494,7 @@ class GraphDatabaseUtils:
                 for row in data['results'][0]['data']:
                     result.append(dict(zip(keys, row['row'])))
                 return result
-            except pyodide.ffi.JsException as error:
+            except HTTPRequestError as error:
                 raise AttributeError(
                     'Could not execute Cypher query, error was: ' + str(error))
         else:
@@ -324,6 +522,20 @@ class GraphDatabaseUtils:
                                                    auth=auth)
         return [record['name'] for record in records if record['name'] != 'system' and record['currentStatus'] == 'online']
 
+    @staticmethod
+    def _get_graph_type_from_labels(labels : Iterable[str]) -> Optional[GraphType]:
+        """Determines the :class:`GraphType` of a Neo4J database by its node labels.
+
+        :param labels: The node labels of the database
+        :return: Returns the type of graph, or ``None`` if it was not recognized
+        """
+        for label in labels:
+            if label == BaseNodeType.Key:
+                return GraphType.Base
+            if label in FrequencyLabel._value2member_map_:
+                return GraphType.AttributeAssociation
+        return None
+
     @staticmethod
     def check_graph_type_of_db(db_name: str, address: str = get_neo4j_address(),
                                auth: Tuple[str, str] = ("neo4j", "")) -> GraphType:
@@ -343,13 +555,10 @@ class GraphDatabaseUtils:
 
         records = GraphDatabaseUtils.execute_query(query='CALL db.labels()', database=db_name, address=address,
                                                    auth=auth)
-        for record in records:
-            label = record['label']
-            if label == BaseNodeType.Key:
-                return GraphType.Base
-            if label in FrequencyLabel._value2member_map_:
-                return GraphType.AttributeAssociation
-        raise AttributeError('Graph type of database "' + db_name + '" not recognized')
+        graph_type = GraphDatabaseUtils._get_graph_type_from_labels(record['label'] for record in records)
+        if graph_type is None:
+            raise AttributeError('Graph type of database "' + db_name + '" not recognized')
+        return graph_type
 
     @staticmethod
     def database_contains_labels(db_name: str, labels : Iterable[str], address: str = get_neo4j_address(),
@@ -393,6 +602,95 @@ class GraphDatabaseUtils:
                                                    auth=auth)
         return records[0]['count']
 
+    @staticmethod
+    def describe_databases(address: str = get_neo4j_address(), auth: Tuple[str, str] = ("neo4j", ""),
+                           max_age : float = 60, refresh : bool = False) -> Dict[str, DatabaseDescription]:
+        """Retrieves graph type, labels, number of nodes and edges, and indexes of all databases in a Neo4J DBMS
+        (except the "system" database) with a single query per database. The result is cached per address and
+        credentials for ``max_age`` seconds. Databases written by :class:`GraphDatabaseWriter` clear the cache. Raises
+        an exception if the connection could not be established
+
+        :param address: The address of the Neo4J DBMS
+        :param auth: username and password to access the Neo4j DBMS
+        :param max_age: The maximum age in seconds of cached descriptions
+        :param refresh: If ``True``, the cache is ignored and the databases are queried again
+        :return: Returns a dictionary of database name and its description
+        """
+        cache_key = (address, tuple(auth))
+        if not refresh and cache_key in GraphDatabaseUtils._description_cache:
+            timestamp, descriptions = GraphDatabaseUtils._description_cache[cache_key]
+            if time.monotonic() - timestamp <= max_age:
+                return dict(descriptions)
+
+        query = ('CALL db.labels() YIELD label WITH collect(label) AS labels '
+                 'CALL { MATCH (n) RETURN count(n) AS nof_nodes } '
+                 'CALL { MATCH ()-[r]->() RETURN count(r) AS nof_edges } '
+                 'CALL { CALL apoc.schema.nodes() YIELD label, properties, status '
+                 'RETURN collect(CASE WHEN status = "ONLINE" THEN [label, properties] END) AS indexes } '
+                 'RETURN labels, nof_nodes, nof_edges, indexes')
+        descriptions = {}
+        for db_name in GraphDatabaseUtils.get_existing_databases(address, auth):
+            record = GraphDatabaseUtils.execute_query(query=query, database=db_name, address=address, auth=auth)[0]
+            indexes = collections.defaultdict(list)
+            for index_label, properties in record['indexes']:
+                for label in (index_label if isinstance(index_label, list) else [index_label]):
+                    indexes[label].append(tuple(properties))
+            descriptions[db_name] = DatabaseDescription(
+                name=db_name, graph_type=GraphDatabaseUtils._get_graph_type_from_labels(record['labels']),
+                labels=frozenset(record['labels']), nof_nodes=record['nof_nodes'], nof_edges=record['nof_edges'],
+                indexes=dict(indexes))
+        GraphDatabaseUtils._description_cache[cache_key] = (time.monotonic(), descriptions)
+        return dict(descriptions)
+
+    @staticmethod
+    def clear_description_cache(address: Optional[str] = None) -> None:
+        """Removes cached database descriptions generated by :meth:`describe_databases`.
+
+        :param address: The address of the Neo4J DBMS for which the cache is cleared. If ``None``, the whole cache is
+            cleared
+        """
+        if address is None:
+            GraphDatabaseUtils._description_cache.clear()
+        else:
+            for key in [key for key in GraphDatabaseUtils._description_cache if key[0] == address]:
+                del GraphDatabaseUtils._description_cache[key]
+
+    @staticmethod
+    def create_indexes(db_name : str, labels : Iterable[str], properties : Iterable[str] = ('name', 'value'),
+                       address: str = get_neo4j_address(), auth: Tuple[str, str] = ("neo4j", ""),
+                       wait_seconds : int = 300) -> None:
+        """Creates a range index on each of ``properties`` for nodes with each of ``labels``, if it does not already
+        exist, and waits for all indexes of the database to come online. Cypher queries of group selection and dashboards
+        match nodes by table label and name, and profit from these indexes
+
+        :param db_name: The name of the database
+        :param labels: The node labels, typically the table labels of a base graph
+        :param properties: The node properties to index
+        :param address: The address of the Neo4J DBMS
+        :param auth: username and password to access the Neo4j DBMS
+        :param wait_seconds: The maximum number of seconds to wait for the indexes to come online
+        """
+        properties = list(properties)
+        for label in sorted(set(labels)):
+            for node_property in properties:
+                index_name = 'graphxplore_' + label + '_' + node_property
+                query = ('CREATE RANGE INDEX ' + GraphDatabaseUtils.__escape_name(index_name) + ' IF NOT EXISTS FOR (n:'
+                         + GraphDatabaseUtils.__escape_name(label) + ') ON (n.'
+                         + GraphDatabaseUtils.__escape_name(node_property) + ')')
+                GraphDatabaseUtils.execute_query(query=query, database=db_name, address=address, auth=auth)
+        GraphDatabaseUtils.execute_query(query='CALL db.awaitIndexes(' + str(wait_seconds) + ')', database=db_name,
+                                         address=address, auth=auth)
+        GraphDatabaseUtils.clear_description_cache(address)
+
+    @staticmethod
+    def __escape_name(name : str) -> str:
+        """Escapes a label, property or index name for usage in a Cypher query
+
+        :param name: The name to escape
+        :return: Returns the escaped name
+        """
+        return '`' + name.replace('`', '``') + '`'
+
     @staticmethod
     def get_node_write_cypher_statement(node : Union[BaseNode, AttributeAssociationNode], separate_params: bool = False,
                                         use_create: bool = True) -> Union[str, Tuple[str, Dict[str, Any]]]:
@@ -489,14 +787,23 @@ class GraphDatabaseWriter:
     :param overwrite: if `True`, database `db_name` will be overwritten if already exists
     :param address: The address of the Neo4J DBMS
     :param auth: username and password to access the Neo4j DBMS
+    :param max_request_size: The maximum size in bytes of the parameters sent in a single HTTP request. Only used by the
+        desktop version of graphxplore, which writes via HTTP
+    :param create_indexes: If ``True``, range indexes on the properties "name" and "value" are created for all table
+        labels of the written nodes, see :meth:`GraphDatabaseUtils.create_indexes`
+    :param index_wait_seconds: The maximum number of seconds to wait for the created indexes to come online
     """
     def __init__(self, graph_type : GraphType, db_name : str, overwrite : bool = False,
-                 address: str = GraphDatabaseUtils.get_neo4j_address(), auth : Tuple[str, str] = ("neo4j", "")):
+                 address: str = GraphDatabaseUtils.get_neo4j_address(), auth : Tuple[str, str] = ("neo4j", ""),
+                 max_request_size : int = 4000000, create_indexes : bool = False, index_wait_seconds : int = 300):
         self.graph_type = graph_type
         self.db_name = db_name
         self.address = address
         self.auth = auth
         self.overwrite = overwrite
+        self.max_request_size = max_request_size
+        self.create_indexes = create_indexes
+        self.index_wait_seconds = index_wait_seconds
         self.nodes_dict = {}
         self.edges = []
 
@@ -517,7 +824,7 @@ class GraphDatabaseWriter:
         :param edge: The edge to write
         """
         if self.graph_type != edge.graph_type:
-            raise AttributeError('type mismatch of writer (' + self.graph_type + ') and node (' + edge.graph_type + ')')
+            raise AttributeError('type mismatch of writer (' + self.graph_type + ') and edge (' + edge.graph_type + ')')
         self.edges.append(edge)
 
     def __enter__(self):
@@ -531,11 +838,102 @@ class GraphDatabaseWriter:
             print('Overwriting content of existing database "' + self.db_name + '"')
         GraphDatabaseUtils.execute_query(query='CREATE OR REPLACE DATABASE ' + self.db_name + ' WAIT 10 SECONDS',
                                          database='system', address=self.address, auth=self.auth)
+        GraphDatabaseUtils.clear_description_cache(self.address)
         return self
 
+    @staticmethod
+    def _get_batch_query(query : str) -> str:
+        """Converts a Cypher query with parameters into a query that is executed for each entry of the list parameter
+        "batch". The parameters of the original query are retrieved from the entries.
+
+        :param query: The Cypher query with parameters preceded by a $ character
+        :return: Returns the batch query
+        """
+        return 'WITH $batch AS batch UNWIND batch AS entry ' + query.replace('$', 'entry.')
+
+    @staticmethod
+    def _to_json_parameter(value : Any) -> Tuple[Any, bool]:
+        """Converts a Cypher parameter to a JSON serializable value. NaN and infinite floats are not valid JSON and are
+        converted to strings that Cypher's toFloat() parses back.
+
+        :param value: The parameter value
+        :return: Returns the converted value and if a non-finite float was converted
+        """
+        if isinstance(value, float) and not math.isfinite(value):
+            if math.isnan(value):
+                return 'NaN', True
+            return ('Infinity' if value > 0 else '-Infinity'), True
+        if isinstance(value, list):
+            converted = [GraphDatabaseWriter._to_json_parameter(entry) for entry in value]
+            return [entry[0] for entry in converted], any(entry[1] for entry in converted)
+        return value, False
+
+    def _get_http_request_chunks(self, query : str, param_batch : List[Dict[str, Any]]) -> Iterable[Tuple[str, int]]:
+        """Splits a batch of parameters for a single query into HTTP request bodies. The number of parameter entries
+        per request adapts to their size, such that each request contains roughly ``max_request_size`` bytes. Entries
+        with non-finite floats list the converted parameters in the additional entry "_non_finite", such that only
+        these values are parsed back with toFloat().
+
+        :param query: The Cypher query with parameters preceded by a $ character
+        :param param_batch: The parameters, one dictionary per execution of the query
+        :return: Yields pairs of request body and number of parameter entries in the request
+        """
+        batch_query = GraphDatabaseWriter._get_batch_query(query)
+        curr_entries = []
+        curr_size = 0
+        non_finite_params = {}
+        for params in param_batch:
+            json_params = {}
+            entry_non_finite = []
+            for param, value in params.items():
+                json_value, non_finite = GraphDatabaseWriter._to_json_parameter(value)
+                json_params[param] = json_value
+                if non_finite:
+                    non_finite_params[param] = isinstance(value, list)
+                    entry_non_finite.append(param)
+            if len(entry_non_finite) > 0:
+                json_params['_non_finite'] = entry_non_finite
+            entry = json.dumps(json_params, separators=(',', ':'), allow_nan=False)
+            curr_entries.append(entry)
+            curr_size += len(entry)
+            if curr_size >= self.max_request_size:
+                yield self.__get_http_batch_request_body(batch_query, curr_entries, non_finite_params), len(curr_entries)
+                curr_entries = []
+                curr_size = 0
+                non_finite_params = {}
+        if len(curr_entries) > 0:
+            yield self.__get_http_batch_request_body(batch_query, curr_entries, non_finite_params), len(curr_entries)
+
+    @staticmethod
+    def __get_http_batch_request_body(batch_query : str, entries : List[str], non_finite_params : Dict[str, bool]) -> str:
+        """Generates the HTTP request body for a batch query and already serialized parameter entries.
+
+        :param batch_query: The batch query
+        :param entries: The JSON serialized parameter entries
+        :param non_finite_params: Parameters containing non-finite floats converted to strings in at least one entry,
+            and if they are lists
+        :return: Returns the request body
+        """
+        if len(non_finite_params) > 0:
+            def get_replacement(match : re.Match) -> str:
+                param = match.group(1)
+                if non_finite_params[param]:
+                    converted = '[val IN entry.' + param + ' | toFloat(val)]'
+                else:
+                    converted = 'toFloat(entry.' + param + ')'
+                # only convert the entries which contained non-finite floats
+                return ('CASE WHEN \'' + param + '\' IN coalesce(entry._non_finite, []) THEN ' + converted
+                        + ' ELSE entry.' + param + ' END')
+
+            batch_query = re.sub(r'entry\.(' + '|'.join(re.escape(param) for param in non_finite_params) + r')\b',
+                                 get_replacement, batch_query)
+        return ('{"statements":[{"statement":' + json.dumps(batch_query) + ',"parameters":{"batch":['
+                + ','.join(entries) + ']}}]}')
+
     def _write_objects_neo4j_http(self, write_nodes : bool,
                                   node_id_dict: Optional[Dict[int, int]]) -> Optional[Dict[int, int]]:
-        """Write nodes or edges to the database via HTTP requests. If edges are written ``node_id_dict``
+        """Write nodes or edges to the database via HTTP requests. Objects with the same Cypher query are sent as
+        parameter batches, each batch is committed in a single request. If edges are written ``node_id_dict``
         must be specified. For nodes, it can be ``None``
 
         :param write_nodes: Flag which specifies if nodes or edges should be written
@@ -544,75 +942,51 @@ class GraphDatabaseWriter:
             ``None`` if edges were written
         """
         try:
-            curr_queries = []
-            chunk_size = 10000
-            curr_idx = 0
-
-            objects = list(self.nodes_dict.values()) if write_nodes else self.edges
+            # combine statements with the same query
+            query_params = collections.defaultdict(list)
+            query_node_ids = collections.defaultdict(list)
+            if write_nodes:
+                for node in self.nodes_dict.values():
+                    query, params = GraphDatabaseUtils.get_node_write_cypher_statement(node, separate_params=True)
+                    query_params[query].append(params)
+                    query_node_ids[query].append(node.node_id)
+            else:
+                for edge in self.edges:
+                    query, params = GraphDatabaseUtils.get_edge_write_cypher_statement(
+                        edge, node_id_dict, separate_params=True)
+                    query_params[query].append(params)
 
-            node_db_ids = []
+            node_id_mapping = {}
             counter = 0
-
-            # write objects in chunks
-            while curr_idx < len(objects):
-                curr_end = min(curr_idx + chunk_size, len(objects))
-                empty_body = GraphDatabaseUtils._get_neo4j_http_request_body([])
-                ok, data = GraphDatabaseUtils._run_pyodide_neo4j_http_request(empty_body, self.db_name, self.address,
-                                                                              self.auth, commit=False)
-                if not ok or len(data['errors']) > 0:
-                    raise AttributeError('Opening transaction for writing graph failed, error was: '
-                                         + ': '.join(data['errors'][0].values()))
-                transaction_str = data['commit']
-                pattern = re.compile(r'(?<=/tx/)\d+(?=/commit)')
-                matches = pattern.findall(transaction_str)
-                if len(matches) != 1:
-                    raise AttributeError('Writing graph failed, could not retrieve transaction ID')
-                transaction_id = int(matches[0])
-                for idx in range(curr_idx, curr_end):
+            for query, param_batch in query_params.items():
+                curr_idx = 0
+                for request_body, nof_entries in self._get_http_request_chunks(query, param_batch):
+                    ok, data = GraphDatabaseUtils._run_neo4j_http_request(
+                        request_body, self.db_name, self.address, self.auth, commit=True)
+                    if not ok or len(data['errors']) > 0:
+                        raise AttributeError('Writing graph failed, error was: '
+                                             + ': '.join(data['errors'][0].values()))
                     if write_nodes:
-                        query = GraphDatabaseUtils.get_node_write_cypher_statement(
-                            objects[idx], separate_params=False)
-                    else:
-                        query = GraphDatabaseUtils.get_edge_write_cypher_statement(
-                            objects[idx], node_id_dict, separate_params=False)
-                    curr_queries.append(query)
-                request_body = GraphDatabaseUtils._get_neo4j_http_request_body(curr_queries)
-                ok, data = GraphDatabaseUtils._run_pyodide_neo4j_http_request(
-                    request_body, self.db_name, self.address, self.auth, transaction_id=transaction_id, commit=False)
-
-                if not ok or len(data['errors']) > 0:
-                    print(request_body)
-                    raise AttributeError('Writing graph failed, error was: '
-                                         + ': '.join(data['errors'][0].values()))
-                if write_nodes:
-                    for row in data['results']:
-                        node_db_ids.append(row['data'][0]['row'][0])
-
-                curr_queries = []
-                curr_idx = curr_end
-
-                # commit batch of objects
-                empty_body = GraphDatabaseUtils._get_neo4j_http_request_body([])
-                ok, data = GraphDatabaseUtils._run_pyodide_neo4j_http_request(
-                    empty_body, self.db_name, self.address, self.auth, transaction_id=transaction_id, commit=True)
-                if not ok or len(data['errors']) > 0:
-                    raise AttributeError('Writing graph failed, could not commit transaction. Error was: '
-                                         + ': '.join(data['errors'][0].values()))
-                counter += 1
-                print('Wrote chunk '+ str(counter))
+                        db_ids = [row['row'][0] for row in data['results'][0]['data']]
+                        if len(db_ids) != nof_entries:
+                            raise AttributeError('Length of node db IDS:' + str(len(db_ids))
+                                                 + ', but number of nodes is ' + str(nof_entries))
+                        node_id_mapping.update(zip(query_node_ids[query][curr_idx:curr_idx + nof_entries], db_ids))
+                    curr_idx += nof_entries
+                    counter += 1
+                    print('Wrote chunk ' + str(counter))
 
             if write_nodes:
-                if len(node_db_ids) != len(objects):
-                    raise AttributeError('Length of node db IDS:' + str(len(node_db_ids)) + ', but number of nodes is ' + str(len(objects)))
-                return dict(zip((node.node_id for node in objects), node_db_ids))
+                return node_id_mapping
             else:
                 return None
 
-        except pyodide.ffi.JsException as error:
+        except HTTPRequestError as error:
             raise AttributeError('Writing graph failed, error was: ' + str(error))
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         print('Writing graph to database')
+        GraphDatabaseUtils.clear_description_cache(self.address)
         if USE_PYODIDE:
             print('Writing nodes')
             node_id_dict = self._write_objects_neo4j_http(write_nodes=True, node_id_dict=None)
@@ -631,8 +1005,7 @@ class GraphDatabaseWriter:
                                 query_params[query].append((params, node.node_id))
                             node_id_mapping = {}
                             for query, param_id_batch in query_params.items():
-                                copied_query = query.replace('$', 'entry.')
-                                copied_query = 'WITH $batch AS batch UNWIND batch AS entry ' + copied_query
+                                copied_query = GraphDatabaseWriter._get_batch_query(query)
                                 param_batch = [entry[0] for entry in param_id_batch]
                                 records = tx.run(copied_query, {'batch': param_batch})
                                 db_ids = [entry['id'] for entry in records]
@@ -645,19 +1018,25 @@ class GraphDatabaseWriter:
                                     edge, node_id_mapping, separate_params=True)
                                 query_params[query].append(params)
                             for query, param_batch in query_params.items():
-                                copied_query = query.replace('$', 'entry.')
-                                copied_query = 'WITH $batch AS batch UNWIND batch AS entry ' + copied_query
+                                copied_query = GraphDatabaseWriter._get_batch_query(query)
                                 tx.run(copied_query, {'batch': param_batch})
                             tx.commit()
             except (exceptions.Neo4jError, exceptions.DriverError) as error:
                 raise AttributeError('Failed to write graph to database, error was: ' + str(error))
+        if self.create_indexes:
+            print('Creating indexes')
+            table_labels = set()
+            for node in self.nodes_dict.values():
+                table_labels.update(node.labels.membership_labels)
+            GraphDatabaseUtils.create_indexes(self.db_name, table_labels, address=self.address, auth=self.auth,
+                                              wait_seconds=self.index_wait_seconds)
 
 
 
     @staticmethod
     def write_graph(db_name: str, graph: Graph, overwrite: bool = False,
                     address: str = GraphDatabaseUtils.get_neo4j_address(),
-                    auth: Tuple[str, str] = ("neo4j", "")) -> None:
+                    auth: Tuple[str, str] = ("neo4j", ""), create_indexes : bool = False) -> None:
         """Writes a :class:`Graph` object to a Neo4J database.
 
         :param db_name: The name of the database the graph is written to
@@ -665,8 +1044,11 @@ class GraphDatabaseWriter:
         :param overwrite: if `True`, database `db_name` will be overwritten if already exists
         :param address: The address of the Neo4J DBMS
         :param auth: username and password to access the Neo4j DBMS
+        :param create_indexes: If ``True``, range indexes on the properties "name" and "value" are created for all
+            table labels of the graph
         """
-        with GraphDatabaseWriter(graph.type, db_name, overwrite, address, auth) as writer:
+        with GraphDatabaseWriter(graph.type, db_name, overwrite, address, auth,
+                                 create_indexes=create_indexes) as writer:
             for node in graph.nodes:
                 writer.write_node(node)
             for edge in graph.edges:
@@ -674,30 +1056,46 @@ class GraphDatabaseWriter:
 
 
 class RelationalDataIODevice:
-    """This class reads and writes relational table data either from/to a directory as CSV files, or a dict in Python
+    """This class reads and writes relational table data either from/to a directory as CSV files, a dict in Python, or
+    a :class:`~graphxplore.Basis.TableSource` (e.g. SQLite or Parquet)
 
-    :param data_location: A directory path, or a dictionary of table name (without .csv extension) and list of
-        table row dicts
+    :param data_location: A directory path, a dictionary of table name (without .csv extension) and list of
+        table row dicts, or a table source
     :param table: The current table to consider. Either ``table`` + '.csv' must be in specified directory path, or
-        as key in the dict
+        as key in the dict, or as table in the table source
     :param write: bool for write or read access
     :param header: The header to write in the csv. Can be omitted, if ``write`` is ``False``
     :param file_encoding: The file encoding of the CSV file to read. Can be omitted, if ``write`` is ``True``, or
         data dict is specified
     :param delimiter: The delimiter of the CSV file to read. Can be omitted, if ``write`` is ``True``, or
-        data dict is specified
+        data dict is specified. If omitted for reading, the CSV dialect is detected and cached in
+        :class:`~graphxplore.Basis.CSVFormatCache`
+    :param columns: The columns to read. Only these keys are contained in the read row dicts. CSV rows are parsed as
+        tuples and only the specified fields are extracted. All columns are read if ``None`` is specified, defaults
+        to None
+    :param byte_range: Only read the CSV records in this byte range of start (inclusive) and end (exclusive) offset,
+        e.g. a chunk created with :meth:`~graphxplore.Basis.BaseUtils.split_csv_file`. The header is read from the
+        start of the file. All records are read if ``None`` is specified, defaults to None
     """
-    def __init__(self, data_location: Union[str, Dict[str, List[Dict[str, str]]]], table : str, write: bool = False,
+    def __init__(self, data_location: Union[str, Dict[str, List[Dict[str, str]]], TableSource], table : str,
+                 write: bool = False,
                  header: Optional[List[str]] = None, file_encoding: Optional[str] = None,
-                 delimiter: Optional[str] = None):
+                 delimiter: Optional[str] = None, columns: Optional[Iterable[str]] = None,
+                 byte_range: Optional[Tuple[int, int]] = None):
         """Constructor method
         """
+        if write and columns is not None:
+            raise AttributeError('Column projection is only available for reading')
+        if byte_range is not None and (write or not isinstance(data_location, str)):
+            raise AttributeError('Byte ranges can only be read from CSV files')
         self.check_data_location(data_location, write)
         if not write:
             if table not in self.get_available_table_names(data_location):
                 if isinstance(data_location, str):
                     raise AttributeError('Table "' + table + '" does not exist in directory "' + data_location
                                          + '" at path "' + os.path.join(data_location, table + '.csv') + '"')
+                elif isinstance(data_location, TableSource):
+                    raise AttributeError('Table "' + table + '" does not exist in table source')
                 else:
                     raise AttributeError('Table "' + table + '" does not exist in data directory')
         self.data_location = data_location
@@ -708,43 +1106,82 @@ class RelationalDataIODevice:
         self.file = None
         self.reader = None
         self.writer = None
-        if self.write and isinstance(data_location, str) and header is None:
+        if self.write and not isinstance(data_location, dict) and header is None:
             raise AttributeError('For writing table "' + table + '" you need to specify a CSV header')
         self.header = header
+        # remove duplicates, but keep order
+        self.columns = list(dict.fromkeys(columns)) if columns is not None else None
+        self.byte_range = byte_range
 
     def __enter__(self):
         if isinstance(self.data_location, str):
-            mode = 'w' if self.write else 'r'
             table_path = os.path.join(self.data_location, self.table + '.csv')
-            file_enc = self.file_encoding if self.file_encoding is not None else BaseUtils.detect_file_encoding(table_path)
-            self.file = open(table_path, encoding=file_enc, mode=mode).__enter__()
             if self.write:
+                if self.file_encoding is not None:
+                    file_enc = self.file_encoding
+                # the encoding of new files cannot be detected
+                elif os.path.isfile(table_path):
+                    file_enc = BaseUtils.detect_file_encoding(table_path)
+                else:
+                    file_enc = 'utf-8'
+                self.file = open(table_path, encoding=file_enc, mode='w').__enter__()
                 self.writer = csv.DictWriter(self.file, fieldnames=self.header,
                                              delimiter=self.delimiter if self.delimiter is not None else ',')
                 self.writer.writeheader()
             else:
-                if self.delimiter is None:
-                    try:
-                        dialect = csv.Sniffer().sniff(self.file.read(100000), delimiters=',;|\t ')
-                        self.file.seek(0)
-                        self.reader = csv.DictReader(self.file, dialect=dialect)
-                    except csv.Error:
-                        self.file.seek(0)
-                        self.reader = csv.DictReader(self.file)
+                file_format = CSVFormatCache.get_format(table_path, self.file_encoding)
+                format_params = file_format.get_format_params() if self.delimiter is None else {
+                    'delimiter' : self.delimiter}
+                file_header = None
+                if self.byte_range is None:
+                    self.file = open(table_path, encoding=file_format.encoding, mode='r').__enter__()
                 else:
-                    self.reader = csv.DictReader(self.file, delimiter=self.delimiter)
+                    if self.delimiter is None:
+                        file_header = file_format.header
+                    else:
+                        with open(table_path, encoding=file_format.encoding) as header_file:
+                            file_header = next(csv.reader(header_file, **format_params), [])
+                    self.file = BaseUtils.open_byte_range(table_path, self.byte_range[0], self.byte_range[1],
+                                                          file_format.encoding).__enter__()
+                if self.columns is None:
+                    self.reader = csv.DictReader(self.file, fieldnames=file_header, **format_params)
+                else:
+                    try:
+                        row_reader = csv.reader(self.file, **format_params)
+                        self.reader = self.__get_projected_rows(
+                            row_reader, file_header if file_header is not None else next(row_reader, []))
+                    except AttributeError:
+                        self.file.__exit__(None, None, None)
+                        raise
+        elif isinstance(self.data_location, TableSource):
+            if self.write:
+                self.writer = self.data_location.open_writer(self.table, self.header)
+            else:
+                self.reader = iter(self.data_location.read_rows(self.table, self.columns))
         else:
             if self.write:
                 if self.table not in self.data_location:
                     self.data_location[self.table] = []
                 self.writer = self.data_location[self.table]
-            else:
+            elif self.columns is None:
                 self.reader = iter(self.data_location[self.table])
+            else:
+                rows = self.data_location[self.table]
+                # empty tables have no header to check the columns against
+                if len(rows) > 0:
+                    self.__check_columns(list(rows[0].keys()))
+                self.reader = ({column : row[column] for column in self.columns} for row in rows)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if isinstance(self.data_location, str):
             self.file.__exit__(exc_type, exc_val, exc_tb)
+        elif isinstance(self.data_location, TableSource):
+            if self.write:
+                self.writer.close()
+            # generators of table sources hold connections or files, also when iteration stopped early
+            elif hasattr(self.reader, 'close'):
+                self.reader.close()
 
     def __iter__(self):
         return self
@@ -759,7 +1196,7 @@ class RelationalDataIODevice:
         """
         if not self.write:
             raise AttributeError('Cannot write, because IO device was initialized as read-only')
-        if isinstance(self.data_location, str):
+        if isinstance(self.data_location, (str, TableSource)):
             self.writer.writerow(row)
         else:
             casted_row = {}
@@ -777,37 +1214,78 @@ class RelationalDataIODevice:
         """
         if self.header is not None:
             return self.header
+        if self.columns is not None:
+            return list(self.columns)
         if isinstance(self.data_location, str):
             return list(self.reader.fieldnames)
+        elif isinstance(self.data_location, TableSource):
+            return self.data_location.get_header(self.table)
         else:
             return list(self.data_location[self.table][0].keys())
 
+    def __check_columns(self, available_columns : List[str]):
+        for column in self.columns:
+            if column not in available_columns:
+                raise AttributeError('Column "' + column + '" does not exist in table "' + self.table + '"')
+
+    def __get_projected_rows(self, rows : Iterable[List[str]], file_header : List[str]) -> Iterable[Dict[str, str]]:
+        self.__check_columns(file_header)
+        # last occurrence for duplicate column names as in csv.DictReader
+        positions = {column : idx for idx, column in enumerate(file_header)}
+        indices = [positions[column] for column in self.columns]
+        return self.__iterate_projected_rows(rows, self.columns, indices)
+
+    @staticmethod
+    def __iterate_projected_rows(rows : Iterable[List[str]], columns : List[str],
+                                 indices : List[int]) -> Iterable[Dict[str, str]]:
+        if len(indices) == 0:
+            get_values = lambda csv_row: ()
+        elif len(indices) == 1:
+            idx = indices[0]
+            get_values = lambda csv_row: (csv_row[idx],)
+        else:
+            get_values = operator.itemgetter(*indices)
+        min_row_length = max(indices) + 1 if len(indices) > 0 else 1
+        for row in rows:
+            if len(row) >= min_row_length:
+                yield dict(zip(columns, get_values(row)))
+            # skip empty lines and fill short rows with None as csv.DictReader
+            elif len(row) > 0:
+                yield {column : row[idx] if idx < len(row) else None for column, idx in zip(columns, indices)}
+
     @staticmethod
-    def check_data_location(data_location: Union[str, Dict[str, List[Dict[str, str]]]], write: bool = False):
+    def check_data_location(data_location: Union[str, Dict[str, List[Dict[str, str]]], TableSource],
+                            write: bool = False):
         """Check if the data location exists as path, if it is a string, or if there is at least one table present in
-        the data dict if ``write`` is ``False``
+        the data dict or table source if ``write`` is ``False``
 
-        :param data_location: A directory path, or a dictionary of table name (without .csv extension) and list of
-            table row dicts
+        :param data_location: A directory path, a dictionary of table name (without .csv extension) and list of
+            table row dicts, or a table source
         :param write: bool for write or read access
         """
         if isinstance(data_location, str):
             if not os.path.isdir(data_location):
                 raise AttributeError('"' + data_location + '" is not a valid directory')
+        elif isinstance(data_location, TableSource):
+            if not write and len(data_location.get_table_names()) == 0:
+                raise AttributeError('No tables found in table source')
         elif not write:
             if len(data_location) == 0:
                 raise AttributeError('No CSV tables specified in data dictionary')
 
     @staticmethod
-    def get_available_table_names(data_source: Union[str, Dict[str, List[Dict[str, str]]]]) -> List[str]:
-        """Retrieves all table names (without .csv extension) from a directory path, or all keys from a data dictionary
+    def get_available_table_names(data_source: Union[str, Dict[str, List[Dict[str, str]]], TableSource]) -> List[str]:
+        """Retrieves all table names (without .csv extension) from a directory path, all keys from a data dictionary,
+        or all tables of a table source
 
-        :param data_source: A directory path, or a dictionary of table name (without .csv extension) and list of
-            table row dicts
+        :param data_source: A directory path, a dictionary of table name (without .csv extension) and list of
+            table row dicts, or a table source
         :return: Returns the found table names as a list of strings
         """
         RelationalDataIODevice.check_data_location(data_source)
         if isinstance(data_source, str):
             return sorted([table.replace('.csv', '') for table in os.listdir(data_source) if table.endswith('.csv')])
+        elif isinstance(data_source, TableSource):
+            return data_source.get_table_names()
         else:
             return sorted(data_source.keys())
\ No newline at end of file
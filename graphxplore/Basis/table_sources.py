@@ -0,0 +1,351 @@
+import os
+import sqlite3
+from typing import Dict, List, Optional, Sequence, Iterator, Union, Any
+
+class TableSource:
+    """This is the parent class of all relational data sources besides CSV directories and data dictionaries. A table
+    source can be used as ``data_location`` of :class:`~graphxplore.Basis.RelationalDataIODevice` and yields table rows
+    as dicts of variable name and string value. Missing values (e.g. ``NULL`` in SQL) are returned as empty strings.
+    Only the specified columns are retrieved and decoded from the source.
+    """
+    def get_table_names(self) -> List[str]:
+        """Get the names of all tables in the source
+
+        :return: Returns the table names as list of strings
+        """
+        raise NotImplementedError('Never call abstract class')
+
+    def get_header(self, table : str) -> List[str]:
+        """Get the column names of a table
+
+        :param table: The name of the table
+        :return: Returns the column names as list of strings
+        """
+        raise NotImplementedError('Never call abstract class')
+
+    def read_rows(self, table : str, columns : Optional[Sequence[str]] = None) -> Iterator[Dict[str, str]]:
+        """Iterate over the rows of a table
+
+        :param table: The name of the table
+        :param columns: The columns to retrieve. All columns are retrieved if ``None`` is specified, defaults to None
+        :return: Returns an iterator over the table rows as dicts of column name and string value
+        """
+        raise NotImplementedError('Never call abstract class')
+
+    def open_writer(self, table : str, header : List[str]) -> 'TableSourceWriter':
+        """Open a writer for a table. An existing table with the same name is replaced
+
+        :param table: The name of the table
+        :param header: The column names of the table
+        :return: Returns the writer
+        """
+        raise NotImplementedError('Never call abstract class')
+
+    def check_columns(self, table : str, columns : Optional[Sequence[str]]) -> List[str]:
+        """Check that all specified columns exist in a table
+
+        :param table: The name of the table
+        :param columns: The columns to check. All columns of the table are returned, if ``None`` is specified
+        :return: Returns the checked columns as list
+        """
+        header = self.get_header(table)
+        if columns is None:
+            return header
+        for column in columns:
+            if column not in header:
+                raise AttributeError('Column "' + column + '" does not exist in table "' + table + '"')
+        return list(columns)
+
+    @staticmethod
+    def to_str(value : Any) -> str:
+        """Cast a value retrieved from a table source to the string representation used in CSV files
+
+        :param value: The value to cast
+        :return: Returns the string, or an empty string for ``None``
+        """
+        if value is None:
+            return ''
+        if isinstance(value, str):
+            return value
+        if isinstance(value, bytes):
+            return value.decode('utf-8', errors='replace')
+        if isinstance(value, float) and value != value:
+            return ''
+        return str(value)
+
+class TableSourceWriter:
+    """This is the parent class of all writers for :class:`TableSource`
+
+    :param table: The name of the table
+    :param header: The column names of the table
+    """
+    def __init__(self, table : str, header : List[str]):
+        """Constructor method
+        """
+        self.table = table
+        self.header = list(header)
+
+    def writerow(self, row : Dict[str, Union[str, int, float, None]]):
+        """Write a single table row
+
+        :param row: The data row as a dict of variable name and value
+        """
+        raise NotImplementedError('Never call abstract class')
+
+    def close(self):
+        """Finish writing the table
+        """
+        raise NotImplementedError('Never call abstract class')
+
+    def _get_row_values(self, row : Dict[str, Union[str, int, float, None]]) -> List[str]:
+        values = []
+        for key in self.header:
+            if key not in row:
+                raise AttributeError('There is not value for key "' + key + '" in input data')
+            values.append('' if row[key] is None else str(row[key]))
+        return values
+
+class SQLiteTableSource(TableSource):
+    """This class reads and writes tables of a SQLite database file. Written tables store all columns as ``TEXT``
+
+    :param db_path: The path to the SQLite database file. Is created on write, if it does not exist
+    :param batch_size: The number of rows fetched and inserted per batch, defaults to 10000
+    """
+    def __init__(self, db_path : str, batch_size : int = 10000):
+        """Constructor method
+        """
+        if batch_size < 1:
+            raise AttributeError('Batch size must be at least 1')
+        self.db_path = db_path
+        self.batch_size = batch_size
+
+    def get_table_names(self) -> List[str]:
+        if not os.path.isfile(self.db_path):
+            return []
+        connection = self._connect()
+        try:
+            cursor = connection.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view') "
+                                        "AND name NOT LIKE 'sqlite_%'")
+            return sorted(entry[0] for entry in cursor.fetchall())
+        finally:
+            connection.close()
+
+    def get_header(self, table : str) -> List[str]:
+        connection = self._connect()
+        try:
+            cursor = connection.execute('PRAGMA table_info(' + self.quote_identifier(table) + ')')
+            header = [entry[1] for entry in cursor.fetchall()]
+        finally:
+            connection.close()
+        if len(header) == 0:
+            raise AttributeError('Table "' + table + '" does not exist in SQLite database "' + self.db_path + '"')
+        return header
+
+    def read_rows(self, table : str, columns : Optional[Sequence[str]] = None) -> Iterator[Dict[str, str]]:
+        columns = self.check_columns(table, columns)
+        query = ('SELECT ' + ', '.join(self.quote_identifier(column) for column in columns) + ' FROM '
+                 + self.quote_identifier(table))
+        return self.__iterate_rows(query, columns)
+
+    def __iterate_rows(self, query : str, columns : List[str]) -> Iterator[Dict[str, str]]:
+        connection = self._connect()
+        try:
+            cursor = connection.execute(query)
+            batch = cursor.fetchmany(self.batch_size)
+            while batch:
+                for values in batch:
+                    yield {column : self.to_str(value) for column, value in zip(columns, values)}
+                batch = cursor.fetchmany(self.batch_size)
+        finally:
+            connection.close()
+
+    def open_writer(self, table : str, header : List[str]) -> TableSourceWriter:
+        return SQLiteTableWriter(self, table, header)
+
+    @staticmethod
+    def quote_identifier(name : str) -> str:
+        """Quote a table or column name for usage in SQLite queries
+
+        :param name: The table or column name
+        :return: Returns the quoted name
+        """
+        return '"' + name.replace('"', '""') + '"'
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+class SQLiteTableWriter(TableSourceWriter):
+    """This class writes a table to a SQLite database with batched inserts
+
+    :param source: The SQLite table source
+    :param table: The name of the table
+    :param header: The column names of the table
+    """
+    def __init__(self, source : SQLiteTableSource, table : str, header : List[str]):
+        """Constructor method
+        """
+        super().__init__(table, header)
+        self.source = source
+        self.connection = source._connect()
+        quoted_table = source.quote_identifier(table)
+        self.connection.execute('DROP TABLE IF EXISTS ' + quoted_table)
+        self.connection.execute('CREATE TABLE ' + quoted_table + ' ('
+                                + ', '.join(source.quote_identifier(column) + ' TEXT' for column in self.header) + ')')
+        self.insert_query = ('INSERT INTO ' + quoted_table + ' VALUES ('
+                             + ', '.join('?' for _ in self.header) + ')')
+        self.batch = []
+
+    def writerow(self, row : Dict[str, Union[str, int, float, None]]):
+        self.batch.append(self._get_row_values(row))
+        if len(self.batch) >= self.source.batch_size:
+            self.__flush()
+
+    def close(self):
+        self.__flush()
+        self.connection.commit()
+        self.connection.close()
+
+    def __flush(self):
+        if len(self.batch) > 0:
+            self.connection.executemany(self.insert_query, self.batch)
+            self.batch = []
+
+class ArrowTableSource(TableSource):
+    """This class reads and writes in-memory Apache Arrow tables. Requires the package ``pyarrow``
+
+    :param tables: A dictionary of table name and ``pyarrow.Table``. Written tables are inserted, defaults to None
+    :param batch_size: The number of rows decoded per batch, defaults to 10000
+    """
+    def __init__(self, tables : Optional[Dict[str, Any]] = None, batch_size : int = 10000):
+        """Constructor method
+        """
+        self.pyarrow = ArrowTableSource.import_pyarrow()
+        if batch_size < 1:
+            raise AttributeError('Batch size must be at least 1')
+        self.tables = tables if tables is not None else {}
+        self.batch_size = batch_size
+
+    def get_table_names(self) -> List[str]:
+        return sorted(self.tables.keys())
+
+    def get_header(self, table : str) -> List[str]:
+        if table not in self.tables:
+            raise AttributeError('Table "' + table + '" does not exist in Arrow table source')
+        return list(self.tables[table].column_names)
+
+    def read_rows(self, table : str, columns : Optional[Sequence[str]] = None) -> Iterator[Dict[str, str]]:
+        columns = self.check_columns(table, columns)
+        return self.iterate_batches(self.tables[table].select(columns).to_batches(self.batch_size), columns)
+
+    def open_writer(self, table : str, header : List[str]) -> TableSourceWriter:
+        return ArrowTableWriter(table, header, self.__store_table)
+
+    def __store_table(self, table : str, arrow_table : Any):
+        self.tables[table] = arrow_table
+
+    @staticmethod
+    def iterate_batches(batches : Any, columns : List[str]) -> Iterator[Dict[str, str]]:
+        """Convert Arrow record batches to row dicts of string values
+
+        :param batches: An iterable of ``pyarrow.RecordBatch``
+        :param columns: The column names in the batches
+        :return: Returns an iterator over the table rows as dicts of column name and string value
+        """
+        to_str = TableSource.to_str
+        for batch in batches:
+            column_values = [[to_str(value) for value in batch.column(idx).to_pylist()]
+                             for idx in range(len(columns))]
+            for values in zip(*column_values):
+                yield dict(zip(columns, values))
+
+    @staticmethod
+    def import_pyarrow() -> Any:
+        """Import ``pyarrow`` on demand, since it is an optional dependency
+
+        :return: Returns the ``pyarrow`` module
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+            return pyarrow
+        except ImportError:
+            raise AttributeError('Reading Arrow or Parquet tables requires the package "pyarrow", install it with '
+                                 '"pip install pyarrow"')
+
+class ArrowTableWriter(TableSourceWriter):
+    """This class collects table rows and converts them to an Arrow table of string columns when closed
+
+    :param table: The name of the table
+    :param header: The column names of the table
+    :param store_callback: Called with the table name and the resulting ``pyarrow.Table`` when the writer is closed
+    """
+    def __init__(self, table : str, header : List[str], store_callback):
+        """Constructor method
+        """
+        super().__init__(table, header)
+        self.pyarrow = ArrowTableSource.import_pyarrow()
+        self.store_callback = store_callback
+        self.columns = [[] for _ in self.header]
+
+    def writerow(self, row : Dict[str, Union[str, int, float, None]]):
+        for column, value in zip(self.columns, self._get_row_values(row)):
+            column.append(value)
+
+    def close(self):
+        arrow_table = self.pyarrow.table({column : self.pyarrow.array(values, type=self.pyarrow.string())
+                                          for column, values in zip(self.header, self.columns)})
+        self.columns = [[] for _ in self.header]
+        self.store_callback(self.table, arrow_table)
+
+class ParquetTableSource(TableSource):
+    """This class reads and writes a directory of Parquet files, one file ``<table>.parquet`` per table. Only the
+    requested columns are decoded. Requires the package ``pyarrow``
+
+    :param directory: The path to the directory
+    :param batch_size: The number of rows decoded per batch, defaults to 10000
+    """
+    def __init__(self, directory : str, batch_size : int = 10000):
+        """Constructor method
+        """
+        self.pyarrow = ArrowTableSource.import_pyarrow()
+        if not os.path.isdir(directory):
+            raise AttributeError('"' + directory + '" is not a valid directory')
+        if batch_size < 1:
+            raise AttributeError('Batch size must be at least 1')
+        self.directory = directory
+        self.batch_size = batch_size
+
+    def get_table_names(self) -> List[str]:
+        return sorted(file_name[:-len('.parquet')] for file_name in os.listdir(self.directory)
+                      if file_name.endswith('.parquet'))
+
+    def get_header(self, table : str) -> List[str]:
+        parquet_file = self.__open_file(table)
+        try:
+            return list(parquet_file.schema_arrow.names)
+        finally:
+            parquet_file.close()
+
+    def read_rows(self, table : str, columns : Optional[Sequence[str]] = None) -> Iterator[Dict[str, str]]:
+        columns = self.check_columns(table, columns)
+        return self.__iterate_rows(self.__open_file(table), columns)
+
+    def __iterate_rows(self, parquet_file : Any, columns : List[str]) -> Iterator[Dict[str, str]]:
+        try:
+            yield from ArrowTableSource.iterate_batches(parquet_file.iter_batches(batch_size=self.batch_size,
+                                                                                  columns=columns), columns)
+        finally:
+            parquet_file.close()
+
+    def open_writer(self, table : str, header : List[str]) -> TableSourceWriter:
+        return ArrowTableWriter(table, header, self.__write_table)
+
+    def __write_table(self, table : str, arrow_table : Any):
+        self.pyarrow.parquet.write_table(arrow_table, os.path.join(self.directory, table + '.parquet'))
+
+    def __open_file(self, table : str) -> Any:
+        file_path = os.path.join(self.directory, table + '.parquet')
+        if not os.path.isfile(file_path):
+            raise AttributeError('Table "' + table + '" does not exist in directory "' + self.directory
+                                 + '" at path "' + file_path + '"')
+        return self.pyarrow.parquet.ParquetFile(file_path)
@@ -4,7 +4,296 @@ import pathlib
 import chardet
 import os
 import math
-from typing import Dict, Any, Union, Optional, Tuple, Sequence, List
+import json
+import io
+import mmap
+import random
+import itertools
+import tempfile
+import collections.abc
+import concurrent.futures
+from array import array
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, Union, Optional, Tuple, Sequence, List, Iterable
+from .value_distribution import ValueDistribution
+
+@dataclass
+class CSVFileFormat:
+    """Detected format of a CSV file, i.e. its encoding, CSV dialect and header
+
+    :param encoding: The file encoding
+    :param dialect: The CSV format parameters detected by :class:`csv.Sniffer` (e.g. delimiter and quote char), or
+        ``None`` if the dialect could not be detected and the default format should be used
+    :param header: The column names in the first row of the file
+    """
+    encoding: str
+    dialect: Optional[Dict[str, Any]]
+    header: List[str]
+
+    def get_format_params(self) -> Dict[str, Any]:
+        """Get the format parameters that can be passed as keyword arguments to :func:`csv.reader` or
+        :class:`csv.DictReader`
+
+        :return: Returns the format parameters as dict
+        """
+        return dict(self.dialect) if self.dialect is not None else {}
+
+class CSVFormatCache:
+    """Process-wide cache of detected CSV file formats. Entries are keyed by the absolute file path, file size and
+    modification time, such that the encoding and dialect of a file are only detected once as long as the file stays
+    unchanged. Optionally, the detected formats are persisted as a JSON file next to the data and reused by other
+    processes.
+    """
+    persistence_file_name = '.graphxplore_csv_formats.json'
+    _formats = {}
+    _persist = False
+    _dialect_params = ['delimiter', 'quotechar', 'doublequote', 'escapechar', 'skipinitialspace', 'lineterminator',
+                       'quoting']
+
+    @staticmethod
+    def get_format(file_path : str, file_encoding : Optional[str] = None) -> CSVFileFormat:
+        """Get the format of a CSV file from the cache, or detect and cache it
+
+        :param file_path: The path to the CSV file
+        :param file_encoding: The file encoding, detected automatically if ``None`` is specified. If it differs from
+            the cached encoding, the format is detected again, but not cached
+        :return: Returns the detected file format
+        """
+        if not os.path.exists(file_path) or not os.path.isfile(file_path):
+            raise AttributeError('Filepath "' + file_path + '" does not exist or is not a file')
+        abs_path = os.path.abspath(file_path)
+        stat = os.stat(abs_path)
+        key = (abs_path, stat.st_size, stat.st_mtime_ns)
+        file_format = CSVFormatCache._formats.get(key)
+        if file_format is None and CSVFormatCache._persist:
+            file_format = CSVFormatCache.__load_persisted_format(key)
+            if file_format is not None:
+                CSVFormatCache._formats[key] = file_format
+        if file_format is not None and (file_encoding is None or file_encoding == file_format.encoding):
+            return file_format
+        detected_format = CSVFormatCache.detect_format(abs_path, file_encoding)
+        if file_format is None:
+            CSVFormatCache._formats[key] = detected_format
+            if CSVFormatCache._persist:
+                CSVFormatCache.__persist_format(key, detected_format)
+        return detected_format
+
+    @staticmethod
+    def detect_format(file_path : str, file_encoding : Optional[str] = None) -> CSVFileFormat:
+        """Detect the encoding, CSV dialect and header of a file without using the cache
+
+        :param file_path: The path to the CSV file
+        :param file_encoding: The file encoding, detected automatically if ``None`` is specified
+        :return: Returns the detected file format
+        """
+        encoding = file_encoding if file_encoding is not None else BaseUtils.detect_file_encoding(file_path)
+        with open(file_path, encoding=encoding) as file:
+            return CSVFormatCache.detect_text_format(file, encoding)
+
+    @staticmethod
+    def detect_text_format(text_file : io.TextIOBase, encoding : str) -> CSVFileFormat:
+        """Detect the CSV dialect and header of an opened, seekable text stream. The stream is reset to its start
+        afterwards
+
+        :param text_file: The text stream positioned at its start
+        :param encoding: The encoding used to decode the stream
+        :return: Returns the detected file format
+        """
+        try:
+            sniffed = csv.Sniffer().sniff(text_file.read(100000), delimiters=',;|\t ')
+            dialect = {param: getattr(sniffed, param) for param in CSVFormatCache._dialect_params}
+        except csv.Error:
+            dialect = None
+        text_file.seek(0)
+        try:
+            header = next(csv.reader(text_file, **(dialect if dialect is not None else {})))
+        except StopIteration:
+            header = []
+        text_file.seek(0)
+        return CSVFileFormat(encoding, dialect, header)
+
+    @staticmethod
+    def set_persistence(persist : bool):
+        """Enable or disable persisting detected formats as a JSON file in the directory of the CSV file
+
+        :param persist: If ``True``, formats are persisted and previously persisted formats are loaded
+        """
+        CSVFormatCache._persist = persist
+
+    @staticmethod
+    def clear():
+        """Remove all formats from the in-memory cache. Persisted formats are not deleted
+        """
+        CSVFormatCache._formats.clear()
+
+    @staticmethod
+    def __load_persisted_format(key : Tuple[str, int, int]) -> Optional[CSVFileFormat]:
+        persisted = CSVFormatCache.__read_persistence_file(os.path.dirname(key[0]))
+        entry = persisted.get(os.path.basename(key[0]))
+        if not isinstance(entry, dict) or entry.get('size') != key[1] or entry.get('mtime_ns') != key[2]:
+            return None
+        try:
+            return CSVFileFormat(**entry['format'])
+        except (KeyError, TypeError, AttributeError):
+            return None
+
+    @staticmethod
+    def __persist_format(key : Tuple[str, int, int], file_format : CSVFileFormat):
+        directory = os.path.dirname(key[0])
+        persisted = CSVFormatCache.__read_persistence_file(directory)
+        persisted[os.path.basename(key[0])] = {'size': key[1], 'mtime_ns': key[2], 'format': asdict(file_format)}
+        # concurrent writers replace the whole file, such that it is never truncated. Formats lost this way are
+        # detected and persisted again
+        try:
+            BaseUtils.write_file_atomically(os.path.join(directory, CSVFormatCache.persistence_file_name),
+                                            json.dumps(persisted, indent=1).encode('utf-8'))
+        # e.g. read-only data directory, the format stays cached in memory
+        except OSError:
+            pass
+
+    @staticmethod
+    def __read_persistence_file(directory : str) -> Dict[str, Any]:
+        file_path = os.path.join(directory, CSVFormatCache.persistence_file_name)
+        if not os.path.isfile(file_path):
+            return {}
+        try:
+            with open(file_path, encoding='utf-8') as f:
+                persisted = json.load(f)
+            return persisted if isinstance(persisted, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+class LazyCSVTable(collections.abc.Sequence):
+    """A CSV table that is only indexed by the byte offsets of its rows. Row dicts are read on demand, when accessed by
+    index or iterated over. Can be used in place of a list of row dicts, e.g. in a data dictionary for
+    :class:`~graphxplore.Basis.RelationalDataIODevice`. The source is either a CSV file, which must not change after
+    indexing, or the raw bytes of a CSV file. The encoding must be ASCII-compatible (e.g. UTF-8 or Latin-1).
+
+    :param source: The path to the CSV file, or its raw bytes
+    :param file_encoding: The encoding of the source, detected automatically if ``None`` is specified, defaults to
+        None
+    :param delimiter: The CSV delimiter, detected automatically if ``None`` is specified, defaults to None
+    """
+    def __init__(self, source : Union[str, bytes], file_encoding : Optional[str] = None,
+                 delimiter : Optional[str] = None):
+        """Constructor method
+        """
+        if isinstance(source, str):
+            file_format = CSVFormatCache.get_format(source, file_encoding)
+            stat = os.stat(source)
+            self.file_state = (stat.st_size, stat.st_mtime_ns)
+        else:
+            encoding = file_encoding if file_encoding is not None else BaseUtils.detect_bytes_encoding(source)
+            with io.TextIOWrapper(io.BytesIO(source), encoding=encoding) as text_file:
+                file_format = CSVFormatCache.detect_text_format(text_file, encoding)
+            self.file_state = None
+        if not LazyCSVTable.supports_encoding(file_format.encoding):
+            raise AttributeError('Lazy loading requires an ASCII-compatible encoding, but "' + file_format.encoding
+                                 + '" was specified')
+        self.source = source
+        self.encoding = file_format.encoding
+        self.format_params = file_format.get_format_params() if delimiter is None else {'delimiter' : delimiter}
+        if delimiter is None:
+            self.header = file_format.header
+        else:
+            with self.__open_text(0) as text_file:
+                self.header = next(csv.reader(text_file, **self.format_params), [])
+        quotechar = self.format_params.get('quotechar', '"')
+        self.offsets = array('q')
+        if isinstance(source, str):
+            with open(source, 'rb') as file:
+                if self.file_state[0] > 0:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        self.data_end = self.__index_records(mapped, quotechar.encode('ascii'))
+                else:
+                    self.data_end = 0
+        else:
+            self.data_end = self.__index_records(source, quotechar.encode('ascii'))
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, idx : Union[int, slice]) -> Union[Dict[str, str], List[Dict[str, str]]]:
+        if isinstance(idx, slice):
+            return [self.__read_row(row_idx) for row_idx in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if idx < 0 or idx >= len(self):
+            raise IndexError('Row index out of range')
+        return self.__read_row(idx)
+
+    def __iter__(self):
+        if len(self) == 0:
+            return
+        with self.__open_text(self.offsets[0]) as text_file:
+            yield from csv.DictReader(text_file, fieldnames=self.header, **self.format_params)
+
+    def get_header(self) -> List[str]:
+        """Get the header of the table
+
+        :return: Returns the column names as list of strings
+        """
+        return list(self.header)
+
+    @staticmethod
+    def supports_encoding(encoding : str) -> bool:
+        """Check if an encoding can be used for lazy loading, i.e. line breaks and quote characters are encoded as
+        single ASCII bytes
+
+        :param encoding: The encoding
+        :return: Returns ``True``, if the encoding is ASCII-compatible
+        """
+        try:
+            return 'a\n",;'.encode(encoding).endswith(b'a\n",;')
+        except LookupError:
+            return False
+
+    def __index_records(self, data : Union[mmap.mmap, bytes], quote : bytes) -> int:
+        """Store the start offsets of all records after the header. Empty lines are skipped as in
+        :class:`csv.DictReader`
+
+        :param data: The memory-mapped file or raw bytes
+        :param quote: The quote character
+        :return: Returns the end offset of the last record
+        """
+        position = _find_record_end(data, 0, False, quote)
+        data_size = len(data)
+        while position < data_size:
+            line_end = data.find(b'\n', position)
+            if line_end == -1:
+                line_end = data_size
+            if line_end - position > 1 or (line_end - position == 1 and data[position:line_end] != b'\r'):
+                self.offsets.append(position)
+                position = _find_record_end(data, position, False, quote)
+            else:
+                position = line_end + 1
+        return data_size
+
+    def __check_file_state(self):
+        stat = os.stat(self.source)
+        if (stat.st_size, stat.st_mtime_ns) != self.file_state:
+            raise AttributeError('File "' + self.source + '" changed after it was indexed')
+
+    def __open_text(self, start : int) -> io.TextIOBase:
+        if self.file_state is None:
+            raw_file = io.BytesIO(self.source)
+            raw_file.seek(start)
+            return io.TextIOWrapper(raw_file, encoding=self.encoding)
+        self.__check_file_state()
+        return BaseUtils.open_byte_range(self.source, start, self.file_state[0], self.encoding)
+
+    def __read_row(self, idx : int) -> Dict[str, str]:
+        start = self.offsets[idx]
+        end = self.offsets[idx + 1] if idx + 1 < len(self.offsets) else self.data_end
+        if self.file_state is None:
+            raw_data = self.source[start:end]
+        else:
+            self.__check_file_state()
+            with open(self.source, 'rb') as file:
+                file.seek(start)
+                raw_data = file.read(end - start)
+        with io.StringIO(raw_data.decode(self.encoding), newline=None) as text_file:
+            return next(csv.DictReader(text_file, fieldnames=self.header, **self.format_params))
 
 class BaseUtils:
     """This class contains utility functions.
@@ -20,23 +309,56 @@ class BaseUtils:
         if not os.path.exists(file_path) or not os.path.isfile(file_path):
             raise AttributeError('Filepath "' + file_path + '" does not exist or is not a file')
         with open(file_path, 'rb') as file:
-            raw_data = file.read(100000)
-            result = chardet.detect(raw_data)
-            encoding = result['encoding']
-            # ascii (without special characters) is subset of utf-8
-            if encoding == 'ascii':
-                encoding = 'utf-8'
-            return encoding
+            return BaseUtils.detect_bytes_encoding(file.read(100000))
+
+    @staticmethod
+    def detect_bytes_encoding(raw_data : bytes) -> str:
+        """Guesses the encoding of raw bytes e.g., ASCII, UTF-8,... Uses the library chardet on the first 100k bytes.
+
+        :param raw_data: The bytes
+        :return: Returns the guessed encoding
+        """
+        encoding = chardet.detect(raw_data[:100000])['encoding']
+        # ascii (without special characters) is subset of utf-8
+        if encoding == 'ascii' or encoding is None:
+            encoding = 'utf-8'
+        return encoding
+
+    @staticmethod
+    def write_file_atomically(file_path : str, content : bytes) -> None:
+        """Writes content to a file by writing a temporary file in the same directory and replacing the target file
+        with it. Readers never see a partially written file, even if the writing process is interrupted or multiple
+        processes write the same file
+
+        :param file_path: The path to the file
+        :param content: The file content
+        """
+        file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)),
+                                                      prefix='.' + os.path.basename(file_path) + '.', suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
 
     @staticmethod
     def load_csv_data(file_or_dir_path: str, delimiter: Optional[str] = None,
-                      file_encoding : Optional[str] = None) -> Dict[str, List[Dict[str, str]]]:
-        """Load table data from one CSV file or from all CSV files contained in a directory
+                      file_encoding : Optional[str] = None,
+                      lazy : bool = False) -> Dict[str, Union[List[Dict[str, str]], 'LazyCSVTable']]:
+        """Load table data from one CSV file or from all CSV files contained in a directory. Detected file formats are
+        cached in :class:`CSVFormatCache`
 
         :param file_or_dir_path: Path to directory and file
         :param delimiter: CSV delimiter used for all files, inferred automatically if ``None`` is specified
         :param file_encoding: File encoding used for all files, inferred automatically if ``None`` is specified
-        :return: Returns a dict with the filename without '.csv' extension as key and list of row dicts as table data
+        :param lazy: If ``True``, the files are only indexed by the byte offsets of their rows and returned as
+            :class:`LazyCSVTable`, which reads row dicts on demand. Requires ASCII-compatible file encodings,
+            defaults to False
+        :return: Returns a dict with the filename without '.csv' extension as key and list of row dicts (or
+            :class:`LazyCSVTable`) as table data
         """
         if not os.path.exists(file_or_dir_path):
             raise AttributeError('Filepath "' + file_or_dir_path + '" does not exist or is not a file')
@@ -53,18 +375,15 @@ class BaseUtils:
             raise AttributeError('Not a valid filename or directory: "' + file_or_dir_path + '"')
         result = {}
         for table, file_path in csv_files.items():
+            if lazy:
+                print('Indexing data from table "' + table + '"')
+                result[table] = LazyCSVTable(file_path, file_encoding, delimiter)
+                continue
             print('Loading data from table "' + table + '"')
-            file_enc = file_encoding if file_encoding is not None else BaseUtils.detect_file_encoding(
-                file_path)
-            with open(file_path, encoding=file_enc) as file:
+            file_format = CSVFormatCache.get_format(file_path, file_encoding)
+            with open(file_path, encoding=file_format.encoding) as file:
                 if delimiter is None:
-                    try:
-                        dialect = csv.Sniffer().sniff(file.read(100000), delimiters=',;|\t ')
-                        file.seek(0)
-                        reader = csv.DictReader(file, dialect=dialect)
-                    except csv.Error:
-                        file.seek(0)
-                        reader = csv.DictReader(file)
+                    reader = csv.DictReader(file, **file_format.get_format_params())
                 else:
                     reader = csv.DictReader(file, delimiter=delimiter)
                 result[table] = [row for row in reader]
@@ -182,7 +501,8 @@ class BaseUtils:
     @staticmethod
     def calculate_mean(value_dist : Dict[Union[int, float], int]) -> Optional[float]:
         """Calculates the mean of a distribution dictionary with distribution values as key and counts as values of
-        the dictionary. If the dictionary is empty `None` is returned.
+        the dictionary. If the dictionary is empty `None` is returned. For multiple statistics of the same large
+        distribution, use :class:`ValueDistribution` directly.
 
         :param value_dist: The distribution
         :return: Returns the mean or `None` for empty distributions
@@ -251,8 +571,7 @@ class BaseUtils:
     @staticmethod
     def calculate_median_quartiles(value_dist: Dict[Union[int, float], int]) -> Optional[Tuple[float, Optional[float], Optional[float]]]:
         """Calculates the median and quartiles of a distribution dictionary with distribution values as key and counts
-        as values of the dictionary. If the dictionary is empty `None` is returned. If the accumulated counts are less
-        than four, quartiles are returned as ``None``.
+        as values of the dictionary. If the dictionary is empty `None` is returned.
 
         :param value_dist: The distribution
         :return: Returns the median, first quartile and third quartile, or `None` for empty distributions
@@ -282,45 +601,177 @@ class BaseUtils:
             raise AttributeError('Quintile ID must be 1, 2, 3 or 4')
         if len(sorted_dist) == 0:
             return None
+        min_count, border_count = ValueDistribution.get_quantile_counts(sum((entry[1] for entry in sorted_dist)),
+                                                                        quantile_id, 4 if use_quartile else 5)
         idx = 0
-        count_sum = sum((entry[1] for entry in sorted_dist))
         accumulated_count = sorted_dist[idx][1]
-        if use_quartile:
-            multiplier = 4 if quantile_id == 1 else 2 if quantile_id == 2 else 4/3
-            divisor = 2 if quantile_id == 2 else 4
-        else:
-            multiplier = 5 if quantile_id == 1 else 2.5 if quantile_id == 2 else 5/3 if quantile_id == 3 else 1.25
-            divisor = 5
-        while multiplier * accumulated_count < count_sum:
+        while accumulated_count < min_count:
             idx += 1
             accumulated_count += sorted_dist[idx][1]
-        # divisible
-        if count_sum % divisor == 0:
-            # at the border of two values
-            if multiplier * accumulated_count == count_sum:
-                return (sorted_dist[idx][0] + sorted_dist[idx + 1][0]) / 2
-            else:
-                return sorted_dist[idx][0]
-        # not divisible
-        else:
-            return sorted_dist[idx][0]
+        if accumulated_count == border_count and idx + 1 < len(sorted_dist):
+            return (sorted_dist[idx][0] + sorted_dist[idx + 1][0]) / 2
+        return sorted_dist[idx][0]
 
     @staticmethod
-    def count_lines_in_file(file_path : str) -> int:
-        """Count lines in a text file
+    def count_lines_in_file(file_path : str, nof_processes : int = 1) -> int:
+        """Count lines in a text file. The file is memory-mapped and split into byte ranges that are counted in
+        parallel, if ``nof_processes`` is larger than 1
 
         :param file_path: The path to the text file
+        :param nof_processes: The number of processes counting line breaks, defaults to 1
         :return: Returns the number of lines
         """
         if not os.path.exists(file_path) or not os.path.isfile(file_path):
             raise AttributeError('Filepath "' + file_path + '" does not exist or is not a file')
+        if nof_processes < 1:
+            raise AttributeError('Number of processes must be at least 1')
+        file_size = os.path.getsize(file_path)
+        chunk_size = max(-(-file_size // nof_processes), _MMAP_BLOCK_SIZE)
+        ranges = [(start, min(start + chunk_size, file_size)) for start in range(0, file_size, chunk_size)]
+        return sum(BaseUtils.__count_in_byte_ranges(file_path, b'\n', ranges, nof_processes))
+
+    @staticmethod
+    def split_csv_file(file_path : str, nof_chunks : int, quotechar : str = '"',
+                       nof_processes : int = 1) -> List[Tuple[int, int]]:
+        """Split the records of a CSV file (without the header) into byte ranges of roughly equal size. All ranges
+        start and end at record boundaries, line breaks within quoted fields are respected. Each range can be read
+        independently, e.g. with the ``byte_range`` parameter of :class:`~graphxplore.Basis.RelationalDataIODevice`.
+        The file encoding must be ASCII-compatible (e.g. UTF-8 or Latin-1)
+
+        :param file_path: The path to the CSV file
+        :param nof_chunks: The maximal number of chunks. Fewer chunks are returned for small files
+        :param quotechar: The quote character of the CSV file, defaults to '"'
+        :param nof_processes: The number of processes counting quote characters, defaults to 1
+        :return: Returns the byte ranges as list of start (inclusive) and end (exclusive) offset
+        """
+        if not os.path.exists(file_path) or not os.path.isfile(file_path):
+            raise AttributeError('Filepath "' + file_path + '" does not exist or is not a file')
+        if nof_chunks < 1:
+            raise AttributeError('Number of chunks must be at least 1')
+        if nof_processes < 1:
+            raise AttributeError('Number of processes must be at least 1')
+        file_size = os.path.getsize(file_path)
+        if file_size == 0:
+            return []
+        quote = quotechar.encode('ascii')
         with open(file_path, 'rb') as file:
-            line_counter = 0
-            raw_data = file.read(10000000)
-            while raw_data:
-                line_counter += raw_data.count(b'\n')
-                raw_data = file.read(10000000)
-            return line_counter
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                data_start = _find_record_end(mapped, 0, False, quote)
+                if data_start >= file_size:
+                    return []
+                chunk_size = -(-(file_size - data_start) // nof_chunks)
+                targets = list(range(data_start + chunk_size, file_size, chunk_size))
+                # quote parity at each target offset determines, if a line break ends a record
+                quote_counts = BaseUtils.__count_in_byte_ranges(
+                    file_path, quote, list(zip([data_start] + targets, targets)), nof_processes)
+                boundaries = [data_start]
+                in_quotes = False
+                for target, quote_count in zip(targets, quote_counts):
+                    in_quotes = in_quotes != (quote_count % 2 == 1)
+                    if target > boundaries[-1]:
+                        boundaries.append(_find_record_end(mapped, target, in_quotes, quote))
+                boundaries.append(file_size)
+        return [(start, end) for start, end in zip(boundaries[:-1], boundaries[1:]) if start < end]
+
+    @staticmethod
+    def sample_csv_file(file_path : str, nof_blocks : int, block_fraction : float, seed : int = 0,
+                        quotechar : str = '"') -> List[Tuple[int, int]]:
+        """Sample record-aligned byte ranges at random offsets of a CSV file. The records (without the header) are
+        split into ``nof_blocks`` strata with :meth:`split_csv_file`. In each stratum, a random start offset is
+        selected in the leading part, such that a ``block_fraction`` of the stratum remains to be read. Each byte range
+        starts at the record boundary following this offset and ends with the stratum, such that the ranges never
+        overlap. Reading the leading records of each range yields a stratified sample of the file. Only the quote
+        characters of the skipped bytes are counted, the records themselves are not parsed
+
+        :param file_path: The path to the CSV file
+        :param nof_blocks: The maximal number of sampled byte ranges. Fewer ranges are returned for small files
+        :param block_fraction: The fraction of each stratum that should remain after the start offset, between 0 and 1
+        :param seed: The seed of the random offsets, defaults to 0
+        :param quotechar: The quote character of the CSV file, defaults to '"'
+        :return: Returns the byte ranges as list of start (inclusive) and end (exclusive) offset
+        """
+        if block_fraction <= 0 or block_fraction > 1:
+            raise AttributeError('Block fraction must be larger than 0 and at most 1')
+        strata = BaseUtils.split_csv_file(file_path, nof_blocks, quotechar)
+        quote = quotechar.encode('ascii')
+        rng = random.Random(seed)
+        result = []
+        with open(file_path, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for stratum_start, stratum_end in strata:
+                    offset = stratum_start + int(rng.random() * (1 - block_fraction) * (stratum_end - stratum_start))
+                    if offset == stratum_start:
+                        result.append((stratum_start, stratum_end))
+                        continue
+                    # strata start at record boundaries, the quote parity of the skipped bytes gives the quote state
+                    in_quotes = _count_in_byte_range((file_path, quote, stratum_start, offset)) % 2 == 1
+                    start = _find_record_end(mapped, offset, in_quotes, quote)
+                    if start < stratum_end:
+                        result.append((start, stratum_end))
+        return result
+
+    @staticmethod
+    def reservoir_sample(items : Iterable[Any], sample_size : int, seed : int = 0) -> List[Any]:
+        """Draw a uniform random sample from an iterable of unknown length in a single pass (reservoir sampling with
+        geometric skips). Only ``sample_size`` items are kept in memory. If the iterable contains at most
+        ``sample_size`` items, all items are returned in their original order
+
+        :param items: The iterable
+        :param sample_size: The number of sampled items
+        :param seed: The seed of the random selection, defaults to 0
+        :return: Returns the sampled items
+        """
+        if sample_size < 1:
+            raise AttributeError('Sample size must be at least 1')
+        item_iter = iter(items)
+        reservoir = list(itertools.islice(item_iter, sample_size))
+        if len(reservoir) < sample_size:
+            return reservoir
+        rng = random.Random(seed)
+        log_random = lambda: math.log(1.0 - rng.random())
+        end_marker = object()
+        weight = math.exp(log_random() / sample_size)
+        while True:
+            # number of items skipped before the next replacement
+            skip = math.floor(log_random() / math.log(1 - weight)) if weight < 1 else 0
+            item = next(itertools.islice(item_iter, skip, None), end_marker)
+            if item is end_marker:
+                return reservoir
+            reservoir[rng.randrange(sample_size)] = item
+            weight *= math.exp(log_random() / sample_size)
+
+    @staticmethod
+    def open_byte_range(file_path : str, start : int, end : int, encoding : str) -> io.TextIOBase:
+        """Open a byte range of a text file for reading. Can be used as file object for :func:`csv.reader`
+
+        :param file_path: The path to the text file
+        :param start: The start offset (inclusive)
+        :param end: The end offset (exclusive)
+        :param encoding: The file encoding
+        :return: Returns the opened text stream
+        """
+        if not os.path.exists(file_path) or not os.path.isfile(file_path):
+            raise AttributeError('Filepath "' + file_path + '" does not exist or is not a file')
+        if start < 0 or end < start:
+            raise AttributeError('Invalid byte range from ' + str(start) + ' to ' + str(end))
+        return io.TextIOWrapper(io.BufferedReader(_ByteRangeFile(file_path, start, end)), encoding=encoding)
+
+    @staticmethod
+    def __count_in_byte_ranges(file_path : str, pattern : bytes, ranges : List[Tuple[int, int]],
+                               nof_processes : int) -> List[int]:
+        """Count the occurrences of a byte pattern in byte ranges of a memory-mapped file, optionally in parallel
+
+        :param file_path: The path to the file
+        :param pattern: The byte pattern
+        :param ranges: The byte ranges as start (inclusive) and end (exclusive) offset
+        :param nof_processes: The number of processes
+        :return: Returns the counts per range
+        """
+        tasks = [(file_path, pattern, start, end) for start, end in ranges]
+        if nof_processes == 1 or len(tasks) < 2:
+            return [_count_in_byte_range(task) for task in tasks]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(nof_processes, len(tasks))) as executor:
+            return list(executor.map(_count_in_byte_range, tasks))
 
     @staticmethod
     def file_has_more_lines(file_path: str, threshold : int) -> bool:
@@ -338,4 +789,72 @@ class BaseUtils:
             while raw_data and line_counter < threshold:
                 line_counter += raw_data.count(b'\n')
                 raw_data = file.read(100000)
-            return line_counter > threshold
\ No newline at end of file
+            return line_counter > threshold
+
+_MMAP_BLOCK_SIZE = 10000000
+
+def _find_record_end(data : Union[mmap.mmap, bytes], position : int, in_quotes : bool, quote : bytes) -> int:
+    """Find the offset after the next line break that ends a CSV record, starting from ``position`` with a known
+    quote state
+
+    :param data: The memory-mapped file or raw bytes
+    :param position: The start offset of the search
+    :param in_quotes: ``True``, if ``position`` is within a quoted field
+    :param quote: The quote character
+    :return: Returns the offset after the line break, or the data size, if no further record boundary exists
+    """
+    while True:
+        line_end = data.find(b'\n', position)
+        if line_end == -1:
+            return len(data)
+        in_quotes = in_quotes != (data[position:line_end].count(quote) % 2 == 1)
+        position = line_end + 1
+        if not in_quotes:
+            return position
+
+def _count_in_byte_range(task : Tuple[str, bytes, int, int]) -> int:
+    """Count the occurrences of a byte pattern in a byte range of a file. Module-level to be usable in a process pool
+
+    :param task: The file path, byte pattern, start offset (inclusive) and end offset (exclusive)
+    :return: Returns the count
+    """
+    file_path, pattern, start, end = task
+    if end <= start:
+        return 0
+    with open(file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            count = 0
+            for block_start in range(start, end, _MMAP_BLOCK_SIZE):
+                count += mapped[block_start:min(block_start + _MMAP_BLOCK_SIZE, end)].count(pattern)
+            return count
+
+class _ByteRangeFile(io.RawIOBase):
+    """Raw binary stream restricted to a byte range of a file
+
+    :param file_path: The path to the file
+    :param start: The start offset (inclusive)
+    :param end: The end offset (exclusive)
+    """
+    def __init__(self, file_path : str, start : int, end : int):
+        """Constructor method
+        """
+        super().__init__()
+        self.file = open(file_path, 'rb')
+        self.file.seek(start)
+        self.remaining = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self.remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:self.remaining]
+        nof_read = self.file.readinto(view)
+        self.remaining -= nof_read
+        return nof_read
+
+    def close(self):
+        if not self.closed:
+            self.file.close()
+        super().close()
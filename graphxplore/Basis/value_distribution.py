@@ -0,0 +1,201 @@
+import math
+import numpy as np
+from fractions import Fraction
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+# integers beyond this magnitude are not exactly representable as floats and stored as Python objects instead
+_MAX_SAFE_INT = 2 ** 53
+
+class ValueDistribution:
+    """This class stores a distribution of numeric values and their counts as NumPy arrays sorted by value together with
+    cumulative counts. The distribution is sorted once, afterwards quantiles, minimum, maximum and histograms are
+    answered by binary search in O(log n). Mean and standard deviation are calculated once on first request. Use
+    :meth:`from_dict` to create a distribution from a dictionary of values and counts.
+
+    :param sorted_values: The distinct values in ascending order
+    :param counts: The counts of the values
+    """
+    def __init__(self, sorted_values : Union[np.ndarray, Sequence[Union[int, float]]],
+                 counts : Union[np.ndarray, Sequence[int]]):
+        """Constructor method
+        """
+        self.values = sorted_values if isinstance(sorted_values, np.ndarray) \
+            else ValueDistribution.values_to_array(sorted_values)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        if len(self.values) != len(self.counts):
+            raise AttributeError('Number of values and counts of value distribution must be equal')
+        self.cum_counts = np.cumsum(self.counts)
+        self.total_count = int(self.cum_counts[-1]) if len(self.cum_counts) > 0 else 0
+        self.__mean = None
+        self.__std = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def get_min(self) -> Optional[Union[int, float]]:
+        """Get the minimal value
+
+        :return: Returns the minimum or `None` for empty distributions
+        """
+        if len(self.values) == 0:
+            return None
+        return self.values[:1].tolist()[0]
+
+    def get_max(self) -> Optional[Union[int, float]]:
+        """Get the maximal value
+
+        :return: Returns the maximum or `None` for empty distributions
+        """
+        if len(self.values) == 0:
+            return None
+        return self.values[-1:].tolist()[0]
+
+    def get_mean(self) -> Optional[float]:
+        """Get the mean of the distribution
+
+        :return: Returns the mean or `None` for empty distributions
+        """
+        if len(self.values) == 0:
+            return None
+        if self.__mean is None:
+            self.__mean = float(np.dot(self.values.astype(np.float64), self.counts)) / self.total_count
+        return self.__mean
+
+    def get_std(self, mean : Optional[float] = None) -> Optional[float]:
+        """Get the standard deviation of the distribution. A precalculated mean can be specified
+
+        :param mean: The precalculated mean, defaults to None
+        :return: Returns the standard deviation or `None` for empty distributions
+        """
+        if len(self.values) == 0:
+            return None
+        if mean is not None:
+            return ValueDistribution.__calculate_std(self.values, self.counts, self.total_count, mean)
+        if self.__std is None:
+            self.__std = ValueDistribution.__calculate_std(self.values, self.counts, self.total_count,
+                                                           self.get_mean())
+        return self.__std
+
+    def get_quantile(self, fraction : Union[float, Fraction]) -> Optional[Union[int, float]]:
+        """Get a quantile of the distribution. The quantile is the smallest value, for which the accumulated count
+        reaches ``fraction`` of the total count. If the accumulated count hits this share exactly, the mean of the value
+        and the next larger value is returned, e.g. the median of an even number of values. The fraction is treated as
+        exact rational number, such that quartiles and quintiles are not affected by floating point errors
+
+        :param fraction: The fraction of the total count between 0 and 1, e.g. 0.5 for the median
+        :return: Returns the quantile or `None` for empty distributions
+        """
+        if fraction < 0 or fraction > 1:
+            raise AttributeError('Quantile fraction must be between 0 and 1')
+        if len(self.values) == 0:
+            return None
+        fraction = Fraction(fraction).limit_denominator(1000000)
+        min_count, border_count = ValueDistribution.get_quantile_counts(self.total_count, fraction.numerator,
+                                                                        fraction.denominator)
+        idx = int(np.searchsorted(self.cum_counts, min_count, side='left'))
+        if int(self.cum_counts[idx]) == border_count and idx + 1 < len(self.values):
+            lower_val, upper_val = self.values[idx:idx + 2].tolist()
+            return (lower_val + upper_val) / 2
+        return self.values[idx:idx + 1].tolist()[0]
+
+    @staticmethod
+    def get_quantile_counts(total_count : int, numerator : int, denominator : int) -> Tuple[int, Optional[int]]:
+        """Get the accumulated counts determining a quantile. The quantile is the first value whose accumulated count
+        reaches the minimal count. If its accumulated count equals the border count, the quantile is the mean of the
+        value and the next larger value. The fraction of the quantile is given as exact rational number
+
+        :param total_count: The total count of the distribution
+        :param numerator: The numerator of the fraction of the total count
+        :param denominator: The denominator of the fraction of the total count
+        :return: Returns the minimal count and the border count, or ``None`` if the exact share is no integer
+        """
+        threshold = total_count * numerator
+        min_count = -(-threshold // denominator)
+        border_count = min_count if threshold % denominator == 0 else None
+        return min_count, border_count
+
+    def get_median_quartiles(self) -> Optional[Tuple[Union[int, float], Union[int, float], Union[int, float]]]:
+        """Get the median, first quartile and third quartile of the distribution
+
+        :return: Returns the median, first quartile and third quartile, or `None` for empty distributions
+        """
+        if len(self.values) == 0:
+            return None
+        return self.get_quantile(Fraction(1, 2)), self.get_quantile(Fraction(1, 4)), self.get_quantile(Fraction(3, 4))
+
+    def get_count_in_range(self, lower : Union[int, float], upper : Union[int, float]) -> int:
+        """Get the accumulated count of all values between ``lower`` and ``upper`` (both inclusive)
+
+        :param lower: The lower bound
+        :param upper: The upper bound
+        :return: Returns the accumulated count
+        """
+        if len(self.values) == 0 or lower > upper:
+            return 0
+        start = int(np.searchsorted(self.values, lower, side='left'))
+        end = int(np.searchsorted(self.values, upper, side='right'))
+        return self.__get_accumulated_count(end) - self.__get_accumulated_count(start)
+
+    def get_histogram(self, bin_edges : Sequence[Union[int, float]]) -> List[int]:
+        """Get the accumulated counts of values within bins. Like in :func:`numpy.histogram`, all bins are half-open
+        intervals including the lower edge, except the last one which also includes the upper edge
+
+        :param bin_edges: The bin edges in ascending order, at least two
+        :return: Returns the accumulated count of each bin
+        """
+        if len(bin_edges) < 2:
+            raise AttributeError('At least two bin edges must be specified')
+        if any(bin_edges[idx] > bin_edges[idx + 1] for idx in range(len(bin_edges) - 1)):
+            raise AttributeError('Bin edges must be in ascending order')
+        if len(self.values) == 0:
+            return [0] * (len(bin_edges) - 1)
+        positions = np.searchsorted(self.values, bin_edges[:-1], side='left').tolist()
+        positions.append(int(np.searchsorted(self.values, bin_edges[-1], side='right')))
+        accumulated = [self.__get_accumulated_count(position) for position in positions]
+        return [accumulated[idx + 1] - accumulated[idx] for idx in range(len(accumulated) - 1)]
+
+    def __get_accumulated_count(self, position : int) -> int:
+        """Get the accumulated count of all values before a position
+
+        :param position: The position in the sorted values
+        :return: Returns the accumulated count
+        """
+        return int(self.cum_counts[position - 1]) if position > 0 else 0
+
+    @staticmethod
+    def __calculate_std(values : np.ndarray, counts : np.ndarray, total_count : int, mean : float) -> float:
+        deviations = mean - values.astype(np.float64)
+        return math.sqrt(float(np.dot(counts, deviations * deviations)) / total_count)
+
+    @staticmethod
+    def from_dict(value_dist : Dict[Union[int, float], int]) -> 'ValueDistribution':
+        """Create a distribution from a dictionary with distribution values as keys and counts as values
+
+        :param value_dist: The distribution dictionary
+        :return: Returns the sorted distribution
+        """
+        values = ValueDistribution.values_to_array(list(value_dist.keys()))
+        order = np.argsort(values, kind='stable')
+        counts = np.fromiter(value_dist.values(), dtype=np.int64, count=len(value_dist))
+        return ValueDistribution(values[order], counts[order])
+
+    @staticmethod
+    def values_to_array(values : Sequence[Union[int, float]]) -> np.ndarray:
+        """Converts numeric values to a NumPy array. Integers are stored as 64 bit integers, if they are exactly
+        representable as floats. Larger integers are kept as Python objects, such that comparisons with floats are
+        exact
+
+        :param values: The values
+        :return: Returns the array
+        """
+        try:
+            array = np.array(values)
+        except OverflowError:
+            return np.array(values, dtype=object)
+        if array.dtype.kind in 'iub':
+            if len(array) > 0 and (array.max() > _MAX_SAFE_INT or array.min() < -_MAX_SAFE_INT):
+                return np.array(values, dtype=object)
+            return array.astype(np.int64)
+        if array.dtype.kind not in 'fO':
+            raise AttributeError('Values of value distribution must be numeric')
+        return array
@@ -46,13 +46,26 @@ class DashboardBuilder:
                                  'at least one group will be present')
         self.full_table_group = full_table_group
         if groups is not None:
+            meta_hash = None
+            meta_dict = None
+            # metadata objects shared by multiple groups are only compared once
+            matching_metas = set()
             for group_name, group_selector in groups.items():
                 if group_selector.group_table != main_table:
                     raise AttributeError('Group table of group "' + group_name
                                          + '" does not match main table of dashboard builder')
-                if group_selector.meta.to_dict() != self.meta.to_dict():
-                    raise AttributeError('Metadata of group "' + group_name
-                                         + '" does not match metadata of dashboard builder')
+                if group_selector.meta is self.meta or id(group_selector.meta) in matching_metas:
+                    continue
+                if meta_hash is None:
+                    meta_hash = self.meta.get_content_hash()
+                if group_selector.meta.get_content_hash() != meta_hash:
+                    # equal content can have different hashes, e.g. for 1 and 1.0
+                    if meta_dict is None:
+                        meta_dict = self.meta.to_dict()
+                    if group_selector.meta.to_dict() != meta_dict:
+                        raise AttributeError('Metadata of group "' + group_name
+                                             + '" does not match metadata of dashboard builder')
+                matching_metas.add(id(group_selector.meta))
             self.groups = groups
         else:
             self.groups = {}
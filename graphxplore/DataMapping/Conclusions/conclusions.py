@@ -1,5 +1,6 @@
 from typing import Union, Dict, List, Optional, Tuple
 from graphxplore.MetaDataHandling.meta_data import  VariableInfo, DataType
+from graphxplore.MetaDataHandling import CastMemo
 from ..data_aggregator import AggregatorType, AggregatorParser
 from ..data_structure_transformer import SourceDataLine
 
@@ -51,6 +52,7 @@ class CopyConclusion(Conclusion):
         super().__init__(target_data_type)
         self.origin_table = origin_table
         self.var_to_copy = var_to_copy
+        self.cast_memo = CastMemo(target_data_type)
 
     def get_required_data(self) -> Dict[str, List[Tuple[str, Optional[Tuple[AggregatorType, DataType]]]]]:
         return {self.origin_table : [(self.var_to_copy, None)]}
@@ -59,7 +61,7 @@ class CopyConclusion(Conclusion):
         raw_copy_val = source_data.get_singular_value(self.origin_table, self.var_to_copy)
         if raw_copy_val is None:
             return None
-        return VariableInfo.cast_value(raw_copy_val, self.target_data_type)
+        return self.cast_memo.cast(raw_copy_val)
 
     def __str__(self):
         return ('COPY VARIABLE ' + self.var_to_copy + ' IN TABLE ' + self.origin_table + ' IF TYPE IS '
@@ -1,7 +1,7 @@
 import collections
 from enum import Enum
 from typing import Union, Iterable, Tuple, Dict, List, Optional
-from graphxplore.MetaDataHandling import DataType, VariableInfo
+from graphxplore.MetaDataHandling import DataType, VariableInfo, CastMemo
 from ..data_structure_transformer import SourceDataLine
 from ..data_aggregator import AggregatorType, AggregatorParser
 
@@ -120,6 +120,7 @@ class AtomicOperator(LogicOperator):
         self.table = table
         self.variable = variable
         self.data_type = data_type
+        self.cast_memo = CastMemo(data_type)
 
     def get_required_data(self) -> Dict[str, List[Tuple[str, Optional[Tuple[AggregatorType, DataType]]]]]:
         return {self.table: [(self.variable, ((self.aggregator, self.data_type)
@@ -203,7 +204,7 @@ class InListOperator(AtomicOperator):
         raw_val = source_data.get_singular_value(self.table, self.variable)
         if raw_val is None:
             return False
-        casted_val = VariableInfo.cast_value(raw_val, self.data_type)
+        casted_val = self.cast_memo.cast(raw_val)
         if casted_val is None:
             return False
         return str(raw_val) in self.white_list
@@ -320,7 +321,7 @@ class MetricOperator(AtomicOperator):
         raw_val = source_data.get_singular_value(self.table, self.variable)
         if raw_val is None:
             return False
-        casted_val = VariableInfo.cast_value(raw_val, self.data_type)
+        casted_val = self.cast_memo.cast(raw_val)
         if casted_val is None:
             return False
         return MetricOperator.check_value(casted_val, self.value, self.compare)
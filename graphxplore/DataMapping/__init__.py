@@ -4,9 +4,11 @@ from .data_transformation import DataTransformation
 from .data_structure_transformer import (DataFlattener, CSVDataFlattener, DataSegmentor, SourceDataType, SourceDataLine,
                                          TableMappingType)
 from .meta_lattice import MetaLattice
+from .artifact_cleaner import ArtifactCleaner
 from .mapping_utils import DataMappingUtils
 from .data_aggregator import AggregatedData, AggregatorType, AggregatorParser, DataAggregator, CSVDataAggregator
 
 __all__ = ['MappingCase', 'VariableMapping', 'DataTransformation', 'DataFlattener', 'CSVDataFlattener', 'DataSegmentor',
            'SourceDataType', 'TableMappingType', 'MetaLattice', 'DataMappingUtils', 'AggregatedData', 'TableMapping',
-           'AggregatorType', 'AggregatorParser', 'SourceDataLine', 'DataAggregator', 'CSVDataAggregator', 'DataMapping']
+           'AggregatorType', 'AggregatorParser', 'SourceDataLine', 'DataAggregator', 'CSVDataAggregator', 'DataMapping',
+           'ArtifactCleaner']
@@ -0,0 +1,281 @@
+import os
+import io
+import csv
+import itertools
+import operator
+import concurrent.futures
+from typing import Union, Optional, Dict, List, Tuple, Iterable, Iterator, Sequence, Callable
+from graphxplore.Basis import RelationalDataIODevice, BaseUtils, CSVFormatCache, TableSource
+from graphxplore.MetaDataHandling import MetaData, DataType
+
+class ArtifactCleaner:
+    """This class copies a dataset table by table while deleting artifacts. In contrast to
+    :meth:`DataMappingUtils.get_copy_mapping` in combination with :class:`DataTransformation`, tables are not flattened
+    and no mapping cases are evaluated. Rows are read in chunks as tuples and each column of a chunk is cleaned at
+    once: Artifacts are deleted and values are cast to the data type of their variable. Values that cannot be cast are
+    deleted as well. Primary keys are copied as they are. If source and target are directories and ``nof_processes``
+    is larger than 1, tables are split into byte ranges that are cleaned in a process pool and written in their
+    original order. The written files are identical to those written by a single process.
+
+    :param meta: The metadata of the source dataset, all tables need an assigned primary key
+    :param delete_artifacts: If ``True`` artifacts are deleted. Otherwise, variables with artifacts are copied as
+        strings, defaults to True
+    :param nof_processes: The number of processes cleaning byte ranges of CSV files, defaults to 1
+    :param rows_per_chunk: The approximate number of rows cleaned at once, defaults to 100000
+    :param file_encoding: Specifies the file encoding of all source tables, if read from a CSV. Will be detected if
+        not specified, defaults to None
+    """
+    def __init__(self, meta : MetaData, delete_artifacts : bool = True, nof_processes : int = 1,
+                 rows_per_chunk : int = 100000, file_encoding : Optional[str] = None):
+        """Constructor method
+        """
+        if nof_processes < 1:
+            raise AttributeError('Number of processes must be at least 1')
+        if rows_per_chunk < 1:
+            raise AttributeError('Number of rows per chunk must be at least 1')
+        self.meta = meta
+        self.delete_artifacts = delete_artifacts
+        self.nof_processes = nof_processes
+        self.rows_per_chunk = rows_per_chunk
+        self.file_encoding = file_encoding
+        self.column_specs = {table : self.__get_column_specs(table) for table in self.meta.get_table_names()}
+
+    def __get_column_specs(self, table : str) -> List[Tuple[str, DataType, Optional[frozenset]]]:
+        """Get the name, target data type and artifacts of all variables of a table. The primary key comes first and
+        is copied as string
+
+        :param table: The table name
+        :return: Returns the column specifications in header order
+        """
+        if not self.meta.has_primary_key(table):
+            raise AttributeError('Before copying, the source table "' + table + '" needs an assigned primary key')
+        primary_key = self.meta.get_primary_key(table)
+        specs = [(primary_key, DataType.String, None)]
+        for variable in self.meta.get_variable_names(table):
+            if variable == primary_key:
+                continue
+            var_info = self.meta.get_variable(table, variable)
+            if var_info.artifacts is None or len(var_info.artifacts) == 0:
+                specs.append((variable, var_info.data_type, None))
+            elif self.delete_artifacts:
+                specs.append((variable, var_info.data_type,
+                              frozenset(str(artifact) for artifact in var_info.artifacts)))
+            else:
+                specs.append((variable, DataType.String, None))
+        return specs
+
+    def clean_dataset(self, data_source : Union[str, Dict[str, List[Dict[str, str]]], TableSource],
+                      data_target : Union[str, Dict[str, List[Dict[str, str]]], TableSource]) -> None:
+        """Copies all tables of the metadata from a data source to a data target while deleting artifacts
+
+        :param data_source: The path to a directory where the CSV files are read from, a data dictionary or a table
+            source where data is retrieved
+        :param data_target: The path to a directory where the resulting CSV files are written to, a data dictionary or
+            a table source where data is inserted
+        """
+        available_tables = RelationalDataIODevice.get_available_table_names(data_source)
+        for table in self.meta.get_table_names():
+            if table not in available_tables:
+                raise AttributeError('Table "' + table + '" does not exist in data source')
+        RelationalDataIODevice.check_data_location(data_target, write=True)
+        # check all columns before any target file is written
+        encodings = {}
+        if isinstance(data_source, str):
+            for table, specs in self.column_specs.items():
+                file_format = CSVFormatCache.get_format(os.path.join(data_source, table + '.csv'), self.file_encoding)
+                _get_record_getter(table, file_format.header, [spec[0] for spec in specs])
+                encodings[table] = file_format.encoding
+        if self.nof_processes > 1 and isinstance(data_source, str) and isinstance(data_target, str):
+            self.__clean_tables_parallel(data_source, data_target, encodings)
+            return
+        for table in self.meta.get_table_names():
+            print('Cleaning table "' + table + '"')
+            specs = self.column_specs[table]
+            header = [spec[0] for spec in specs]
+            if isinstance(data_source, str):
+                records = _iterate_csv_records(data_source, table, header, self.file_encoding)
+            else:
+                records = ArtifactCleaner.__iterate_records(data_source, table, header)
+            chunks = iter(lambda: list(itertools.islice(records, self.rows_per_chunk)), [])
+            if isinstance(data_target, str):
+                encoding = encodings.get(table, 'utf-8')
+                with open(os.path.join(data_target, table + '.csv'), encoding=encoding, mode='w') as file:
+                    writer = csv.writer(file)
+                    writer.writerow(header)
+                    for chunk in chunks:
+                        writer.writerows(ArtifactCleaner.clean_rows(chunk, specs))
+            else:
+                with RelationalDataIODevice(data_target, table, write=True, header=header) as writer:
+                    for chunk in chunks:
+                        for row in ArtifactCleaner.clean_rows(chunk, specs):
+                            writer.writerow(dict(zip(header, row)))
+
+    def __clean_tables_parallel(self, data_source : str, data_target : str, encodings : Dict[str, str]) -> None:
+        """Splits all CSV files into byte ranges of about ``self.rows_per_chunk`` rows, cleans them in a process pool
+        and writes the results in order.
+
+        :param data_source: The path to the source directory
+        :param data_target: The path to the target directory
+        :param encodings: The file encodings of the source tables, which are used for the target tables as well
+        """
+        tasks = {}
+        for table in self.meta.get_table_names():
+            file_path = os.path.join(data_source, table + '.csv')
+            nof_chunks = max(-(-BaseUtils.count_lines_in_file(file_path) // self.rows_per_chunk), 1)
+            tasks[table] = [(table, byte_range) for byte_range in BaseUtils.split_csv_file(file_path, nof_chunks)]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.nof_processes,
+                                                    initializer=_init_cleaning_worker,
+                                                    initargs=((data_source, self.file_encoding, self.column_specs),)
+                                                    ) as executor:
+            futures = {table : [executor.submit(_clean_csv_chunk, task) for task in table_tasks]
+                       for table, table_tasks in tasks.items()}
+            for table, table_futures in futures.items():
+                print('Cleaning table "' + table + '" (' + str(len(table_futures)) + ' chunk'
+                      + ('s' if len(table_futures) != 1 else '') + ')')
+                with open(os.path.join(data_target, table + '.csv'), encoding=encodings[table], mode='w') as file:
+                    csv.writer(file).writerow([spec[0] for spec in self.column_specs[table]])
+                    for future in table_futures:
+                        file.write(future.result())
+
+    @staticmethod
+    def __iterate_records(data_source : Union[Dict[str, List[Dict[str, str]]], TableSource], table : str,
+                          header : List[str]) -> Iterator[Tuple]:
+        """Iterates over the rows of a table of a data dictionary or table source as tuples in header order
+
+        :param data_source: The data dictionary or table source
+        :param table: The table name
+        :param header: The columns to read
+        :return: Returns an iterator over the records
+        """
+        with RelationalDataIODevice(data_source, table, columns=header) as reader:
+            get_record = operator.itemgetter(*header) if len(header) > 1 else lambda row: (row[header[0]],)
+            for row in reader:
+                yield get_record(row)
+
+    @staticmethod
+    def clean_rows(rows : Sequence[Sequence[Optional[Union[str, int, float]]]],
+                   column_specs : List[Tuple[str, DataType, Optional[frozenset]]]) -> List[Tuple[str, ...]]:
+        """Cleans a chunk of rows column by column
+
+        :param rows: The rows with values in the order of ``column_specs``
+        :param column_specs: The name, target data type and artifacts (or ``None``) of each column
+        :return: Returns the cleaned rows as string tuples
+        """
+        if len(rows) == 0:
+            return []
+        return list(zip(*[ArtifactCleaner.clean_column(values, data_type, artifacts)
+                          for values, (_, data_type, artifacts) in zip(zip(*rows), column_specs)]))
+
+    @staticmethod
+    def clean_column(values : Sequence[Optional[Union[str, int, float]]], data_type : DataType,
+                     artifacts : Optional[Iterable[str]] = None) -> List[str]:
+        """Deletes artifacts and casts the values of a column to a data type. Artifacts, missing values and values that
+        cannot be cast are replaced by empty strings. The result matches :meth:`VariableInfo.cast_value` with
+        subsequent string conversion
+
+        :param values: The column values
+        :param data_type: The data type the values are cast to
+        :param artifacts: The artifacts as strings, defaults to None
+        :return: Returns the cleaned values as strings
+        """
+        if data_type == DataType.Integer:
+            cast = int
+        elif data_type == DataType.Decimal:
+            cast = float
+        else:
+            cast = str
+        try:
+            cleaned = [str(cast(value)) for value in values]
+        except (ValueError, TypeError):
+            cleaned = [ArtifactCleaner.__cast_to_string(value, cast) for value in values]
+        if cast == str:
+            # missing values would be converted to 'None' otherwise
+            cleaned = ['' if value is None else cleaned_value for value, cleaned_value in zip(values, cleaned)]
+        if artifacts is not None:
+            artifacts = artifacts if isinstance(artifacts, (set, frozenset)) else set(artifacts)
+            cleaned = ['' if str(value) in artifacts else cleaned_value
+                       for value, cleaned_value in zip(values, cleaned)]
+        return cleaned
+
+    @staticmethod
+    def __cast_to_string(value : Optional[Union[str, int, float]], cast : Callable) -> str:
+        try:
+            return str(cast(value))
+        except (ValueError, TypeError):
+            return ''
+
+def _get_record_getter(table : str, file_header : List[str], columns : List[str]) -> Callable[[List[str]], Tuple]:
+    """Get a function extracting the values of the specified columns from CSV rows as tuples. For duplicate column
+    names, the last occurrence is used as in :class:`csv.DictReader`. Missing fields of short rows are ``None``
+
+    :param table: The table name
+    :param file_header: The header of the CSV file
+    :param columns: The columns to extract
+    :return: Returns the extraction function
+    """
+    positions = {column : idx for idx, column in enumerate(file_header)}
+    for column in columns:
+        if column not in positions:
+            raise AttributeError('Column "' + column + '" does not exist in table "' + table + '"')
+    indices = [positions[column] for column in columns]
+    get_values = operator.itemgetter(*indices) if len(indices) > 1 else lambda csv_row: (csv_row[indices[0]],)
+    min_row_length = max(indices) + 1
+
+    def get_record(csv_row : List[str]) -> Tuple:
+        if len(csv_row) >= min_row_length:
+            return get_values(csv_row)
+        return tuple(csv_row[idx] if idx < len(csv_row) else None for idx in indices)
+    return get_record
+
+def _iterate_csv_records(data_source : str, table : str, columns : List[str], file_encoding : Optional[str] = None,
+                         byte_range : Optional[Tuple[int, int]] = None) -> Iterator[Tuple]:
+    """Iterates over the records of a CSV file or a byte range of it as tuples of the specified columns. Empty lines
+    are skipped
+
+    :param data_source: The path to the directory of the CSV file
+    :param table: The table name
+    :param columns: The columns to read
+    :param file_encoding: The file encoding, detected if not specified, defaults to None
+    :param byte_range: The byte range of start (inclusive) and end (exclusive) offset, the whole file is read if
+        ``None`` is specified, defaults to None
+    :return: Returns an iterator over the records
+    """
+    file_path = os.path.join(data_source, table + '.csv')
+    file_format = CSVFormatCache.get_format(file_path, file_encoding)
+    if byte_range is None:
+        file = open(file_path, encoding=file_format.encoding, mode='r')
+    else:
+        file = BaseUtils.open_byte_range(file_path, byte_range[0], byte_range[1], file_format.encoding)
+    with file:
+        reader = csv.reader(file, **file_format.get_format_params())
+        file_header = next(reader, []) if byte_range is None else file_format.header
+        get_record = _get_record_getter(table, file_header, columns)
+        for csv_row in reader:
+            if len(csv_row) > 0:
+                yield get_record(csv_row)
+
+_cleaning_settings = None
+
+def _init_cleaning_worker(settings : Tuple[str, Optional[str],
+                                           Dict[str, List[Tuple[str, DataType, Optional[frozenset]]]]]) -> None:
+    """Stores the source directory, file encoding and column specifications in a worker process of the parallel
+    artifact cleaning.
+
+    :param settings: The source directory, file encoding and column specifications per table
+    """
+    global _cleaning_settings
+    _cleaning_settings = settings
+
+def _clean_csv_chunk(task : Tuple[str, Tuple[int, int]]) -> str:
+    """Cleans a byte range of a CSV file in a worker process of the parallel artifact cleaning.
+
+    :param task: The table name and byte range
+    :return: Returns the cleaned records as CSV text
+    """
+    table, byte_range = task
+    data_source, file_encoding, column_specs = _cleaning_settings
+    specs = column_specs[table]
+    records = list(_iterate_csv_records(data_source, table, [spec[0] for spec in specs], file_encoding, byte_range))
+    output = io.StringIO()
+    csv.writer(output).writerows(ArtifactCleaner.clean_rows(records, specs))
+    return output.getvalue()
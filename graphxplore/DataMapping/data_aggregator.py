@@ -4,7 +4,7 @@ from enum import Enum
 import copy
 from typing import Union, Optional, Set, Tuple, Mapping, Iterable, Dict, List
 from .meta_lattice import MetaLattice
-from graphxplore.MetaDataHandling import DataType, MetaData, VariableInfo
+from graphxplore.MetaDataHandling import DataType, MetaData, VariableInfo, ValueFilter
 from graphxplore.Basis import BaseUtils, RelationalDataIODevice
 
 class AggregatorType(str, Enum):
@@ -75,6 +75,8 @@ class CSVDataAggregator(DataAggregator):
         # ancestor table -> ancestor primary key value -> start table -> start primary key value
         self.upward_key_relations = collections.defaultdict(lambda : collections.defaultdict(dict))
         self.file_encoding = file_encoding
+        # only empty cells are skipped, all other values are aggregated if they can be cast
+        self.value_filter = ValueFilter(missing_vals=('',))
 
     def aggregate_data(self) -> None:
         start_tables = self.lattice.max_elements
@@ -89,7 +91,11 @@ class CSVDataAggregator(DataAggregator):
                     queue.append(parent)
 
     def __extract_data(self, table : str):
-        with RelationalDataIODevice(self.data_source, table, file_encoding=self.file_encoding) as reader:
+        columns = [self.meta.get_primary_key(table)] + list(self.meta.get_foreign_keys(table).keys())
+        if table in self.required_vars:
+            columns += list(self.required_vars[table].keys())
+        with RelationalDataIODevice(self.data_source, table, file_encoding=self.file_encoding,
+                                    columns=columns) as reader:
             print('Loading data for aggregation from table "' + table + '"')
             is_start_table = table in self.lattice.max_elements
             primary_key = self.meta.get_primary_key(table)
@@ -109,7 +115,7 @@ class CSVDataAggregator(DataAggregator):
                     continue
                 for required_var in self.required_vars[table].keys():
                     val = line[required_var]
-                    if val != '':
+                    if not self.value_filter.is_missing(val):
                         for start_table, start_pk_value in self.upward_key_relations[table][pk_value].items():
                             data_to_aggregate[start_table][start_pk_value][required_var][val] += 1
             # aggregate data
@@ -133,7 +139,7 @@ class CSVDataAggregator(DataAggregator):
         pk_value = line[self.meta.get_primary_key(table)]
         for foreign_key, foreign_table in self.meta.get_foreign_keys(table).items():
             fk_value = line[foreign_key]
-            if fk_value != '':
+            if not self.value_filter.is_missing(fk_value):
                 if foreign_table in self.lattice.max_elements:
                     self.downward_key_relations[foreign_table][fk_value][table].append(pk_value)
                     self.upward_key_relations[table][pk_value][foreign_table] = fk_value
@@ -99,6 +99,21 @@ class MinimalTableDataReader:
     def __next__(self) -> Dict[str, Dict[str, Union[str, int, float]]]:
         raise NotImplemented('Never call abstract class')
 
+    @staticmethod
+    def get_required_columns(meta : MetaData, table : str, required_vars : Mapping[str, Iterable[str]]) -> List[str]:
+        """Get the primary key, foreign keys and required variables of a table as projection for
+        :class:`~graphxplore.Basis.RelationalDataIODevice`
+
+        :param meta: The :class:`MetaData` of the source dataset
+        :param table: The table name
+        :param required_vars: All variables required for the currently considered part of the mapping process
+        :return: Returns the column names without duplicates
+        """
+        columns = [meta.get_primary_key(table)] + list(meta.get_foreign_keys(table).keys())
+        if table in required_vars:
+            columns += list(required_vars[table])
+        return list(dict.fromkeys(columns))
+
 class CopyTableReader(MinimalTableDataReader):
     """This class reads data from a single minimal source table that has a one-to-one mapping with a target table.
 
@@ -145,15 +160,12 @@ class MergeTableReader(MinimalTableDataReader):
         merge_data = collections.defaultdict(dict)
         for table in self.tables:
             primary_key = self.meta.get_primary_key(table)
-            foreign_keys = self.meta.get_foreign_keys(table).keys()
-            with RelationalDataIODevice(self.data_source, table, file_encoding=self.encoding) as reader:
+            columns = self.get_required_columns(self.meta, table, self.required_vars)
+            with RelationalDataIODevice(self.data_source, table, file_encoding=self.encoding,
+                                        columns=columns) as reader:
                 print('Loading data from table to merge: ' + table)
                 for line in reader:
-                    merge_data[line[primary_key]][table] = {var: val for var, val in line.items()
-                                                            if var == primary_key
-                                                            or var in foreign_keys
-                                                            or (table in self.required_vars
-                                                                and var in self.required_vars[table])}
+                    merge_data[line[primary_key]][table] = line
         self.data = [line_dicts for primary_key, line_dicts in sorted(merge_data.items())]
         self.iter = iter(self.data)
         del merge_data
@@ -195,17 +207,12 @@ class ConcatenateTableReader(MinimalTableDataReader):
         except (StopIteration, TypeError):
             # throws correct StopIteration (not excepted) when all tables are read
             self.current_table = next(self.table_iter)
-            self.reader = RelationalDataIODevice(self.data_source, self.current_table, file_encoding=self.encoding).__enter__()
+            columns = self.get_required_columns(self.meta, self.current_table, self.required_vars)
+            self.reader = RelationalDataIODevice(self.data_source, self.current_table, file_encoding=self.encoding,
+                                                 columns=columns).__enter__()
             print('Start reading dynamic table ' + self.current_table)
             line = next(self.reader)
-        primary_key = self.meta.get_primary_key(self.current_table)
-        foreign_keys = self.meta.get_foreign_keys(self.current_table).keys()
-        trimmed_line = {var: val for var, val in line.items()
-                        if var == primary_key
-                        or var in foreign_keys
-                        or (self.current_table in self.required_vars
-                            and var in self.required_vars[self.current_table])}
-        return {self.current_table : trimmed_line}
+        return {self.current_table : line}
 
 class DataFlattener:
     """This class is the parent of all classes reading data from a source dataset and resolving all foreign key
@@ -293,14 +300,11 @@ class CSVDataFlattener(DataFlattener):
             if len(parents) == 0:
                 continue
             primary_key = self.meta.get_primary_key(table)
-            foreign_keys = self.meta.get_foreign_keys(table).keys()
-            with RelationalDataIODevice(self.data_source, table, file_encoding=self.file_encoding) as reader:
-                table_data = {line[primary_key] : {var : val for var, val in line.items() if var == primary_key
-                                                   or var in foreign_keys
-                                                   or (table in self.lattice_config.required_singular_vars
-                                                       and var in self.lattice_config.required_singular_vars[table])}
-                              for line in reader}
-                self.data[table] = table_data
+            columns = MinimalTableDataReader.get_required_columns(self.meta, table,
+                                                                  self.lattice_config.required_singular_vars)
+            with RelationalDataIODevice(self.data_source, table, file_encoding=self.file_encoding,
+                                        columns=columns) as reader:
+                self.data[table] = {line[primary_key] : line for line in reader}
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -378,7 +382,7 @@ class DataSegmentor:
         for table in self.meta.get_table_names():
             if table not in self.auto_data:
                 writer = RelationalDataIODevice(self.data_target, table, write=True,
-                                                header=self.meta.get_variable_names(table)).__enter__()
+                                                header=list(self.meta.get_variable_names(table))).__enter__()
                 self.writers[table] = writer
         return self
 
@@ -448,6 +452,6 @@ class DataSegmentor:
         # finished without exception, write cache to files
         if exc_type is None:
             for table, table_data in self.auto_data.items():
-                with RelationalDataIODevice(self.data_target, table, write=True, header=self.meta.get_variable_names(table)) as writer:
+                with RelationalDataIODevice(self.data_target, table, write=True, header=list(self.meta.get_variable_names(table))) as writer:
                     for row in table_data['rows'].values():
                         writer.writerow(row)
\ No newline at end of file
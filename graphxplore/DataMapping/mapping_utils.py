@@ -6,10 +6,10 @@ from graphxplore.Basis import RelationalDataIODevice
 from graphxplore.MetaDataHandling import MetaData, VariableInfo, DataType, VariableType
 from .data_mapping import DataMapping, TableMapping
 from .variable_mapping import VariableMapping, MappingCase
-from .data_transformation import DataTransformation
+from .artifact_cleaner import ArtifactCleaner
 from .Conclusions import CopyConclusion
 from .Conditionals import AlwaysTrueOperator, InListOperator, NegatedOperator
-from .data_structure_transformer import SourceDataType, TableMappingType
+from .data_structure_transformer import TableMappingType
 
 class DataMappingUtils:
     """This class contains static utility methods for data cleaning or adding primary keys.
@@ -36,9 +36,8 @@ class DataMappingUtils:
             source_var_info = source_meta.get_variable(source_table, source_var)
             var_dict = asdict(source_var_info)
             var_dict['table'] = target_table
-            target_meta.data[target_table]['variables'][target_var] = VariableInfo.from_dict(target_var, target_table,
-                                                                                             var_dict)
-            target_var_info = target_meta.get_variable(target_table, target_var)
+            target_var_info = target_meta.add_variable(target_table, target_var,
+                                                       VariableInfo.from_dict(target_var, target_table, var_dict))
             if target_var_info.variable_type == VariableType.PrimaryKey:
                 target_meta.assign_primary_key(target_table, target_var)
         else:
@@ -80,8 +79,7 @@ class DataMappingUtils:
                 if pk not in target_meta.get_variable_names(source_table):
                     source_var_info = source_meta.get_variable(source_table, pk)
                     var_dict = asdict(source_var_info)
-                    target_meta.data[source_table]['variables'][pk] = VariableInfo.from_dict(
-                        pk, source_table, var_dict)
+                    target_meta.add_variable(source_table, pk, VariableInfo.from_dict(pk, source_table, var_dict))
                 target_meta.assign_primary_key(source_table, pk)
             for source_var in source_meta.get_variable_names(source_table):
                 if source_var == pk:
@@ -94,14 +92,16 @@ class DataMappingUtils:
         for table in target_meta.get_table_names():
             target_fks = target_meta.get_foreign_keys(table)
             if len(target_fks) == 0:
-                target_meta.data[table]["foreign_keys"] =  source_meta.get_foreign_keys(table)
+                for foreign_key, foreign_table in source_meta.get_foreign_keys(table).items():
+                    target_meta.add_foreign_key(table, foreign_table, foreign_key)
         return DataMapping(source_meta, target_meta, table_mappings, var_mappings)
 
     @staticmethod
     def copy_dataset(source_meta : MetaData, data_source : Union[str, Dict[str, List[Dict[str, str]]]],
                      data_target : Union[str, Dict[str, List[Dict[str, str]]]], delete_artifacts : bool = False,
-                     source_file_encoding : Optional[str] = None) -> None:
-        """Copies a whole dataset while optionally deleting artifacts.
+                     source_file_encoding : Optional[str] = None, nof_processes : int = 1) -> None:
+        """Copies a whole dataset while optionally deleting artifacts. The tables are copied one-to-one by an
+        :class:`ArtifactCleaner` instead of a :class:`DataTransformation` with the mapping of :meth:`get_copy_mapping`.
 
         :param source_meta: The source metadata
         :param data_source: The path to a directory where the CSV files are read from or a data dictionary where data is
@@ -111,12 +111,11 @@ class DataMappingUtils:
         :param delete_artifacts: If ``True`` artifacts are removed while copying
         :param source_file_encoding: Specifies the file encoding of all source tables, if read from a CSV. Will be
             detected if not specified, defaults to ``None``
+        :param nof_processes: The number of processes cleaning the tables, if source and target are directories,
+            defaults to 1
         """
-        target_meta = MetaData(source_meta.get_table_names())
-        mappings = DataMappingUtils.get_copy_mapping(source_meta, target_meta, delete_artifacts)
-        data_transformation = DataTransformation(mappings)
-        data_transformation.transform_to_target(SourceDataType.CSV, data_source, data_target,
-                                                source_file_encoding=source_file_encoding)
+        cleaner = ArtifactCleaner(source_meta, delete_artifacts, nof_processes, file_encoding=source_file_encoding)
+        cleaner.clean_dataset(data_source, data_target)
 
     @staticmethod
     def add_primary_key(data_source : Union[str, Dict[str, List[Dict[str, str]]]], source_table : str,
@@ -5,7 +5,7 @@ import csv
 import contextlib
 from typing import Iterable, Union, Optional, Tuple, Dict
 from graphxplore.MetaDataHandling import MetaData, VariableInfo, VariableType
-from graphxplore.Basis import (GraphCSVWriter, GraphType, BaseUtils, GraphDatabaseWriter, GraphOutputType,
+from graphxplore.Basis import (GraphCSVWriter, GraphType, ValueDistribution, GraphDatabaseWriter, GraphOutputType,
                                GraphDatabaseUtils, RelationalDataIODevice)
 from graphxplore.Basis.BaseGraph import BinBoundInfo, BaseLabels, BaseNode, BaseEdge, BaseEdgeType, BaseNodeType
 
@@ -31,6 +31,8 @@ class GraphTranslator:
         """
         self.metadata = metadata
         self.missing_vals = set(missing_vals)
+        self.value_filters = {}
+        self.cast_memos = {}
         self.table_look_data = collections.defaultdict(dict)
         self.node_uuid = 0
         self.edge_uuid = 0
@@ -43,7 +45,7 @@ class GraphTranslator:
     def transform_to_graph(self, csv_data: Union[str, Dict[str, Iterable[Dict[str, str]]]], output: str,
                            output_type : GraphOutputType = GraphOutputType.CSV, overwrite: bool = False,
                            address : str = GraphDatabaseUtils.get_neo4j_address(),
-                           auth: Tuple[str, str] = ("neo4j", "")) -> None:
+                           auth: Tuple[str, str] = ("neo4j", ""), create_indexes : bool = False) -> None:
         """Reads all CSV files from a data directory, that are specified in the supplied metadata. Generates a graph
         with nodes for primary keys and attributes. Links between primary keys, if they appear in a primary/foreign key
         relation between different CSV files. Stores the generated graph in the specified output directory as CSV files
@@ -60,6 +62,9 @@ class GraphTranslator:
             written to database
         :param auth: username and password to access the Neo4j DBMS. Will only be used if graph should be written to
             database
+        :param create_indexes: If ``True``, range indexes on the properties "name" and "value" are created for all table
+            labels after writing. Speeds up group selection and dashboard queries. Will only be used if graph should be
+            written to database
         """
         print('Start building graph')
 
@@ -71,7 +76,8 @@ class GraphTranslator:
             if output_type == GraphOutputType.CSV:
                 self.writer = stack.enter_context(GraphCSVWriter(output, GraphType.Base))
             else:
-                self.writer = stack.enter_context(GraphDatabaseWriter(GraphType.Base, output, overwrite, address, auth))
+                self.writer = stack.enter_context(GraphDatabaseWriter(GraphType.Base, output, overwrite, address, auth,
+                                                                      create_indexes=create_indexes))
 
             for table in self.table_names:
                 table_label = self.metadata.get_label(table)
@@ -92,6 +98,12 @@ class GraphTranslator:
                     self.table_look_data[table]['stored_attributes'].clear()
                     self.table_look_data[table]['attributes_to_bin'].clear()
 
+        nof_hits = sum(memo.nof_hits for table_memos in self.cast_memos.values() for memo in table_memos.values())
+        nof_casts = nof_hits + sum(memo.nof_misses for table_memos in self.cast_memos.values()
+                                   for memo in table_memos.values())
+        if nof_casts > 0:
+            print('Cast ' + str(nof_casts) + ' cell values, ' + str(round(100 * nof_hits / nof_casts, 1))
+                  + '% answered by memoized casts')
         end_time = time.time()
         print('Done, took ' + str(end_time-start_time) + ' seconds, generated ' + str(self.node_uuid) + ' nodes and '
               + str(self.edge_uuid) + ' edges')
@@ -99,9 +111,14 @@ class GraphTranslator:
     def __initialize_look_up(self) -> None:
         """Initialize data structures for storage of generated nodes. Attribute nodes are deleted, after the table was
         fully processed. Primary key nodes are deleted, if the primary keys are not used as foreign keys in other
-        tables.
+        tables. The missing values and artifacts of all variables are compiled to value filters and cast results are
+        memoized per variable.
         """
         for table in self.table_names:
+            self.value_filters[table] = {variable : self.metadata.get_variable(table, variable).get_value_filter(
+                self.missing_vals) for variable in self.metadata.get_variable_names(table)}
+            self.cast_memos[table] = {variable : self.metadata.get_variable(table, variable).get_cast_memo()
+                                      for variable in self.metadata.get_variable_names(table)}
             self.table_look_data[table]['stored_keys'] = collections.defaultdict(int)
             self.table_look_data[table]['stored_attributes'] = collections.defaultdict(int)
             self.table_look_data[table]['attributes_to_bin'] = collections.defaultdict(lambda
@@ -126,7 +143,7 @@ class GraphTranslator:
         foreign_key_references = self.metadata.get_foreign_keys(table)
         store_keys = self.primary_key_link[table]
         # generate node for data point/primary key
-        prim_info = self.metadata.get_variable(table, primary_key)
+        prim_info = self.metadata.get_primary_key_info(table)
         data_point_id = self.__generate_and_insert_node(row[primary_key], table, table_label, primary_key, prim_info,
                                                         store_keys)
         # primary key column should never contain empty cells
@@ -182,9 +199,9 @@ class GraphTranslator:
                 low = var_info.binning.ref_low
                 high = var_info.binning.ref_high
             else:
-                sorted_vals = sorted(values.items())
-                low = float(BaseUtils.calculate_quartile_quintile_sorted_dist(sorted_vals, False, 1))
-                high = float(BaseUtils.calculate_quartile_quintile_sorted_dist(sorted_vals, False, 4))
+                distribution = ValueDistribution.from_dict(values)
+                low = float(distribution.get_quantile(0.2))
+                high = float(distribution.get_quantile(0.8))
             generated_bins[attribute] = {'lower': low, 'upper': high, 'info' : var_info}
 
         assigned_bins = collections.defaultdict(lambda : collections.defaultdict(list))
@@ -241,11 +258,11 @@ class GraphTranslator:
         :param insert_in_map: If true the node is checked for uniqueness (not necessary for primary keys)
         :return: Returns the id of the generated node
         """
-        if value in self.missing_vals or (var_info.artifacts is not None and value in var_info.artifacts):
+        if self.value_filters[table][var_name].is_excluded(value):
             if var_info.default_value is None:
                 return -1
             value = var_info.default_value
-        cast_value = var_info.cast_value_to_data_type(value)
+        cast_value = self.cast_memos[table][var_name].cast(value)
         # cell value does not belong to column data type
         if cast_value is None:
             return -1
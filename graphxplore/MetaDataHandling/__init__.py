@@ -1,7 +1,13 @@
 from .variable_info import (DataType, VariableType, BinningInfo, VariableInfo, MetricDistribution,
-                            CategoricalDistribution, ArtifactMode)
+                            CategoricalDistribution, ArtifactMode, CastMemo)
 from .meta_data import MetaData
 from .meta_data_generator import MetaDataGenerator
+from .column_profile import ColumnProfile, TableProfile, ColumnSketch
+from .sketches import HyperLogLog, HeavyHitters, QuantileSketch, MinHashSignature, BloomFilter
+from .profile_cache import ProfileCache
+from .value_filter import ValueFilter
 
 __all__ = ['MetaDataGenerator', 'MetaData', 'BinningInfo', 'VariableInfo', 'VariableType', 'DataType',
-           'MetricDistribution', 'CategoricalDistribution', 'ArtifactMode']
+           'MetricDistribution', 'CategoricalDistribution', 'ArtifactMode', 'ColumnProfile', 'TableProfile',
+           'ColumnSketch', 'HyperLogLog', 'HeavyHitters', 'QuantileSketch', 'MinHashSignature', 'BloomFilter',
+           'ProfileCache', 'ValueFilter', 'CastMemo']
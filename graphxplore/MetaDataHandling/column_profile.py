@@ -0,0 +1,403 @@
+import copy
+from typing import Dict, Iterable, List, Optional, Union, Tuple
+from .variable_info import DataType
+from .sketches import HyperLogLog, HeavyHitters, QuantileSketch, MinHashSignature, hash_value
+from .value_filter import ValueFilter
+
+class ColumnSketch:
+    """This class summarizes the non-missing values of a column in bounded memory. The number of distinct values is
+    estimated with a :class:`HyperLogLog` sketch, the distinct values are sampled by a :class:`MinHashSignature`, the
+    most frequent values are tracked by a :class:`HeavyHitters` summary and quantiles of integer and decimal values
+    are approximated with :class:`QuantileSketch` objects. Values of the types string and decimal are additionally
+    kept up to ``nof_examples`` distinct values, since they are potential data type mismatches. Sketches can be
+    merged.
+
+    :param hll_precision: The precision of the distinct count sketch, defaults to 14
+    :param nof_heavy_hitters: The capacity of the heavy hitters summary, defaults to 1000
+    :param quantile_k: The compactor capacity of the quantile sketches, defaults to 200
+    :param nof_extremes: The number of smallest and largest distinct numbers tracked exactly, defaults to 100
+    :param nof_examples: The maximal number of distinct values kept per potentially mismatching data type, defaults
+        to 100
+    """
+    def __init__(self, hll_precision : int = 14, nof_heavy_hitters : int = 1000, quantile_k : int = 200,
+                 nof_extremes : int = 100, nof_examples : int = 100):
+        """Constructor method
+        """
+        self.distinct_values = HyperLogLog(hll_precision)
+        self.value_signature = MinHashSignature()
+        self.heavy_hitters = HeavyHitters(nof_heavy_hitters)
+        self.quantiles = {DataType.Integer : QuantileSketch(quantile_k, nof_extremes),
+                          DataType.Decimal : QuantileSketch(quantile_k, nof_extremes)}
+        self.type_counts = {DataType.String : 0, DataType.Integer : 0, DataType.Decimal : 0}
+        self.type_examples = {DataType.String : {}, DataType.Decimal : {}}
+        self.nof_examples = nof_examples
+        self.nof_missing = 0
+
+    def add(self, val : str, count : int = 1, data_type : Optional[DataType] = None) -> None:
+        """Add a non-missing value to the sketch
+
+        :param val: The value
+        :param count: The number of occurrences, defaults to 1
+        :param data_type: The data type of the value. Is inferred, if ``None`` is specified, defaults to None
+        """
+        if data_type is None:
+            data_type = ColumnProfile.infer_cell_datatype(val)
+        self.type_counts[data_type] += count
+        hashed = hash_value(val)
+        self.distinct_values.add_hash(hashed)
+        self.value_signature.add_hash(hashed)
+        self.heavy_hitters.add(val, count)
+        if data_type == DataType.Integer:
+            self.quantiles[data_type].add(int(val), count, val)
+            return
+        if data_type == DataType.Decimal:
+            self.quantiles[data_type].add(float(val), count, val)
+        examples = self.type_examples[data_type]
+        if val in examples:
+            examples[val] += count
+        elif len(examples) < self.nof_examples:
+            examples[val] = count
+
+    def merge(self, other : 'ColumnSketch') -> None:
+        """Merge another sketch into this sketch
+
+        :param other: The other sketch
+        """
+        self.distinct_values.merge(other.distinct_values)
+        self.value_signature.merge(other.value_signature)
+        self.heavy_hitters.merge(other.heavy_hitters)
+        for data_type, quantile_sketch in self.quantiles.items():
+            quantile_sketch.merge(other.quantiles[data_type])
+        for data_type, count in other.type_counts.items():
+            self.type_counts[data_type] += count
+        for data_type, other_examples in other.type_examples.items():
+            examples = self.type_examples[data_type]
+            for val, count in other_examples.items():
+                if val in examples:
+                    examples[val] += count
+                elif len(examples) < self.nof_examples:
+                    examples[val] = count
+        self.nof_missing += other.nof_missing
+
+    def get_exact_value_dist(self) -> Optional[Dict[Optional[str], int]]:
+        """Get the exact value distribution including the count of missing values with key ``None``, if all distinct
+        values fit into the heavy hitters summary
+
+        :return: Returns the value distribution, or ``None`` if it is only known approximately
+        """
+        if not self.heavy_hitters.is_exact():
+            return None
+        result = dict(self.heavy_hitters.counts)
+        if self.nof_missing > 0:
+            result[None] = self.nof_missing
+        return result
+
+    def get_quantile_sketch(self, data_type : DataType) -> QuantileSketch:
+        """Get the quantile sketch of all values that can be cast to a data type
+
+        :param data_type: The data type, must be 'Integer' or 'Decimal'
+        :return: Returns the quantile sketch
+        """
+        if data_type == DataType.Integer:
+            return self.quantiles[DataType.Integer]
+        if data_type == DataType.Decimal:
+            result = copy.deepcopy(self.quantiles[DataType.Decimal])
+            result.merge(self.quantiles[DataType.Integer])
+            return result
+        raise AttributeError('Quantiles are only available for integer and decimal values')
+
+    def get_type_mismatches(self, data_type : DataType) -> Tuple[Dict[str, int], int]:
+        """Get values that cannot be cast to a data type and their overall count. The number of listed values is
+        limited by ``nof_examples`` per mismatching data type, but the count is exact
+
+        :param data_type: The data type of the column
+        :return: Returns the listed values with counts and the overall count of mismatching values
+        """
+        mismatch_types = [] if data_type == DataType.String else [DataType.String] \
+            if data_type == DataType.Decimal else [DataType.String, DataType.Decimal]
+        values = {}
+        nof_mismatches = 0
+        for mismatch_type in mismatch_types:
+            values.update(self.type_examples[mismatch_type])
+            nof_mismatches += self.type_counts[mismatch_type]
+        return values, nof_mismatches
+
+class ColumnProfile:
+    """This class accumulates the statistics of a single column that are needed for metadata extraction. Profiles of
+    different row ranges of the same column can be merged. Data types are inferred once per distinct value from the
+    value distribution and weighted by the value counts. If the number of distinct non-missing values exceeds the
+    sketch threshold of the table profile, the exact value distribution is replaced by a :class:`ColumnSketch` and
+    ``value_dist`` is set to ``None``.
+
+    :param column_name: The name of the column
+    """
+    def __init__(self, column_name : str):
+        """Constructor method
+        """
+        self.column_name = column_name
+        self.value_dist = {}
+        self.sketch = None
+        self.contains_missing_vals = False
+        self.contains_freetext = False
+        self.values_are_unique = True
+        self.nof_non_missing = 0
+        self.nof_distinct = 0
+
+    def merge(self, other : 'ColumnProfile', missing_vals : Iterable[Union[str, None]],
+              sketch_threshold : Optional[int] = None) -> None:
+        """Merge the profile of another row range of the same column into this profile
+
+        :param other: The other profile
+        :param missing_vals: These values indicate missing values
+        :param sketch_threshold: The profile is converted to a sketch, if it has more distinct non-missing values,
+            defaults to None
+        """
+        if self.column_name != other.column_name:
+            raise AttributeError('Cannot merge profiles of columns "' + self.column_name + '" and "'
+                                 + other.column_name + '"')
+        if other.sketch is not None and self.sketch is None:
+            self.convert_to_sketch(missing_vals)
+        if self.sketch is not None:
+            if other.sketch is not None:
+                self.sketch.merge(other.sketch)
+            else:
+                self.__add_to_sketch(other.value_dist, missing_vals)
+        else:
+            for val, count in other.value_dist.items():
+                if val in self.value_dist:
+                    if self.values_are_unique and val is not None and val not in missing_vals:
+                        self.values_are_unique = False
+                    self.value_dist[val] += count
+                else:
+                    self.value_dist[val] = count
+                    if val is not None and val not in missing_vals:
+                        self.nof_distinct += 1
+            if sketch_threshold is not None and self.nof_distinct > sketch_threshold:
+                self.convert_to_sketch(missing_vals)
+        self.contains_missing_vals = self.contains_missing_vals or other.contains_missing_vals
+        self.contains_freetext = self.contains_freetext or other.contains_freetext
+        self.values_are_unique = self.values_are_unique and other.values_are_unique
+        self.nof_non_missing += other.nof_non_missing
+
+    def convert_to_sketch(self, missing_vals : Iterable[Union[str, None]]) -> None:
+        """Replace the exact value distribution by a :class:`ColumnSketch`
+
+        :param missing_vals: These values indicate missing values
+        """
+        if self.sketch is not None:
+            return
+        self.sketch = ColumnSketch()
+        self.__add_to_sketch(self.value_dist, missing_vals)
+        self.value_dist = None
+
+    def __add_to_sketch(self, value_dist : Dict[Optional[str], int], missing_vals : Iterable[Union[str, None]]) -> None:
+        for val, count in value_dist.items():
+            if val is None or val in missing_vals:
+                self.sketch.nof_missing += count
+            else:
+                self.sketch.add(val, count)
+
+    def get_values_are_unique(self) -> bool:
+        """Check if all non-missing values are unique. For sketches, values are considered unique, if no value of the
+        heavy hitters summary was counted twice and the estimated distinct count is within three standard errors of
+        the number of non-missing values
+
+        :return: Returns ``True`` if the values are (approximately) unique
+        """
+        if self.sketch is None or not self.values_are_unique:
+            return self.values_are_unique
+        # counts of the heavy hitters summary are lower bounds
+        if any(count > 1 for count in self.sketch.heavy_hitters.counts.values()):
+            return False
+        distinct_values = self.sketch.distinct_values
+        return (distinct_values.estimate()
+                >= self.nof_non_missing * (1 - 3 * distinct_values.get_relative_error()))
+
+    def get_data_type_counts(self, missing_vals : Iterable[Union[str, None]]) -> Dict[DataType, int]:
+        """Count the non-missing values per data type. The data type is inferred once per distinct value
+
+        :param missing_vals: These values indicate missing values
+        :return: Returns the counts per data type
+        """
+        if self.sketch is not None:
+            return dict(self.sketch.type_counts)
+        type_counts = {DataType.String : 0, DataType.Integer : 0, DataType.Decimal : 0}
+        infer_cell_datatype = ColumnProfile.infer_cell_datatype
+        for val, count in self.value_dist.items():
+            if val is None or val in missing_vals:
+                continue
+            type_counts[infer_cell_datatype(val)] += count
+        return type_counts
+
+    def get_data_type_distribution(self, missing_vals : Iterable[Union[str, None]]) -> Dict[DataType, float]:
+        """Get the share of each data type among the non-missing values
+
+        :param missing_vals: These values indicate missing values
+        :return: Returns the data type distribution
+        """
+        type_counts = self.get_data_type_counts(missing_vals)
+        if self.nof_non_missing == 0:
+            return type_counts
+        return {data_type : round(count / self.nof_non_missing, 4) for data_type, count in type_counts.items()}
+
+    @staticmethod
+    def get_data_type(type_dist : Dict[DataType, float]) -> DataType:
+        """Infer the column data type from the data type distribution. If more than 5% are strings, the whole column is
+        assigned 'String'. Same concept with lower priority for decimal numbers. Otherwise, the column is assigned
+        'Integer', which is the most specific data type.
+
+        :param type_dist: The data type distribution
+        :return: Returns the column data type
+        """
+        if type_dist[DataType.String] > 0.05:
+            return DataType.String
+        if type_dist[DataType.Decimal] > 0.05:
+            return DataType.Decimal
+        return DataType.Integer
+
+    def to_dict(self, missing_vals : Iterable[Union[str, None]]) -> dict:
+        """Get the statistics of the column as dictionary
+
+        :param missing_vals: These values indicate missing values
+        :return: Returns the dictionary
+        """
+        type_dist = self.get_data_type_distribution(missing_vals)
+        return {
+            'column_name' : self.column_name,
+            'data_type' : self.get_data_type(type_dist),
+            'contains_freetext' : self.contains_freetext,
+            'contains_missing_vals' : self.contains_missing_vals,
+            'value_dist' : self.value_dist,
+            'sketch' : self.sketch,
+            'nof_non_missing' : self.nof_non_missing,
+            'data_type_dist' : type_dist,
+            'values_are_unique' : self.get_values_are_unique()}
+
+    @staticmethod
+    def infer_cell_datatype(val: str) -> DataType:
+        """Infers the data type of the current cell with the following hierarchy of specificity/preference:
+        'Integer', 'Float', 'String'.
+
+        :param val: The cell value
+        :return: Returns the inferred cell data type
+        """
+        try:
+            int(val)
+            return DataType.Integer
+        except (ValueError, TypeError):
+            try:
+                float(val)
+                return DataType.Decimal
+            except (ValueError, TypeError):
+                return DataType.String
+
+class TableProfile:
+    """This class accumulates :class:`ColumnProfile` objects for all columns of a table. Profiles of different row
+    ranges of the same table can be merged in order.
+
+    :param table: The name of the table
+    :param header: The column names of the table
+    :param missing_vals: These values indicate missing values, defaults to empty string, None and variations of
+        "NaN" and "Na"
+    :param str_len_free_text: Strings with at least this number of characters are considered free text, defaults to
+        300
+    :param sketch_threshold: Columns with more distinct non-missing values are summarized by a :class:`ColumnSketch`
+        in bounded memory instead of an exact value distribution. All values are kept exactly, if ``None`` is
+        specified, defaults to None
+    """
+    def __init__(self, table : str, header : Iterable[str],
+                 missing_vals : Iterable[Union[str, None]] = ('', 'NaN', 'Na', 'NA', 'NAN', 'nan', 'na'),
+                 str_len_free_text : int = 300, sketch_threshold : Optional[int] = None):
+        """Constructor method
+        """
+        self.table = table
+        self.columns = {column : ColumnProfile(column) for column in header}
+        self.value_filter = ValueFilter(missing_vals)
+        self.missing_vals = self.value_filter.missing_vals
+        self.str_len_free_text = str_len_free_text
+        self.sketch_threshold = sketch_threshold
+        self.nof_rows = 0
+
+    def add_rows(self, rows : Iterable[Dict[str, Optional[str]]]) -> None:
+        """Add table rows to the profile
+
+        :param rows: The rows as dicts of column name and value
+        """
+        missing_vals = self.missing_vals
+        str_len_free_text = self.str_len_free_text
+        sketch_threshold = self.sketch_threshold
+        infer_cell_datatype = ColumnProfile.infer_cell_datatype
+        string_type = DataType.String
+        columns = self.columns
+        nof_rows = 0
+        for line in rows:
+            nof_rows += 1
+            for column, val in line.items():
+                profile = columns[column]
+                value_dist = profile.value_dist
+                if value_dist is None:
+                    self.__add_to_sketch(profile, val)
+                    continue
+                count = value_dist.get(val, 0) + 1
+                value_dist[val] = count
+                # missing values include None
+                if val in missing_vals:
+                    profile.contains_missing_vals = True
+                else:
+                    profile.nof_non_missing += 1
+                    # cell value not seen before, data types are inferred per distinct value at the end
+                    if count == 1:
+                        if (not profile.contains_freetext and (len(val) > str_len_free_text or "\n" in val)
+                                and infer_cell_datatype(val) == string_type):
+                            profile.contains_freetext = True
+                        profile.nof_distinct += 1
+                        if sketch_threshold is not None and profile.nof_distinct > sketch_threshold:
+                            profile.convert_to_sketch(missing_vals)
+                    else:
+                        profile.values_are_unique = False
+        self.nof_rows += nof_rows
+
+    def __add_to_sketch(self, profile : ColumnProfile, val : Optional[str]) -> None:
+        if self.value_filter.is_missing(val):
+            profile.contains_missing_vals = True
+            profile.sketch.nof_missing += 1
+            return
+        profile.nof_non_missing += 1
+        data_type = ColumnProfile.infer_cell_datatype(val)
+        if (not profile.contains_freetext and data_type == DataType.String
+                and (len(val) > self.str_len_free_text or "\n" in val)):
+            profile.contains_freetext = True
+        profile.sketch.add(val, data_type=data_type)
+
+    def merge(self, other : 'TableProfile') -> None:
+        """Merge the profile of the subsequent row range of the same table into this profile
+
+        :param other: The other profile
+        """
+        if self.table != other.table or list(self.columns.keys()) != list(other.columns.keys()):
+            raise AttributeError('Cannot merge profiles of different tables "' + self.table + '" and "'
+                                 + other.table + '"')
+        for column, profile in self.columns.items():
+            profile.merge(other.columns[column], self.missing_vals, self.sketch_threshold)
+        self.nof_rows += other.nof_rows
+
+    def to_dict(self) -> Dict[str, dict]:
+        """Get the statistics of all columns as dictionary of column name and column statistics
+
+        :return: Returns the dictionary
+        """
+        return {column : profile.to_dict(self.missing_vals) for column, profile in self.columns.items()}
+
+    @staticmethod
+    def merge_profiles(profiles : List['TableProfile']) -> 'TableProfile':
+        """Merge profiles of subsequent row ranges of the same table
+
+        :param profiles: The profiles in row order
+        :return: Returns the first profile with all others merged into it
+        """
+        if len(profiles) == 0:
+            raise AttributeError('At least one table profile is required for merging')
+        result = profiles[0]
+        for profile in profiles[1:]:
+            result.merge(profile)
+        return result
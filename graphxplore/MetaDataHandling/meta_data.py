@@ -2,14 +2,28 @@ import os
 import re
 import json
 import copy
-from typing import List, Iterable, Dict, Optional
+import pickle
+import hashlib
+from types import MappingProxyType
+from typing import List, Iterable, Dict, Optional, Tuple, Mapping, NamedTuple
 from .variable_info import VariableInfo, VariableType, DataType
 from graphxplore.Basis import BaseUtils
 
+_SNAPSHOT_VERSION = 1
+
+class _TableView(NamedTuple):
+    """Immutable, precomputed view of a table in the metadata
+    """
+    variable_names : Tuple[str, ...]
+    foreign_keys : Mapping[str, str]
+    primary_key_info : Optional[VariableInfo]
+
 class MetaData:
     """This class is the core of all ETL processes in graphxplore. It stores the metadata of a relational dataset.
     It contains information about its CSV tables, variables, primary/foreign keys,
-    and much more information on the variable-level. For more information checkout :class:`VariableInfo`
+    and much more information on the variable-level. For more information checkout :class:`VariableInfo`. Variable
+    names, foreign keys and primary key information are cached per table and only recomputed after changes by the
+    methods of this class, so ``data`` should not be altered directly.
 
     :param tables: The names of the CSV tables of the relational data set (without .csv)
     """
@@ -18,21 +32,48 @@ class MetaData:
         """
         self.data = dict([(table, {'label' : table, 'primary_key' : '', 'foreign_keys' : {}, 'variables' : {}})
                           for table in tables])
+        self.__views = {}
 
     @staticmethod
-    def load_from_json(filepath: str, file_encoding : Optional[str] = None) -> 'MetaData':
-        """Reads a :class:`Metadata` object from a JSON.
+    def load_from_json(filepath: str, file_encoding : Optional[str] = None,
+                       snapshot_path : Optional[str] = None) -> 'MetaData':
+        """Reads a :class:`Metadata` object from a JSON. If ``snapshot_path`` is specified, a binary snapshot of the
+        parsed metadata is stored there together with the size, modification time and a hash of the JSON file. As long
+        as the JSON file does not change, later calls load the snapshot instead of parsing and validating the JSON
+        again. For more information check out :meth:`store_snapshot`
 
         :param filepath: Path to the JSON
         :param file_encoding: file encoding of the JSON
+        :param snapshot_path: Path of the snapshot file used as cache, defaults to None
         :return: Returns a Metadata object
         """
         if not os.path.isfile(filepath):
             raise AttributeError('Path "' + filepath +'" is not a valid file path')
+        source = None
+        if snapshot_path is not None:
+            stat = os.stat(filepath)
+            snapshot = None
+            if os.path.isfile(snapshot_path):
+                try:
+                    snapshot = MetaData.__read_snapshot(snapshot_path)
+                # corrupt or outdated snapshots are cache misses and overwritten
+                except AttributeError:
+                    snapshot = None
+            cached_source = snapshot.get('source') if snapshot is not None else None
+            if cached_source is not None and cached_source[:2] == (stat.st_size, stat.st_mtime_ns):
+                return MetaData.__from_snapshot(snapshot)
+            with open(filepath, 'rb') as f:
+                source = (stat.st_size, stat.st_mtime_ns, hashlib.blake2b(f.read(), digest_size=16).hexdigest())
+            # touched, but unchanged file
+            if cached_source is not None and cached_source[2] == source[2]:
+                return MetaData.__from_snapshot(snapshot)
         encoding = file_encoding if file_encoding is not None else BaseUtils.detect_file_encoding(filepath)
         with open(filepath, encoding=encoding) as f:
             data = json.load(f)
-            return MetaData.from_dict(data)
+        meta_data = MetaData.from_dict(data)
+        if snapshot_path is not None:
+            meta_data.__write_snapshot(snapshot_path, source)
+        return meta_data
 
     @staticmethod
     def from_dict(data : dict) -> 'MetaData':
@@ -119,6 +160,77 @@ class MetaData:
         with open(file_path, "w", encoding=file_encoding) as f:
             json.dump(output_dict, f, indent=6, ensure_ascii=False)
 
+    def get_content_hash(self) -> str:
+        """Calculates a hash of the metadata content from its JSON serialization (see :meth:`to_dict`). Metadata
+        objects with equal content have the same hash. Different content yields different hashes, except for values
+        that compare equal but serialize differently, e.g. ``1`` and ``1.0``. The hash is calculated on every call,
+        since variables can be edited in place.
+
+        :return: Returns the hash as hexadecimal string
+        """
+        content = json.dumps(self.to_dict(), sort_keys=True, ensure_ascii=False)
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+    def store_snapshot(self, file_path : str) -> None:
+        """Stores the object as a binary snapshot (pickle) together with its content hash. Snapshots are much faster to
+        load than JSON files, since the variable information is not parsed and validated again. Only load snapshots
+        from trusted sources.
+
+        :param file_path: Path of the snapshot file
+        """
+        dir_path = os.path.dirname(os.path.realpath(file_path))
+        if not os.path.exists(dir_path) or not os.path.isdir(dir_path):
+            raise AttributeError('File path "' + file_path
+                                 + '" is invalid, since the containing directory does not exist')
+        self.__write_snapshot(file_path, None)
+
+    @staticmethod
+    def load_snapshot(file_path : str, validate : bool = False) -> 'MetaData':
+        """Reads a :class:`Metadata` object from a snapshot created by :meth:`store_snapshot`. The content is trusted by
+        default. If ``validate`` is ``True``, the metadata is validated like a parsed JSON and its content hash is
+        compared with the stored hash.
+
+        :param file_path: Path of the snapshot file
+        :param validate: If ``True`` the content is validated, defaults to False
+        :return: Returns a Metadata object
+        """
+        if not os.path.isfile(file_path):
+            raise AttributeError('Path "' + file_path +'" is not a valid file path')
+        snapshot = MetaData.__read_snapshot(file_path)
+        meta_data = MetaData.__from_snapshot(snapshot)
+        if validate:
+            meta_data = MetaData.from_dict(meta_data.to_dict())
+            if meta_data.get_content_hash() != snapshot['content_hash']:
+                raise AttributeError('Content of snapshot "' + file_path + '" does not match its content hash')
+        return meta_data
+
+    def __write_snapshot(self, file_path : str, source : Optional[Tuple[int, int, str]]) -> None:
+        snapshot = {'version' : _SNAPSHOT_VERSION, 'content_hash' : self.get_content_hash(), 'source' : source,
+                    'data' : self.data}
+        with open(file_path, 'wb') as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def __read_snapshot(file_path : str) -> dict:
+        with open(file_path, 'rb') as f:
+            try:
+                snapshot = pickle.load(f)
+            # unpickling garbage can raise various exceptions
+            except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError, KeyError, TypeError,
+                    ValueError):
+                snapshot = None
+        if (not isinstance(snapshot, dict) or snapshot.get('version') != _SNAPSHOT_VERSION
+                or not isinstance(snapshot.get('data'), dict)):
+            raise AttributeError('File "' + file_path + '" is not a metadata snapshot of version '
+                                 + str(_SNAPSHOT_VERSION))
+        return snapshot
+
+    @staticmethod
+    def __from_snapshot(snapshot : dict) -> 'MetaData':
+        meta_data = MetaData(snapshot['data'].keys())
+        meta_data.data = snapshot['data']
+        return meta_data
+
     def __deepcopy__(self, memo : Dict={}) -> 'MetaData':
         result = MetaData(self.get_table_names())
         for table, table_data in self.data.items():
@@ -129,6 +241,15 @@ class MetaData:
                                                for var_name, var_info in table_data['variables'].items()}
         return result
 
+    def __getstate__(self) -> dict:
+        # cached views contain mapping proxies, which cannot be pickled
+        state = self.__dict__.copy()
+        del state['_MetaData__views']
+        return state
+
+    def __setstate__(self, state : dict) -> None:
+        self.__dict__.update(state)
+        self.__views = {}
 
     def add_table(self, table : str) -> None:
         """Add a table to the metadata
@@ -148,11 +269,15 @@ class MetaData:
         if table not in self.data:
             raise AttributeError('Table "' + table + '" not in meta data')
         del self.data[table]
+        self.__views.pop(table, None)
         for other in self.get_table_names():
             fks_of_table = [fk for fk, ft in self.get_foreign_keys(other).items() if ft == table]
             for fk in fks_of_table:
                 del self.data[other]["foreign_keys"][fk]
                 self.data[other]['variables'][fk].variable_type = VariableType.Categorical
+            # views are invalidated after the foreign keys changed
+            if len(fks_of_table) > 0:
+                self.__views.pop(other, None)
 
 
     def assign_label(self, table : str, label : str) -> None:
@@ -167,23 +292,27 @@ class MetaData:
             raise AttributeError('Label "' + label + '" should only contain letters, numbers, hyphens and underscores')
         self.data[table]['label'] = label
 
-    def add_variable(self, table : str, variable : str) -> VariableInfo:
+    def add_variable(self, table : str, variable : str, var_info : Optional[VariableInfo] = None) -> VariableInfo:
         """Adds a variable for a specified table to the metadata.
 
         :param table: The name of the table, i.e. its file name with '.csv' omitted
         :param variable: The name of the variable, i.e. the column name
+        :param var_info: An existing variable info that is added instead of an empty one, defaults to None
         :return: Returns the generated variable info that can be filled
         """
         if table not in self.data:
             raise AttributeError('Table "' + table + '" not in meta data')
         if variable in self.data[table]['variables']:
             raise AttributeError('Variable "' + variable + '" already exists in table "' + table + '"')
-        self.data[table]['variables'][variable] = VariableInfo(name=variable, table = table,
-                                                               labels=[],  variable_type=VariableType.Categorical,
-                                                               data_type=DataType.String,
-                                                               data_type_distribution=None)
-
-        return self.data[table]['variables'][variable]
+        if var_info is None:
+            var_info = VariableInfo(name=variable, table = table, labels=[],  variable_type=VariableType.Categorical,
+                                    data_type=DataType.String, data_type_distribution=None)
+        elif var_info.name != variable or var_info.table != table:
+            raise AttributeError('Variable info of "' + var_info.name + '" in table "' + var_info.table
+                                 + '" cannot be added as variable "' + variable + '" of table "' + table + '"')
+        self.data[table]['variables'][variable] = var_info
+        self.__views.pop(table, None)
+        return var_info
 
     def assign_primary_key(self, table : str, primary_key : str) -> None:
         """Assigns a primary key for the specified table. Raises an exception if ``table`` already has a primary key,
@@ -203,6 +332,7 @@ class MetaData:
 
         self.data[table]['variables'][primary_key].variable_type = VariableType.PrimaryKey
         self.data[table]['primary_key'] = primary_key
+        self.__views.pop(table, None)
 
     def change_primary_key(self, table : str, primary_key : str) -> None:
         """Changes the primary key for the specified table. Raises an exception if ``primary_key`` is not a variable
@@ -228,6 +358,7 @@ class MetaData:
                 self.data[table]['variables'][old_key].variable_type = VariableType.Categorical
             self.data[table]['variables'][primary_key].variable_type = VariableType.PrimaryKey
             self.data[table]['primary_key'] = primary_key
+            self.__views.pop(table, None)
 
     def add_foreign_key(self, table : str, foreign_table : str, foreign_key : str) -> None:
         """Adds a foreign key and its foreign origin table to a specified table. ``foreign_key`` must be a variable of
@@ -263,6 +394,7 @@ class MetaData:
                     only_data_type_artifacts.append(artifact)
             var_info.artifacts = only_data_type_artifacts
         self.data[table]['foreign_keys'][foreign_key] = foreign_table
+        self.__views.pop(table, None)
 
     def remove_foreign_key(self, table : str, foreign_key : str) -> None:
         """Removes a foreign key for a specified table. ``foreign_key`` must be a variable of ``table``.
@@ -284,6 +416,7 @@ class MetaData:
             var_info.binning.should_bin = False
             var_info.binning.exclude_from_binning = None
         del self.data[table]['foreign_keys'][foreign_key]
+        self.__views.pop(table, None)
 
     def get_table_names(self) -> List[str]:
         """Retrieve all table name (file names with '.csv' omitted) of the metadata.
@@ -298,9 +431,10 @@ class MetaData:
         :param table: The name of the table, i.e. its file name with '.csv' omitted
         :return: Returns the name of the primary key
         """
-        if table not in self.data:
+        try:
+            return self.data[table]['primary_key']
+        except KeyError:
             raise AttributeError('Table "' + table + '" not in meta data')
-        return self.data[table]['primary_key']
 
     def has_primary_key(self, table : str) -> bool:
         """Checks if the table has a primary key assigned.
@@ -310,16 +444,23 @@ class MetaData:
         """
         return self.get_primary_key(table) != ''
 
-    def get_foreign_keys(self, table) -> Dict[str, str]:
+    def get_primary_key_info(self, table : str) -> Optional[VariableInfo]:
+        """Retrieve the variable information of the primary key of the table.
+
+        :param table: The name of the table, i.e. its file name with '.csv' omitted
+        :return: Returns the variable information object or ``None`` if no primary key was assigned
+        """
+        return self.__get_view(table).primary_key_info
+
+    def get_foreign_keys(self, table) -> Mapping[str, str]:
         """Retrieve all foreign keys of a table as a dictionary with the keys being the foreign keys and the values the
-        foreign tables.
+        foreign tables. The dictionary is read-only, use :meth:`add_foreign_key` and :meth:`remove_foreign_key` for
+        changes.
 
         :param table: The name of the table, i.e. its file name with '.csv' omitted
         :return: Returns the foreign key/table dictionary
         """
-        if table not in self.data:
-            raise AttributeError('Table "' + table + '" not in meta data')
-        return self.data[table]["foreign_keys"]
+        return self.__get_view(table).foreign_keys
 
     def get_label(self, table) -> str:
         """Returns the label of the table or the empty string if none was assigned.
@@ -327,19 +468,18 @@ class MetaData:
         :param table: The name of the table, i.e. its file name with '.csv' omitted
         :return: Returns the table label as string
         """
-        if table not in self.data:
+        try:
+            return self.data[table]['label']
+        except KeyError:
             raise AttributeError('Table "' + table + '" not in meta data')
-        return self.data[table]['label']
 
-    def get_variable_names(self, table : str) -> List[str]:
+    def get_variable_names(self, table : str) -> Tuple[str, ...]:
         """Retrieves all variable names for a given table.
 
         :param table: The name of the table, i.e. its file name with '.csv' omitted
-        :return: Returns the list of retrieved variable names
+        :return: Returns the tuple of retrieved variable names
         """
-        if table not in self.data:
-            raise AttributeError('Table "' + table + '" not in meta data')
-        return list(self.data[table]['variables'].keys())
+        return self.__get_view(table).variable_names
 
     def get_variable(self, table : str, variable : str) -> VariableInfo:
         """Retrieves the information about a given variable for inspection or altering.
@@ -348,12 +488,30 @@ class MetaData:
         :param variable: The name of the variable, i.e. the column name
         :return: Returns the variable information object
         """
-        if table not in self.data:
-            raise AttributeError('Table "' + table + '" not in meta data')
-        if variable not in self.data[table]['variables']:
+        try:
+            return self.data[table]['variables'][variable]
+        except KeyError:
+            if table not in self.data:
+                raise AttributeError('Table "' + table + '" not in meta data')
             raise AttributeError('Variable "' + variable + '" is not a variable of table "' + table
                                  + '" in meta data')
-        return self.data[table]['variables'][variable]
+
+    def __get_view(self, table : str) -> _TableView:
+        """Get the precomputed view of a table. The view is created, if it does not exist yet
+
+        :param table: The name of the table, i.e. its file name with '.csv' omitted
+        :return: Returns the view
+        """
+        view = self.__views.get(table)
+        if view is None:
+            if table not in self.data:
+                raise AttributeError('Table "' + table + '" not in meta data')
+            table_data = self.data[table]
+            view = _TableView(tuple(table_data['variables'].keys()),
+                              MappingProxyType(dict(table_data['foreign_keys'])),
+                              table_data['variables'].get(table_data['primary_key']))
+            self.__views[table] = view
+        return view
 
     def remove_variable(self, table: str, variable: str) -> None:
         """Delete the variable for the specified table from the metadata. If it is a primary key, foreign key
@@ -374,8 +532,11 @@ class MetaData:
                 fks_to_delete = [fk for fk, ft in self.get_foreign_keys(other).items() if fk == variable and ft == table]
                 for fk in fks_to_delete:
                     del self.data[other]["foreign_keys"][fk]
+                if len(fks_to_delete) > 0:
+                    self.__views.pop(other, None)
             self.data[table]['primary_key'] = ''
         del self.data[table]['variables'][variable]
+        self.__views.pop(table, None)
 
     def has_artifacts(self) -> bool:
         """Check, if at least one variable has annotated artifacts
@@ -1,14 +1,24 @@
-import collections
+import os
+import copy
+import random
 import itertools
-from typing import Union, Optional, List, Dict, Iterable
-from graphxplore.Basis import RelationalDataIODevice
-from .variable_info import BinningInfo, VariableType, DataType, ArtifactMode
+import collections.abc
+import concurrent.futures
+from typing import Union, Optional, List, Dict, Iterable, Iterator, Tuple, Any
+from graphxplore.Basis import RelationalDataIODevice, BaseUtils
+from .variable_info import VariableInfo, BinningInfo, VariableType, DataType, ArtifactMode
 from .meta_data import MetaData
+from .column_profile import TableProfile
+from .sketches import MinHashSignature, BloomFilter
+from .profile_cache import ProfileCache
+from .value_filter import ValueFilter
 
 class MetaDataGenerator:
     """This class extracts metadata information from CSV files. It detects primary keys and foreign key relations
-    between tables. Additionally, :class:`VariableInfo` objects are inferred for all columns of all CSV files. The
-    result is a :class:`MetaData` object.
+    between tables. Foreign keys must have the name of the referenced primary key. Columns with other names whose values
+    are contained in a primary key of another table are reported as foreign key candidates. Additionally,
+    :class:`VariableInfo` objects are inferred for all columns of all CSV files. The result is a :class:`MetaData`
+    object.
 
     :param csv_data: The input data as CSV files either as directory path containing the CSV files or as
         dictionary of table name and table data as list of dictionaries per row
@@ -16,7 +26,8 @@ class MetaDataGenerator:
         :class:`ArtifactMode`
     :param missing_vals: These characters indicate missing values, defaults to empty string, None and variations of
         "NaN" and "Na"
-    :param nof_read_lines: Maximum number of lines read from each CSV file to gather metadata, defaults to 1 million
+    :param nof_read_lines: Maximum number of lines read from each CSV file to gather metadata. By default, the leading
+        lines are read. Defaults to 1 million
     :param str_len_free_text: Strings with at least this number of characters are considered free text and the
         containing variable is unfavored as primary key. Defaults to 300.
     :param binning_threshold: Metric variables with more distinct values are marked for binning, defaults to 20
@@ -24,25 +35,69 @@ class MetaDataGenerator:
         defaults to 20
     :param file_encoding: The file encoding of the CSV files (ascii, utf-8,...) in chardet definition.
         Is guessed if not specified. Only used when CSV data is read from a directory, defaults to None
+    :param nof_processes: Number of processes profiling tables concurrently. Large tables are split into row ranges
+        that are profiled separately and merged afterwards, defaults to 1
+    :param rows_per_shard: Approximate number of rows per row range, if ``nof_processes`` is larger than 1. Tables of
+        CSV files are only split, if they contain at most ``nof_read_lines`` lines, and tables of data dictionaries,
+        if they are lists. Defaults to 100000
+    :param use_sketches: If ``True``, columns with more than ``categorical_threshold`` distinct values are profiled
+        approximately in bounded memory with a :class:`ColumnSketch` and ``nof_read_lines`` is ignored, such that
+        whole tables are profiled. Exact values are only kept for columns with fewer distinct values. For further
+        information check :meth:`VariableInfo.estimate_artifacts_and_value_distribution`. Defaults to False
+    :param sample_rows: If ``True``, ``nof_read_lines`` rows are sampled from the whole table instead of reading the
+        leading rows. Tables are split into ``nof_sample_blocks`` strata and a block of consecutive rows is read at a
+        random position of each stratum. CSV files are accessed at random record-aligned byte offsets, such that the
+        I/O cost stays the same. Tables of other data sources than CSV files or lists are sampled with reservoir
+        sampling. Cannot be combined with ``use_sketches``. Defaults to False
+    :param nof_sample_blocks: The number of strata, if ``sample_rows`` is ``True``, defaults to 100
+    :param foreign_key_containment: Minimal estimated fraction of distinct values of a column that must be contained
+        in a primary key of another table to report the column as foreign key candidate, defaults to 0.95
+    :param profile_cache: Path of a pickle file, in which table profiles and fingerprints are stored for incremental
+        refreshes with :meth:`refresh_meta_data`. Nothing is stored, if ``None`` is specified, defaults to None
     """
 
     def __init__(self, csv_data: Union[str, Dict[str, List[Dict[str, str]]]],
                  artifact_mode : ArtifactMode = ArtifactMode.DataTypeMismatchAndOutliers,
                  missing_vals : Iterable[Union[str, None]] = ('', 'NaN', 'Na', 'NA', 'NAN', 'nan', 'na'),
                  nof_read_lines : int = 1000000, str_len_free_text : int = 300, binning_threshold : int = 20,
-                 categorical_threshold : int = 20, file_encoding : Optional[str] = None):
+                 categorical_threshold : int = 20, file_encoding : Optional[str] = None, nof_processes : int = 1,
+                 rows_per_shard : int = 100000, use_sketches : bool = False, sample_rows : bool = False,
+                 nof_sample_blocks : int = 100, foreign_key_containment : float = 0.95,
+                 profile_cache : Optional[str] = None):
         """Constructor method
         """
+        if nof_processes < 1:
+            raise AttributeError('Number of processes must be at least 1')
+        if rows_per_shard < 1:
+            raise AttributeError('Number of rows per shard must be at least 1')
+        if nof_sample_blocks < 1:
+            raise AttributeError('Number of sample blocks must be at least 1')
+        if sample_rows and use_sketches:
+            raise AttributeError('Rows cannot be sampled, when whole tables are profiled with sketches')
+        if foreign_key_containment <= 0 or foreign_key_containment > 1:
+            raise AttributeError('Foreign key containment must be larger than 0 and at most 1')
         tables = RelationalDataIODevice.get_available_table_names(csv_data)
         self.result = MetaData(tables)
         self.csv_data = csv_data
         self.artifact_mode = artifact_mode
         self.missing_vals = missing_vals
+        self.value_filter = ValueFilter(missing_vals)
         self.file_encoding = file_encoding
         self.nof_read_lines = nof_read_lines
         self.str_len_free_text = str_len_free_text
         self.binning_threshold = binning_threshold
         self.categorical_threshold = categorical_threshold
+        self.nof_processes = nof_processes
+        self.rows_per_shard = rows_per_shard
+        self.use_sketches = use_sketches
+        self.sample_rows = sample_rows
+        self.nof_sample_blocks = nof_sample_blocks
+        self.foreign_key_containment = foreign_key_containment
+        self.profile_cache = profile_cache
+        self.foreign_key_candidates = []
+        # value signatures of columns and primary keys gathered during extraction for foreign key discovery
+        self.__value_signatures = {}
+        self.__key_filters = {}
 
     def gather_meta_data(self) -> MetaData:
         """Extracts variables and primary/foreign key relations between CSV files. Each CSV MUST contain a column with
@@ -60,52 +115,221 @@ class MetaDataGenerator:
 
         return self.result
 
+    def refresh_meta_data(self, meta_data : MetaData) -> MetaData:
+        """Incrementally updates metadata that was gathered before from the same data with ``profile_cache`` specified.
+        Only new tables and tables whose fingerprint changed are profiled again (for further information check
+        :meth:`ProfileCache.get_fingerprint`). All other tables are taken from ``meta_data`` and their cached profiles.
+        Tables that do not exist anymore are removed. For profiled tables, user-edited fields are kept, i.e. the table
+        label, descriptions, labels, default values, reference ranges and review status of variables, as well as the
+        primary key, if its values are still unique. Foreign keys are only reassigned for variables of profiled tables
+        and variables that might reference their primary keys. All other foreign keys stay as they are.
+
+        :param meta_data: The metadata of the previous extraction, possibly edited
+        :return: Returns the refreshed metadata
+        """
+        if self.profile_cache is None:
+            raise AttributeError('A profile cache is required for incremental refreshes')
+        cache = ProfileCache.load(self.profile_cache)
+        settings = self.__get_profile_settings()
+        tables = self.result.get_table_names()
+        changed_tables = []
+        for table in tables:
+            entry = cache.get_table_entry(table, settings)
+            if entry is None or table not in meta_data.get_table_names():
+                changed_tables.append(table)
+                continue
+            fingerprint = ProfileCache.get_fingerprint(self.csv_data, table, entry['fingerprint'])
+            if not ProfileCache.fingerprints_match(fingerprint, entry['fingerprint']):
+                changed_tables.append(table)
+                continue
+            entry['fingerprint'] = fingerprint
+            self.__value_signatures[table] = entry['value_signatures']
+            if entry['key_filter'] is not None and entry['key_filter'][0] == meta_data.get_primary_key(table):
+                self.__key_filters[table] = entry['key_filter'][1]
+        print('Refreshing ' + str(len(changed_tables)) + ' of ' + str(len(tables)) + ' tables')
+
+        previous = copy.deepcopy(meta_data)
+        self.result = MetaData(tables)
+        for table in tables:
+            if table not in changed_tables:
+                self.result.data[table] = previous.data[table]
+        for table, profile in self.__extract_table_data(changed_tables):
+            existing = table in previous.get_table_names()
+            primary_key = self.__add_table(table, profile, cache,
+                                           previous.get_primary_key(table) if existing else None)
+            if primary_key == '':
+                print('No primary key found for table "' + table + '"')
+            if existing:
+                self.__keep_user_edits(table, previous)
+
+        print('Assigning foreign keys')
+        self.__refresh_foreign_keys(changed_tables, cache)
+        cache.remove_tables([table for table in cache.tables.keys() if table not in tables])
+        cache.store()
+        return self.result
+
     def extract_variable_infos(self) -> None:
         """Extracts all information about variables contained in CSVs of the source directory and detects primary keys.
-        Artifacts are detected, if specified by ``artifact_mode``. For more information checkout :class:`ArtifactMode`
+        Artifacts are detected, if specified by ``artifact_mode``. For more information checkout :class:`ArtifactMode`.
+        If ``profile_cache`` is specified, the table profiles are stored for incremental refreshes
         """
         tables_without_primary = []
+        cache = ProfileCache.load(self.profile_cache) if self.profile_cache is not None else None
 
-        for table in self.result.get_table_names():
-            print('Extracting variable information from table ' + table)
-            self.result.assign_label(table, label=table)
-            data = self.__extract_data(table)
-            primary_key = self.__get_primary_key(data)
+        for table, profile in self.__extract_table_data():
+            primary_key = self.__add_table(table, profile, cache)
             if primary_key == "":
                 tables_without_primary.append(table)
-            for variable in data.keys():
-                var_info = self.result.add_variable(table, variable)
-                var_info.data_type = data[variable]['data_type']
-                var_info.data_type_distribution = data[variable]['data_type_dist']
-                if variable == primary_key:
-                    self.result.assign_primary_key(table, primary_key)
-                    print('Assigned ' + primary_key + ' as primary key to table ' + table)
-                    continue
-                val_count_dict = data[variable]['value_dist']
-                if (var_info.data_type in [DataType.Decimal, DataType.Integer]
-                        and var_info.variable_type not in [VariableType.PrimaryKey, VariableType.ForeignKey]):
-                    non_missing_vals = {val : count for val, count in val_count_dict.items()
-                                        if val not in self.missing_vals}
-                    non_missing_unique_count = sum(non_missing_vals.values())
-                    if len(non_missing_vals) > self.categorical_threshold:
-                        var_info.variable_type = VariableType.Metric
-                    if non_missing_unique_count > self.binning_threshold:
-                        var_info.binning = BinningInfo(should_bin=True, exclude_from_binning=[])
-                    else:
-                        var_info.binning = BinningInfo(should_bin=False, exclude_from_binning=None)
-                else:
-                    var_info.binning = BinningInfo(should_bin=False, exclude_from_binning=None)
-
-                if var_info.variable_type not in [VariableType.PrimaryKey, VariableType.ForeignKey]:
-                    var_info.detect_artifacts_and_value_distribution(val_count_dict, artifact_mode=self.artifact_mode,
-                                                                     missing_vals=self.missing_vals)
 
-            data.clear()
+        if cache is not None:
+            cache.remove_tables([table for table in cache.tables.keys()
+                                 if table not in self.result.get_table_names()])
+            cache.store()
 
         if len(tables_without_primary) != 0:
             table_str = 'table' if len(tables_without_primary) == 1 else 'tables'
             print('No primary key found for ' + table_str + ' "' + '", "'.join(tables_without_primary) + '"')
 
+    def __add_table(self, table : str, profile : TableProfile, cache : Optional[ProfileCache],
+                    preferred_primary_key : Optional[str] = None) -> str:
+        """Adds the variables of a profiled table to the result, detects the primary key and gathers value signatures.
+        The profile is stored in the cache, if specified.
+
+        :param table: The table name
+        :param profile: The table profile
+        :param cache: The profile cache or ``None``
+        :param preferred_primary_key: This variable is assigned as primary key, if its values are unique and not
+            missing, defaults to None
+        :return: Returns the name of the primary key or an empty string if none was found
+        """
+        data = profile.to_dict()
+        self.result.assign_label(table, label=table)
+        preferred_dict = data.get(preferred_primary_key) if preferred_primary_key is not None else None
+        if (preferred_dict is not None and preferred_dict['values_are_unique']
+                and not preferred_dict['contains_missing_vals']):
+            primary_key = preferred_primary_key
+        else:
+            primary_key = self.__get_primary_key(data)
+        for variable in data.keys():
+            var_info = self.result.add_variable(table, variable)
+            if variable == primary_key:
+                var_info.data_type = data[variable]['data_type']
+                var_info.data_type_distribution = data[variable]['data_type_dist']
+                self.result.assign_primary_key(table, primary_key)
+                print('Assigned ' + primary_key + ' as primary key to table ' + table)
+                continue
+            self.__fill_variable_info(var_info, data[variable])
+
+        self.__collect_value_signatures(table, data, primary_key)
+        if cache is not None:
+            key_filter = (primary_key, self.__key_filters[table]) if table in self.__key_filters else None
+            cache.set_table_entry(table, self.__get_profile_settings(),
+                                  ProfileCache.get_fingerprint(self.csv_data, table), profile,
+                                  self.__value_signatures.get(table, {}), key_filter)
+        data.clear()
+        return primary_key
+
+    def __fill_variable_info(self, var_info : VariableInfo, var_dict : dict) -> None:
+        """Infers data type, variable type, binning, value distribution and artifacts of a variable that is no
+        primary key from its extracted data
+
+        :param var_info: The variable info to fill
+        :param var_dict: The extracted data of the variable
+        """
+        var_info.data_type = var_dict['data_type']
+        var_info.data_type_distribution = var_dict['data_type_dist']
+        val_count_dict = var_dict['value_dist']
+        sketch = var_dict['sketch']
+        if (var_info.data_type in [DataType.Decimal, DataType.Integer]
+                and var_info.variable_type not in [VariableType.PrimaryKey, VariableType.ForeignKey]):
+            if sketch is not None:
+                non_missing_unique_count = var_dict['nof_non_missing']
+                # columns are only sketched, if they have more distinct values than the categorical threshold
+                var_info.variable_type = VariableType.Metric
+            else:
+                # None values of short rows are no user-defined missing values and count as values here
+                non_missing_vals = {val : count for val, count in val_count_dict.items()
+                                    if val not in self.missing_vals}
+                non_missing_unique_count = sum(non_missing_vals.values())
+                if len(non_missing_vals) > self.categorical_threshold:
+                    var_info.variable_type = VariableType.Metric
+            if non_missing_unique_count > self.binning_threshold:
+                var_info.binning = BinningInfo(should_bin=True, exclude_from_binning=[])
+            else:
+                var_info.binning = BinningInfo(should_bin=False, exclude_from_binning=None)
+        else:
+            var_info.binning = BinningInfo(should_bin=False, exclude_from_binning=None)
+
+        if var_info.variable_type not in [VariableType.PrimaryKey, VariableType.ForeignKey]:
+            if sketch is not None:
+                var_info.estimate_artifacts_and_value_distribution(sketch, artifact_mode=self.artifact_mode,
+                                                                   missing_vals=self.missing_vals)
+            else:
+                var_info.detect_artifacts_and_value_distribution(val_count_dict, artifact_mode=self.artifact_mode,
+                                                                 missing_vals=self.missing_vals)
+
+    def __keep_user_edits(self, table : str, previous : MetaData) -> None:
+        """Copies user-edited fields of a table and its variables from the previous metadata to the result
+
+        :param table: The table name
+        :param previous: The previous metadata
+        """
+        self.result.assign_label(table, previous.get_label(table))
+        for variable in self.result.get_variable_names(table):
+            if variable not in previous.get_variable_names(table):
+                continue
+            old_info = previous.get_variable(table, variable)
+            var_info = self.result.get_variable(table, variable)
+            var_info.description = old_info.description
+            var_info.labels = list(old_info.labels)
+            var_info.reviewed = old_info.reviewed
+            if old_info.default_value is not None:
+                var_info.default_value = var_info.cast_value_to_data_type(old_info.default_value)
+            if (old_info.binning is not None and old_info.binning.ref_low is not None and var_info.binning is not None
+                    and var_info.binning.should_bin):
+                var_info.binning.ref_low = old_info.binning.ref_low
+                var_info.binning.ref_high = old_info.binning.ref_high
+
+    def __refresh_foreign_keys(self, changed_tables : List[str], cache : ProfileCache) -> None:
+        """Reassigns foreign keys affected by changed tables. Foreign keys of unchanged tables are removed, if the
+        foreign table does not exist anymore or has another primary key. These variables are inferred again from the
+        cached profile. Variables of changed tables, these variables and variables of unchanged tables with the name
+        of a primary key of a changed table are assigned as foreign key, if possible.
+
+        :param changed_tables: The tables that were profiled again
+        :param cache: The profile cache
+        """
+        tables = self.result.get_table_names()
+        changed_keys = set(self.result.get_primary_key(table) for table in changed_tables)
+        variables_to_assign = {table : set(self.result.get_variable_names(table)) for table in changed_tables}
+        for table in tables:
+            if table in changed_tables:
+                continue
+            to_assign = set()
+            for foreign_key, foreign_table in list(self.result.get_foreign_keys(table).items()):
+                if foreign_table in tables and self.result.get_primary_key(foreign_table) == foreign_key:
+                    continue
+                self.result.remove_foreign_key(table, foreign_key)
+                var_info = self.result.get_variable(table, foreign_key)
+                var_info.variable_type = VariableType.Categorical
+                self.__fill_variable_info(var_info, cache.tables[table]['profile'].columns[foreign_key].to_dict(
+                    self.missing_vals))
+                to_assign.add(foreign_key)
+            for variable in self.result.get_variable_names(table):
+                if variable in changed_keys and variable not in self.result.get_foreign_keys(table):
+                    to_assign.add(variable)
+            variables_to_assign[table] = to_assign
+        self.__assign_foreign_keys(variables_to_assign)
+
+    def __get_profile_settings(self) -> tuple:
+        """Get all settings that influence the table profiles, such that cached profiles can be validated
+
+        :return: Returns the settings
+        """
+        return (tuple(self.missing_vals), self.str_len_free_text, self.file_encoding, self.__get_read_limit(),
+                self.categorical_threshold if self.use_sketches else None, self.sample_rows,
+                self.nof_sample_blocks if self.sample_rows else None)
+
     def __get_primary_key(self, data: dict) -> str:
         """Processes all columns of a CSV and tries to find a primary key which contains only unique cell values and no
         empty values. The hint dict is used (if specified) and integer columns are preferred over string or float.
@@ -133,118 +357,292 @@ class MetaDataGenerator:
         return all_candidates[0]
 
     def assign_foreign_keys(self) -> None:
-        """Assigns foreign keys by detecting occurrences of primary keys in other tables.
+        """Assigns foreign keys by detecting occurrences of primary keys in other tables. A variable is assigned as
+        foreign key, if it has the name of the primary key of another table. If multiple tables have a primary key of
+        this name, the table whose primary key contains most of the variable values is chosen. Variables with other
+        names are reported and stored in ``foreign_key_candidates``, if most of their values are contained in the
+        primary key of another table. Containment is estimated from the value signatures gathered in
+        :meth:`extract_variable_infos`, such that no tables have to be read again.
+        """
+        self.__assign_foreign_keys({table : set(self.result.get_variable_names(table))
+                                    for table in self.result.get_table_names()})
+
+    def __assign_foreign_keys(self, variables_to_assign : Dict[str, set]) -> None:
+        """Assigns the specified variables as foreign keys, if they have the name of a primary key of another table,
+        and gathers foreign key candidates of all unassigned variables
+
+        :param variables_to_assign: The table names and sets of variables to assign
         """
-        for table, foreign_table in itertools.permutations(self.result.get_table_names(), 2):
+        tables_by_key = {}
+        for table in self.result.get_table_names():
+            primary_key = self.result.get_primary_key(table)
+            if primary_key != '':
+                tables_by_key.setdefault(primary_key, []).append(table)
+        self.foreign_key_candidates = []
+        for table in self.result.get_table_names():
+            to_assign = variables_to_assign.get(table, set())
             for variable in self.result.get_variable_names(table):
-                if variable == self.result.get_primary_key(table):
-                    continue
-                if self.result.get_primary_key(foreign_table) != variable:
-                    continue
-                if variable in self.result.get_foreign_keys(table):
-                    print('Variable "' + variable + '" was assigned as foreign key in table "' + table
-                          + '" with foreign table "' + self.result.get_foreign_keys(table)[variable]
-                          + '", but could also be assigned with foreign table "' + foreign_table + '"')
+                if variable == self.result.get_primary_key(table) or variable in self.result.get_foreign_keys(table):
                     continue
-                self.result.add_foreign_key(table, foreign_table, variable)
-                var_info = self.result.get_variable(table, variable)
-                var_info.value_distribution = None
-                var_info.binning = BinningInfo(should_bin=False, exclude_from_binning=None)
+                foreign_tables = [foreign_table for foreign_table in tables_by_key.get(variable, [])
+                                  if foreign_table != table]
+                if len(foreign_tables) == 0:
+                    self.__discover_foreign_key_candidates(table, variable)
+                elif variable in to_assign:
+                    self.__assign_foreign_key(table, variable, foreign_tables)
+        for table, variable, foreign_table, containment in self.foreign_key_candidates:
+            primary_key = self.result.get_primary_key(foreign_table)
+            print('Variable "' + variable + '" of table "' + table + '" might reference primary key "' + primary_key
+                  + '" of table "' + foreign_table + '" (' + str(round(100 * containment)) + '% of values '
+                  'contained). Rename it to "' + primary_key + '" to assign it as foreign key')
+
+    def __assign_foreign_key(self, table : str, variable : str, foreign_tables : List[str]) -> None:
+        """Assign a variable as foreign key. If multiple foreign tables have the variable as primary key, the table
+        with the largest containment of variable values is selected.
+
+        :param table: The table of the variable
+        :param variable: The variable name
+        :param foreign_tables: The tables with the variable as primary key in table order
+        """
+        if len(foreign_tables) > 1:
+            foreign_tables = sorted(foreign_tables,
+                                    key=lambda foreign_table: -self.__get_containment(table, variable, foreign_table))
+        for other_table in foreign_tables[1:]:
+            print('Variable "' + variable + '" was assigned as foreign key in table "' + table
+                  + '" with foreign table "' + foreign_tables[0] + '", but could also be assigned with foreign table "'
+                  + other_table + '"')
+        self.result.add_foreign_key(table, foreign_tables[0], variable)
+        var_info = self.result.get_variable(table, variable)
+        var_info.value_distribution = None
+        var_info.binning = BinningInfo(should_bin=False, exclude_from_binning=None)
+
+    def __discover_foreign_key_candidates(self, table : str, variable : str) -> None:
+        """Add primary keys of other tables with the same data type that contain at least
+        ``self.foreign_key_containment`` of the variable values to ``self.foreign_key_candidates``. Variables with at
+        most ``self.categorical_threshold`` distinct values are skipped, since small value sets are contained in most
+        key ranges. Keys with fewer distinct values than the variable are skipped as well.
+
+        :param table: The table of the variable
+        :param variable: The variable name
+        """
+        if variable not in self.__value_signatures.get(table, {}):
+            return
+        signature, nof_distinct, data_type = self.__value_signatures[table][variable]
+        if nof_distinct <= self.categorical_threshold:
+            return
+        candidates = []
+        for foreign_table, (key_filter, nof_key_distinct, key_data_type) in self.__key_filters.items():
+            # distinct counts of sketches are estimates
+            if foreign_table == table or key_data_type != data_type or nof_distinct > 1.1 * nof_key_distinct:
+                continue
+            containment = signature.get_containment(key_filter, self.foreign_key_containment)
+            if containment >= self.foreign_key_containment:
+                candidates.append((containment, nof_key_distinct, foreign_table))
+        # highest containment first, then keys with the fewest distinct values
+        for containment, _, foreign_table in sorted(candidates, key=lambda x: (-x[0], x[1])):
+            self.foreign_key_candidates.append((table, variable, foreign_table, containment))
+
+    def __get_containment(self, table : str, variable : str, foreign_table : str) -> float:
+        """Estimate the fraction of distinct variable values contained in the primary key of the foreign table
+
+        :param table: The table of the variable
+        :param variable: The variable name
+        :param foreign_table: The foreign table
+        :return: Returns the estimated containment, or 0 if no signatures were gathered
+        """
+        if variable not in self.__value_signatures.get(table, {}) or foreign_table not in self.__key_filters:
+            return 0
+        return self.__value_signatures[table][variable][0].get_containment(self.__key_filters[foreign_table][0])
+
+    def __collect_value_signatures(self, table : str, data : dict, primary_key : str) -> None:
+        """Gather a :class:`BloomFilter` of the primary key values and :class:`MinHashSignature` objects of all other
+        integer and string columns of a table for foreign key discovery. For sketched columns, the signature of the
+        sketch is used for both. Decimal and free text columns are skipped.
 
-    def __extract_data(self, table: str) -> dict:
-        """Extract data for one CSV table. Either by loading a maximum of ``self.nof_read_lines``
+        :param table: The table name
+        :param data: The variable data that was extracted before
+        :param primary_key: The primary key of the table or an empty string
+        """
+        self.__value_signatures[table] = {}
+        self.__key_filters.pop(table, None)
+        for variable, var_dict in data.items():
+            if var_dict['data_type'] == DataType.Decimal or var_dict['contains_freetext']:
+                continue
+            if var_dict['value_dist'] is None:
+                sketch = var_dict['sketch']
+                signature = sketch.value_signature
+                nof_distinct = sketch.distinct_values.estimate()
+            else:
+                values = self.value_filter.get_valid_values(var_dict['value_dist'].keys())
+                nof_distinct = len(values)
+                if variable == primary_key:
+                    signature = BloomFilter(nof_distinct)
+                    for val in values:
+                        signature.add(val)
+                else:
+                    signature = MinHashSignature.from_values(values)
+            if variable == primary_key:
+                self.__key_filters[table] = (signature, nof_distinct, var_dict['data_type'])
+            else:
+                self.__value_signatures[table][variable] = (signature, nof_distinct, var_dict['data_type'])
+
+    def __extract_table_data(self, tables : Optional[List[str]] = None) -> Iterator[Tuple[str, TableProfile]]:
+        """Extract data for all CSV tables in table order. Either by loading a maximum of ``self.nof_read_lines``
         (1 million by default) lines from a CSV file, or retrieving the pre-read data from a dictionary. Data types are
-        inferred and check for empty as well as freetext cells is done.
-
-        :param table: Name of the CSV table
-        :return: Returns a dictionary of the columns with the generated data
-        """
-        with RelationalDataIODevice(self.csv_data, table, file_encoding=self.file_encoding) as reader:
-            data = {}
-            for column in reader.get_header():
-                data[column] = {
-                    'column_name' : column,
-                    'data_type' : DataType.String,
-                    'contains_freetext' : False,
-                    'contains_missing_vals' : False,
-                    'value_dist' : collections.defaultdict(int),
-                    'nof_non_missing' : 0,
-                    'data_type_dist' : {DataType.String : 0, DataType.Integer : 0, DataType.Decimal : 0},
-                    'values_are_unique' : True}
-            counter = 0
-            for line in reader:
-                for column, val in line.items():
-                    data[column]['value_dist'][val] += 1
-                    if val is None or val in self.missing_vals:
-                        data[column]['contains_missing_vals'] = True
-                    else:
-                        data[column]['nof_non_missing'] += 1
-                        datatype = self.__infer_cell_datatype(val)
-                        data[column]['data_type_dist'][datatype] += 1
-                        # cell value not seen before
-                        if data[column]['value_dist'][val] == 1:
-                            if not data[column]['contains_freetext'] and datatype == DataType.String:
-                                if len(val) > self.str_len_free_text or "\n" in val:
-                                    data[column]['contains_freetext'] = True
-                        else:
-                            data[column]['values_are_unique'] = False
-
-                counter += 1
-                if counter == self.nof_read_lines:
-                    break
-            self.__infer_table_datatypes(data)
-            return data
-
-    @staticmethod
-    def __infer_cell_datatype(val: str) -> DataType:
-        """Infers the data type of the current cell with the following hierarchy of specificity/preference:
-        'Integer', 'Float', 'String'.
-
-        :param val: The cell value
-        :return: Returns the inferred cell data type
-        """
-        # data type int or not set yet
-        # try to cast to int
-        try:
-            int(val)
-            return DataType.Integer
-        except (ValueError, TypeError):
-            # try to cast to float
-            try:
-                float(val)
-                return DataType.Decimal
-            except (ValueError, TypeError):
-                return DataType.String
-
-    @staticmethod
-    def __infer_table_datatypes(table_data: dict) -> None:
-        """Infers the data type for each column by checking the distribution of data types of unique cell values.
-
-        :param table_data: The data dictionary for the table
-        """
-        for column, column_data in table_data.items():
-            nof_values = column_data['nof_non_missing']
-            if nof_values > 0:
-                for data_type, count in column_data['data_type_dist'].items():
-                    column_data['data_type_dist'][data_type] = round(count/nof_values, 4)
-            column_data['data_type'] = MetaDataGenerator.__infer_column_datatype(column_data['data_type_dist'])
-
-    @staticmethod
-    def __infer_column_datatype(type_dict: dict) -> DataType:
-        """Checks the distribution of data types for a column. If more than 5% are strings, the whole column is assigned
-        'String'. Same concept with lower priority for decimal numbers. Otherwise, the column is assigned 'Integer',
-        which is the most specific data type.
-
-        :param type_dict: The data type distribution
-        :return: Returns the column data type
-        """
-        string_share = type_dict[DataType.String]
-        if string_share > 0.05:
-            return DataType.String
-        float_share = type_dict[DataType.Decimal]
-        if float_share > 0.05:
-            return DataType.Decimal
-        return DataType.Integer
+        inferred and check for empty as well as freetext cells is done. If ``self.use_sketches`` is ``True``, whole
+        tables are read and columns with many distinct values are sketched. If ``self.sample_rows`` is ``True``, the
+        lines are sampled from the whole table. If ``self.nof_processes`` is larger than 1, all tables are profiled
+        concurrently in a process pool.
 
+        :param tables: The tables to extract. All tables are extracted, if ``None`` is specified, defaults to None
+        :return: Returns an iterator over table names and their profiles
+        """
+        if tables is None:
+            tables = self.result.get_table_names()
+        sketch_threshold = self.categorical_threshold if self.use_sketches else None
+        settings = (self.missing_vals, self.str_len_free_text, self.file_encoding, sketch_threshold)
+        if self.nof_processes == 1:
+            for table in tables:
+                print('Extracting variable information from table ' + table)
+                tasks = self.__get_sample_tasks(table) if self.sample_rows else None
+                if tasks is None:
+                    tasks = [(table, 0, self.__get_read_limit(), None, None)]
+                profile = TableProfile.merge_profiles([_profile_table_shard(task, self.csv_data, settings)
+                                                       for task in tasks])
+                yield table, profile
+            return
+        tasks = {table : self.__get_shard_tasks(table) for table in tables}
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.nof_processes,
+                                                    initializer=_init_profiling_worker,
+                                                    initargs=(self.csv_data, settings)) as executor:
+            futures = {table : [executor.submit(_profile_table_shard, task) for task in table_tasks]
+                       for table, table_tasks in tasks.items()}
+            for table, table_futures in futures.items():
+                print('Extracting variable information from table ' + table + ' (' + str(len(table_futures))
+                      + ' shard' + ('s' if len(table_futures) > 1 else '') + ')')
+                profile = TableProfile.merge_profiles([future.result() for future in table_futures])
+                yield table, profile
+
+    def __get_shard_tasks(self, table : str) -> List[Tuple[str, int, Optional[int], Optional[Tuple[int, int]],
+                                                           Optional[int]]]:
+        """Split a table into row ranges (for lists of row dicts) or byte ranges (for CSV files) of about
+        ``self.rows_per_shard`` rows. Tables are not split, if they might contain more than ``self.nof_read_lines``
+        rows without sketches, or if they are read from other data sources. Sampled tables are split into their
+        sample blocks.
 
+        :param table: The table name
+        :return: Returns the tasks as tuples of table name, start row, end row, byte range and reservoir sample size
+        """
+        if self.sample_rows:
+            sample_tasks = self.__get_sample_tasks(table)
+            if sample_tasks is not None:
+                return sample_tasks
+        if isinstance(self.csv_data, str):
+            file_path = os.path.join(self.csv_data, table + '.csv')
+            nof_lines = BaseUtils.count_lines_in_file(file_path)
+            # lines are an upper bound for the number of records, byte ranges cannot respect the line limit
+            if self.rows_per_shard < nof_lines and (self.use_sketches or nof_lines <= self.nof_read_lines):
+                nof_chunks = -(-nof_lines // self.rows_per_shard)
+                return [(table, 0, None, byte_range, None)
+                        for byte_range in BaseUtils.split_csv_file(file_path, nof_chunks)]
+        elif isinstance(self.csv_data, dict) and isinstance(self.csv_data[table], list):
+            nof_rows = len(self.csv_data[table])
+            if not self.use_sketches:
+                nof_rows = min(nof_rows, self.nof_read_lines)
+            if nof_rows > self.rows_per_shard:
+                return [(table, start, min(start + self.rows_per_shard, nof_rows), None, None)
+                        for start in range(0, nof_rows, self.rows_per_shard)]
+        return [(table, 0, self.__get_read_limit(), None, None)]
 
+    def __get_sample_tasks(self, table : str) -> Optional[List[Tuple[str, int, Optional[int],
+                                                                     Optional[Tuple[int, int]], Optional[int]]]]:
+        """Get tasks for sampling about ``self.nof_read_lines`` rows from the whole table. CSV files are split into
+        random record-aligned byte ranges and sequences of row dicts into random row ranges, one per stratum. All
+        other data sources are sampled with reservoir sampling in one task.
+
+        :param table: The table name
+        :return: Returns the tasks as tuples of table name, start row, end row, byte range and reservoir sample size,
+            or ``None`` if the table has at most ``self.nof_read_lines`` rows and is read completely
+        """
+        rows_per_block = -(-self.nof_read_lines // self.nof_sample_blocks)
+        nof_blocks = -(-self.nof_read_lines // rows_per_block)
+        # seeded by table name for reproducible samples
+        rng = random.Random(table)
+        if isinstance(self.csv_data, str):
+            file_path = os.path.join(self.csv_data, table + '.csv')
+            # lines without header are an upper bound for the number of records
+            nof_records = BaseUtils.count_lines_in_file(file_path) - 1
+            if nof_records <= self.nof_read_lines:
+                return None
+            # rounded up block sizes can exceed the number of records
+            block_fraction = min(1.0, rows_per_block * nof_blocks / nof_records)
+            byte_ranges = BaseUtils.sample_csv_file(file_path, nof_blocks, block_fraction, rng.randrange(2 ** 32))
+            return [(table, 0, rows_per_block, byte_range, None) for byte_range in byte_ranges]
+        table_data = self.csv_data[table] if isinstance(self.csv_data, dict) else None
+        if isinstance(table_data, collections.abc.Sequence):
+            nof_rows = len(table_data)
+            if nof_rows <= self.nof_read_lines:
+                return None
+            stratum_size = nof_rows / nof_blocks
+            tasks = []
+            for idx in range(nof_blocks):
+                stratum_start = int(idx * stratum_size)
+                stratum_end = int((idx + 1) * stratum_size)
+                start = rng.randint(stratum_start, max(stratum_start, stratum_end - rows_per_block))
+                tasks.append((table, start, min(start + rows_per_block, stratum_end), None, None))
+            return tasks
+        # other data sources cannot be accessed at random positions
+        return [(table, 0, None, None, self.nof_read_lines)]
+
+    def __get_read_limit(self) -> Optional[int]:
+        """Get the maximal number of rows read per table
+
+        :return: Returns ``self.nof_read_lines``, or ``None`` if whole tables are read with sketches
+        """
+        return None if self.use_sketches else self.nof_read_lines
+
+_profiling_source = None
+_profiling_settings = None
+
+def _init_profiling_worker(csv_data : Any,
+                           settings : Tuple[Iterable[Union[str, None]], int, Optional[str], Optional[int]]) -> None:
+    """Stores the data source and profiling settings in a worker process of the parallel metadata extraction.
+
+    :param csv_data: The data source
+    :param settings: The missing values, string length of free text, file encoding and sketch threshold
+    """
+    global _profiling_source, _profiling_settings
+    _profiling_source = csv_data
+    _profiling_settings = settings
+
+def _profile_table_shard(task : Tuple[str, int, Optional[int], Optional[Tuple[int, int]], Optional[int]],
+                         csv_data : Any = None,
+                         settings : Optional[Tuple[Iterable[Union[str, None]], int, Optional[str], Optional[int]]] = None
+                         ) -> TableProfile:
+    """Profiles a row range or byte range of a table, or a reservoir sample of its rows. Module-level to be usable in
+    a process pool.
+
+    :param task: The table name, start row, end row (``None`` for the end of the table), byte range and reservoir
+        sample size (``None`` for no sampling)
+    :param csv_data: The data source, taken from the worker initialization if ``None`` is specified
+    :param settings: The missing values, string length of free text, file encoding and sketch threshold, taken from
+        the worker initialization if ``None`` is specified
+    :return: Returns the table profile of the range
+    """
+    table, start, end, byte_range, sample_size = task
+    csv_data = csv_data if csv_data is not None else _profiling_source
+    missing_vals, str_len_free_text, file_encoding, sketch_threshold = (settings if settings is not None
+                                                                        else _profiling_settings)
+    with RelationalDataIODevice(csv_data, table, file_encoding=file_encoding, byte_range=byte_range) as reader:
+        profile = TableProfile(table, reader.get_header(), missing_vals, str_len_free_text, sketch_threshold)
+        table_data = csv_data[table] if isinstance(csv_data, dict) else None
+        if isinstance(table_data, collections.abc.Sequence):
+            # sequences are indexed directly instead of skipping the leading rows
+            rows = (table_data[idx] for idx in range(start, len(table_data) if end is None
+                                                        else min(end, len(table_data))))
+        else:
+            rows = itertools.islice(reader, start, end)
+        if sample_size is not None:
+            rows = BaseUtils.reservoir_sample(rows, sample_size)
+        profile.add_rows(rows)
+    return profile
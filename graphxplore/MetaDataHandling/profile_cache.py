@@ -0,0 +1,131 @@
+import os
+import pickle
+import hashlib
+import collections.abc
+from typing import Dict, Optional, Tuple, Any, Union, List
+from graphxplore.Basis import TableSource, BaseUtils
+from .column_profile import TableProfile
+
+_CACHE_VERSION = 1
+
+class ProfileCache:
+    """This class persists the table profiles, table fingerprints and value signatures of a metadata extraction in a
+    pickle file. It is used by :meth:`MetaDataGenerator.refresh_meta_data` to only profile tables that changed since
+    the last extraction. Cached profiles are only valid for the profiling settings they were created with.
+
+    :param file_path: The path of the pickle file
+    """
+    def __init__(self, file_path : str):
+        """Constructor method
+        """
+        self.file_path = file_path
+        self.settings = None
+        self.tables = {}
+
+    def get_table_entry(self, table : str, settings : tuple) -> Optional[Dict[str, Any]]:
+        """Get the cached entry of a table, if it was created with the same profiling settings
+
+        :param table: The table name
+        :param settings: The current profiling settings
+        :return: Returns the dictionary with keys 'fingerprint', 'profile', 'value_signatures' and 'key_filter', or
+            ``None`` if no valid entry exists
+        """
+        if settings != self.settings:
+            return None
+        return self.tables.get(table)
+
+    def set_table_entry(self, table : str, settings : tuple, fingerprint : Optional[Tuple], profile : TableProfile,
+                        value_signatures : Dict[str, Tuple], key_filter : Optional[Tuple[str, Tuple]]) -> None:
+        """Store the entry of a table. All entries are dropped, if the profiling settings changed
+
+        :param table: The table name
+        :param settings: The current profiling settings
+        :param fingerprint: The table fingerprint created by :meth:`get_fingerprint`
+        :param profile: The table profile
+        :param value_signatures: The value signatures of all non-key columns
+        :param key_filter: The primary key and its value filter, or ``None`` if the table has no primary key
+        """
+        if settings != self.settings:
+            self.settings = settings
+            self.tables = {}
+        self.tables[table] = {'fingerprint' : fingerprint, 'profile' : profile, 'value_signatures' : value_signatures,
+                              'key_filter' : key_filter}
+
+    def remove_tables(self, tables : List[str]) -> None:
+        """Remove the entries of tables, e.g. if they do not exist anymore
+
+        :param tables: The table names
+        """
+        for table in tables:
+            self.tables.pop(table, None)
+
+    def store(self) -> None:
+        """Write the cache to its pickle file. The file is replaced at once, such that interrupted runs do not leave a
+        partially written cache behind
+        """
+        content = {'version' : _CACHE_VERSION, 'settings' : self.settings, 'tables' : self.tables}
+        BaseUtils.write_file_atomically(self.file_path, pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL))
+
+    @staticmethod
+    def load(file_path : str) -> 'ProfileCache':
+        """Load a cache from a pickle file. An empty cache is returned, if the file does not exist or is corrupt,
+        truncated or of another version. It is overwritten on the next :meth:`store`
+
+        :param file_path: The path of the pickle file
+        :return: Returns the cache
+        """
+        cache = ProfileCache(file_path)
+        if os.path.isfile(file_path):
+            with open(file_path, 'rb') as f:
+                try:
+                    content = pickle.load(f)
+                # unpickling garbage can raise various exceptions
+                except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError, KeyError, TypeError,
+                        ValueError):
+                    content = None
+            if (isinstance(content, dict) and content.get('version') == _CACHE_VERSION
+                    and isinstance(content.get('tables'), dict)):
+                cache.settings = content['settings']
+                cache.tables = content['tables']
+        return cache
+
+    @staticmethod
+    def fingerprints_match(first : Optional[Tuple], second : Optional[Tuple]) -> bool:
+        """Check if two fingerprints belong to the same table content. The modification time is ignored, such that
+        touched, but unchanged files match
+
+        :param first: The first fingerprint
+        :param second: The second fingerprint
+        :return: Returns ``True`` if both fingerprints exist and have the same size and content hash
+        """
+        return first is not None and second is not None and first[0] == second[0] and first[2] == second[2]
+
+    @staticmethod
+    def get_fingerprint(data_location : Union[str, Dict[str, Any], TableSource], table : str,
+                        previous : Optional[Tuple] = None) -> Optional[Tuple]:
+        """Get the fingerprint of a table. For CSV files, the fingerprint consists of file size, modification time and
+        a hash of the content. The content is only hashed, if size or modification time differ from the
+        ``previous`` fingerprint. For sequences of row dicts, the fingerprint consists of the number of rows and a hash
+        of all rows. Other data sources have no fingerprint and are always considered changed
+
+        :param data_location: A directory path, a dictionary of table name and list of row dicts, or a table source
+        :param table: The table name
+        :param previous: The previous fingerprint of the table, defaults to None
+        :return: Returns the fingerprint, or ``None`` if it cannot be determined
+        """
+        if isinstance(data_location, str):
+            file_path = os.path.join(data_location, table + '.csv')
+            stat = os.stat(file_path)
+            if previous is not None and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                return previous
+            content_hash = hashlib.blake2b(digest_size=16)
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(1048576), b''):
+                    content_hash.update(block)
+            return stat.st_size, stat.st_mtime_ns, content_hash.hexdigest()
+        if isinstance(data_location, dict) and isinstance(data_location[table], collections.abc.Sequence):
+            content_hash = hashlib.blake2b(digest_size=16)
+            for row in data_location[table]:
+                content_hash.update(repr(list(row.items())).encode('utf-8'))
+            return len(data_location[table]), None, content_hash.hexdigest()
+        return None
@@ -0,0 +1,475 @@
+import math
+import heapq
+import random
+import hashlib
+from typing import Dict, List, Tuple, Union, Optional, Hashable, Iterable
+
+def hash_value(value : str) -> int:
+    """Hash a value to a 64 bit integer. In contrast to :func:`hash`, the result does not depend on the process, such
+    that sketches of different processes can be combined
+
+    :param value: The value
+    :return: Returns the hash
+    """
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+
+class HyperLogLog:
+    """This class estimates the number of distinct values of a stream in constant memory. Each value is hashed and
+    only the maximal number of leading zeros per register is stored. Sketches with the same precision can be merged.
+
+    :param precision: The number of hash bits used for register selection. The sketch has 2 to the power of
+        ``precision`` registers and a relative standard error of about 1.04 divided by the square root of the number
+        of registers. Must be between 4 and 18, defaults to 14
+    """
+    def __init__(self, precision : int = 14):
+        """Constructor method
+        """
+        if precision < 4 or precision > 18:
+            raise AttributeError('Precision of HyperLogLog sketch must be between 4 and 18')
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value : str) -> None:
+        """Add a value to the sketch
+
+        :param value: The value
+        """
+        self.add_hash(hash_value(value))
+
+    def add_hash(self, hashed : int) -> None:
+        """Add the hash of a value to the sketch
+
+        :param hashed: The hash created by :func:`hash_value`
+        """
+        nof_rest_bits = 64 - self.precision
+        idx = hashed >> nof_rest_bits
+        # position of the first set bit in the remaining hash bits
+        rank = nof_rest_bits - (hashed & ((1 << nof_rest_bits) - 1)).bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def merge(self, other : 'HyperLogLog') -> None:
+        """Merge another sketch into this sketch
+
+        :param other: The other sketch
+        """
+        if self.precision != other.precision:
+            raise AttributeError('Cannot merge HyperLogLog sketches of different precision')
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def get_relative_error(self) -> float:
+        """Get the relative standard error of the estimate
+
+        :return: Returns the relative standard error
+        """
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def estimate(self) -> int:
+        """Estimate the number of distinct values added to the sketch
+
+        :return: Returns the estimated distinct count
+        """
+        nof_registers = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / nof_registers)
+        estimate = alpha * nof_registers * nof_registers / sum(2.0 ** -register for register in self.registers)
+        nof_zeros = self.registers.count(0)
+        # linear counting is more accurate for small cardinalities
+        if estimate <= 2.5 * nof_registers and nof_zeros > 0:
+            estimate = nof_registers * math.log(nof_registers / nof_zeros)
+        return round(estimate)
+
+class HeavyHitters:
+    """This class summarizes the most frequent values of a stream with a bounded number of counters (Misra-Gries
+    summary). Counts are underestimated by at most ``error``. If ``error`` is 0, all values and counts are exact.
+    Summaries with the same capacity can be merged.
+
+    :param capacity: The maximal number of counted values, defaults to 100
+    """
+    def __init__(self, capacity : int = 100):
+        """Constructor method
+        """
+        if capacity < 1:
+            raise AttributeError('Capacity of heavy hitters summary must be at least 1')
+        self.capacity = capacity
+        self.counts = {}
+        self.error = 0
+
+    def add(self, value : Hashable, count : int = 1) -> None:
+        """Add a value to the summary
+
+        :param value: The value
+        :param count: The number of occurrences, defaults to 1
+        """
+        counts = self.counts
+        if value in counts:
+            counts[value] += count
+            return
+        if len(counts) < self.capacity:
+            counts[value] = count
+            return
+        # summary is full -> decrement all counters by the same amount and drop the exhausted ones
+        decrement = min(count, min(counts.values()))
+        self.error += decrement
+        for key in list(counts.keys()):
+            new_count = counts[key] - decrement
+            if new_count > 0:
+                counts[key] = new_count
+            else:
+                del counts[key]
+        if count > decrement:
+            counts[value] = count - decrement
+
+    def merge(self, other : 'HeavyHitters') -> None:
+        """Merge another summary into this summary
+
+        :param other: The other summary
+        """
+        if self.capacity != other.capacity:
+            raise AttributeError('Cannot merge heavy hitters summaries of different capacity')
+        counts = self.counts
+        for value, count in other.counts.items():
+            counts[value] = counts.get(value, 0) + count
+        self.error += other.error
+        if len(counts) > self.capacity:
+            cut = sorted(counts.values(), reverse=True)[self.capacity]
+            self.error += cut
+            self.counts = {value : count - cut for value, count in counts.items() if count > cut}
+
+    def is_exact(self) -> bool:
+        """Check if the summary contains all values with their exact counts
+
+        :return: Returns ``True`` if no counter was ever decremented
+        """
+        return self.error == 0
+
+    def get_top(self, nof_values : Optional[int] = None) -> List[Tuple[Hashable, int]]:
+        """Get the most frequent values in descending order of their count
+
+        :param nof_values: The number of values. All counted values are returned if ``None`` is specified, defaults
+            to None
+        :return: Returns the list of values and (underestimated) counts
+        """
+        result = sorted(self.counts.items(), key=lambda x: x[1], reverse=True)
+        return result if nof_values is None else result[:nof_values]
+
+class QuantileSketch:
+    """This class approximates quantiles of a stream of numbers in bounded memory (KLL sketch). Values are kept in a
+    hierarchy of compactors. A full compactor sorts its values and promotes every other value to the next level
+    with doubled weight. The overall weight is preserved, such that ranks are unbiased. Additionally, the
+    ``nof_extremes`` smallest and largest distinct values are tracked exactly together with their counts and their
+    original string representation. Sketches with the same parameters can be merged.
+
+    :param k: The capacity of the highest compactor. Larger values lead to more accurate quantiles, defaults to 200
+    :param nof_extremes: The number of smallest and largest distinct values tracked exactly, defaults to 100
+    """
+    def __init__(self, k : int = 200, nof_extremes : int = 100):
+        """Constructor method
+        """
+        if k < 8:
+            raise AttributeError('Parameter k of quantile sketch must be at least 8')
+        if nof_extremes < 1:
+            raise AttributeError('Number of tracked extreme values must be at least 1')
+        self.k = k
+        self.nof_extremes = nof_extremes
+        self.levels = [[]]
+        self.count = 0
+        self.lowest = {}
+        self.highest = {}
+        self.__bounds = [None, None]
+        self.__capacities = self.__get_capacities()
+        # compaction offsets are pseudo-random, but reproducible
+        self.__random = random.Random(0)
+
+    def add(self, value : Union[int, float], count : int = 1, original : Optional[str] = None) -> None:
+        """Add a value to the sketch
+
+        :param value: The value
+        :param count: The number of occurrences, defaults to 1
+        :param original: The original string representation of the value, defaults to None
+        """
+        self.count += count
+        self.__add_extreme(self.lowest, value, count, original, True)
+        self.__add_extreme(self.highest, value, count, original, False)
+        if count == 1:
+            level_zero = self.levels[0]
+            level_zero.append(value)
+            if len(level_zero) >= self.__capacities[0]:
+                self.__compress()
+            return
+        # a weighted value is inserted once per set bit of its count at the level with the matching weight
+        level = 0
+        while count > 0:
+            if count & 1:
+                while level >= len(self.levels):
+                    self.levels.append([])
+                self.levels[level].append(value)
+            count >>= 1
+            level += 1
+        self.__capacities = self.__get_capacities()
+        self.__compress()
+
+    def merge(self, other : 'QuantileSketch') -> None:
+        """Merge another sketch into this sketch
+
+        :param other: The other sketch
+        """
+        if self.k != other.k or self.nof_extremes != other.nof_extremes:
+            raise AttributeError('Cannot merge quantile sketches with different parameters')
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for level, values in enumerate(other.levels):
+            self.levels[level].extend(values)
+        self.count += other.count
+        for value, (count, original) in other.lowest.items():
+            self.__add_extreme(self.lowest, value, count, original, True)
+        for value, (count, original) in other.highest.items():
+            self.__add_extreme(self.highest, value, count, original, False)
+        self.__capacities = self.__get_capacities()
+        self.__compress()
+
+    def get_quantile(self, fraction : float) -> Optional[Union[int, float]]:
+        """Get the approximate quantile of the added values
+
+        :param fraction: The fraction of values smaller or equal to the quantile, between 0 and 1
+        :return: Returns the quantile, or ``None`` if the sketch is empty
+        """
+        if fraction < 0 or fraction > 1:
+            raise AttributeError('Quantile fraction must be between 0 and 1')
+        if self.count == 0:
+            return None
+        weighted = sorted((value, 1 << level) for level, values in enumerate(self.levels) for value in values)
+        target = fraction * self.count
+        accumulated = 0
+        for value, weight in weighted:
+            accumulated += weight
+            if accumulated >= target:
+                return value
+        return weighted[-1][0]
+
+    def get_min(self) -> Optional[Union[int, float]]:
+        """Get the minimal value
+
+        :return: Returns the exact minimum, or ``None`` if the sketch is empty
+        """
+        return min(self.lowest.keys()) if len(self.lowest) > 0 else None
+
+    def get_max(self) -> Optional[Union[int, float]]:
+        """Get the maximal value
+
+        :return: Returns the exact maximum, or ``None`` if the sketch is empty
+        """
+        return max(self.highest.keys()) if len(self.highest) > 0 else None
+
+    def get_extremes(self) -> Tuple[List[Tuple[Union[int, float], int, Optional[str]]], bool]:
+        """Get the tracked smallest and largest distinct values in ascending order. If the sketch contains at most
+        ``nof_extremes`` distinct values, all values are tracked and the list is complete. Otherwise, the list consists
+        of a lower and an upper segment and values between them are not contained.
+
+        :return: Returns the list of values, counts and original strings, and if the list is complete
+        """
+        merged = dict(self.lowest)
+        merged.update(self.highest)
+        # overlapping segments -> all distinct values are tracked
+        complete = len(merged) < 2 * self.nof_extremes
+        return [(value, count, original) for value, (count, original) in sorted(merged.items())], complete
+
+    def __get_capacities(self) -> List[int]:
+        height = len(self.levels)
+        return [max(2, math.ceil(self.k * (2 / 3) ** (height - level - 1))) for level in range(height)]
+
+    def __compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            values = self.levels[level]
+            if len(values) >= self.__capacities[level]:
+                if level + 1 == len(self.levels):
+                    self.levels.append([])
+                values.sort()
+                # only an even number of values is compacted, such that the overall weight is preserved
+                kept = [values.pop()] if len(values) % 2 == 1 else []
+                offset = self.__random.randint(0, 1)
+                self.levels[level + 1].extend(values[offset::2])
+                self.levels[level] = kept
+                self.__capacities = self.__get_capacities()
+            level += 1
+
+    def __add_extreme(self, extremes : Dict[Union[int, float], List], value : Union[int, float], count : int,
+                      original : Optional[str], lowest : bool) -> None:
+        entry = extremes.get(value)
+        if entry is not None:
+            entry[0] += count
+            return
+        bound_idx = 0 if lowest else 1
+        if len(extremes) < self.nof_extremes:
+            extremes[value] = [count, original]
+            if len(extremes) == self.nof_extremes:
+                self.__bounds[bound_idx] = max(extremes.keys()) if lowest else min(extremes.keys())
+            return
+        # the innermost tracked value is cached, since most values of large streams are not extreme
+        bound = self.__bounds[bound_idx]
+        if (value < bound) if lowest else (value > bound):
+            del extremes[bound]
+            extremes[value] = [count, original]
+            self.__bounds[bound_idx] = max(extremes.keys()) if lowest else min(extremes.keys())
+
+class MinHashSignature:
+    """This class keeps the ``size`` smallest hashes of the distinct values of a column (bottom-k min-hash signature).
+    The kept hashes are a uniform random sample of the distinct values and can be used to estimate the containment of
+    the column values in another column. Signatures with the same size can be merged.
+
+    :param size: The maximal number of kept hashes, defaults to 256
+    """
+    def __init__(self, size : int = 256):
+        """Constructor method
+        """
+        if size < 1:
+            raise AttributeError('Size of min-hash signature must be at least 1')
+        self.size = size
+        self.hashes = set()
+        # max-heap of the kept hashes as negated values
+        self.__heap = []
+
+    def add(self, value : str) -> None:
+        """Add a value to the signature
+
+        :param value: The value
+        """
+        self.add_hash(hash_value(value))
+
+    def add_hash(self, hashed : int) -> None:
+        """Add the hash of a value to the signature
+
+        :param hashed: The hash created by :func:`hash_value`
+        """
+        if hashed in self.hashes:
+            return
+        if len(self.hashes) < self.size:
+            self.hashes.add(hashed)
+            heapq.heappush(self.__heap, -hashed)
+        elif hashed < -self.__heap[0]:
+            self.hashes.remove(-heapq.heappushpop(self.__heap, -hashed))
+            self.hashes.add(hashed)
+
+    def merge(self, other : 'MinHashSignature') -> None:
+        """Merge another signature into this signature
+
+        :param other: The other signature
+        """
+        if self.size != other.size:
+            raise AttributeError('Cannot merge min-hash signatures of different size')
+        for hashed in other.hashes:
+            self.add_hash(hashed)
+
+    def is_complete(self) -> bool:
+        """Check if the signature contains the hashes of all distinct values
+
+        :return: Returns ``True`` if fewer than ``size`` distinct values were added
+        """
+        return len(self.hashes) < self.size
+
+    def get_containment(self, other : Union['MinHashSignature', 'BloomFilter'], min_containment : float = 0) -> float:
+        """Estimate the fraction of distinct values of this signature that are contained in another column. The
+        other column is either represented by a :class:`BloomFilter` of all its values, or by its signature. For
+        signatures, only sampled hashes up to the largest kept hash of the other signature can be checked. The
+        evaluation stops early, if the containment cannot reach ``min_containment``, or if the majority of at least
+        three checked values is not contained. The latter keeps the comparison of unrelated columns cheap.
+
+        :param other: The Bloom filter or signature of the other column
+        :param min_containment: The evaluation stops, if the containment falls below, defaults to 0
+        :return: Returns the estimated containment, or 0 if it is below ``min_containment`` or cannot be estimated
+        """
+        if isinstance(other, BloomFilter):
+            candidates = self.hashes
+            contains = other.contains_hash
+        else:
+            max_hash = max(other.hashes) if not other.is_complete() else None
+            candidates = [hashed for hashed in self.hashes if max_hash is None or hashed <= max_hash]
+            contains = other.hashes.__contains__
+        if len(candidates) == 0:
+            return 0
+        max_misses = (1 - min_containment) * len(candidates)
+        nof_misses = 0
+        nof_checked = 0
+        for hashed in candidates:
+            nof_checked += 1
+            if not contains(hashed):
+                nof_misses += 1
+                if nof_misses > max_misses or (nof_misses >= 3 and 2 * nof_misses > nof_checked):
+                    return 0
+        return 1 - nof_misses / len(candidates)
+
+    @staticmethod
+    def from_values(values : Iterable[str], size : int = 256) -> 'MinHashSignature':
+        """Create the signature of distinct values
+
+        :param values: The distinct values
+        :param size: The maximal number of kept hashes, defaults to 256
+        :return: Returns the signature
+        """
+        signature = MinHashSignature(size)
+        for hashed in heapq.nsmallest(size, (hash_value(value) for value in values)):
+            signature.add_hash(hashed)
+        return signature
+
+class BloomFilter:
+    """This class represents a set of values in a fixed number of bits. Membership tests have no false negatives and
+    false positives with a probability of about ``error_rate``, if at most ``capacity`` values are added. Bit positions
+    are derived from the 64 bit hash of :func:`hash_value` with double hashing
+
+    :param capacity: The expected number of distinct values
+    :param error_rate: The false positive probability, defaults to 0.01
+    """
+    def __init__(self, capacity : int, error_rate : float = 0.01):
+        """Constructor method
+        """
+        if error_rate <= 0 or error_rate >= 1:
+            raise AttributeError('Error rate of Bloom filter must be between 0 and 1')
+        capacity = max(capacity, 1)
+        self.nof_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.nof_hashes = max(1, round(self.nof_bits / capacity * math.log(2)))
+        self.bits = bytearray(-(-self.nof_bits // 8))
+
+    def add(self, value : str) -> None:
+        """Add a value to the filter
+
+        :param value: The value
+        """
+        self.add_hash(hash_value(value))
+
+    def add_hash(self, hashed : int) -> None:
+        """Add the hash of a value to the filter
+
+        :param hashed: The hash created by :func:`hash_value`
+        """
+        for position in self.__get_positions(hashed):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def contains(self, value : str) -> bool:
+        """Check if a value might have been added to the filter
+
+        :param value: The value
+        :return: Returns ``False`` if the value was not added, ``True`` if it was probably added
+        """
+        return self.contains_hash(hash_value(value))
+
+    def contains_hash(self, hashed : int) -> bool:
+        """Check if the hash of a value might have been added to the filter
+
+        :param hashed: The hash created by :func:`hash_value`
+        :return: Returns ``False`` if the hash was not added, ``True`` if it was probably added
+        """
+        bits = self.bits
+        nof_bits = self.nof_bits
+        first = hashed & 0xffffffff
+        second = (hashed >> 32) | 1
+        for idx in range(self.nof_hashes):
+            position = (first + idx * second) % nof_bits
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __get_positions(self, hashed : int) -> Iterable[int]:
+        first = hashed & 0xffffffff
+        # odd step, such that the step is never zero
+        second = (hashed >> 32) | 1
+        return ((first + idx * second) % self.nof_bits for idx in range(self.nof_hashes))
@@ -0,0 +1,51 @@
+from typing import Iterable, Optional, Union, List
+
+class ValueFilter:
+    """This class checks if cell values of a variable are missing values or artifacts. Both are stored as frozensets,
+    such that each check is a single hash lookup independent of the number of artifacts. ``None`` is always considered
+    missing. A filter is compiled once per variable with :meth:`VariableInfo.get_value_filter` and reused for all cells
+    of the variable. It does not reflect later changes of the artifacts of the variable.
+
+    :param missing_vals: The missing values, defaults to common missing value definitions
+    :param artifacts: The artifacts as strings, defaults to None
+    """
+    def __init__(self, missing_vals : Iterable[Union[str, None]] = ('', 'NaN', 'Na', 'NA', 'NAN', 'nan', 'na'),
+                 artifacts : Optional[Iterable[str]] = None):
+        """Constructor method
+        """
+        self.missing_vals = frozenset(missing_vals).union((None,))
+        self.artifacts = frozenset(artifacts) if artifacts is not None else frozenset()
+        self.excluded_vals = self.missing_vals.union(self.artifacts)
+
+    def is_missing(self, value : Optional[str]) -> bool:
+        """Check if a value is a missing value
+
+        :param value: The cell value
+        :return: Returns ``True`` if the value is missing
+        """
+        return value in self.missing_vals
+
+    def is_artifact(self, value : Optional[str]) -> bool:
+        """Check if a value is an artifact
+
+        :param value: The cell value
+        :return: Returns ``True`` if the value is an artifact
+        """
+        return value in self.artifacts
+
+    def is_excluded(self, value : Optional[str]) -> bool:
+        """Check if a value is a missing value or an artifact
+
+        :param value: The cell value
+        :return: Returns ``True`` if the value is missing or an artifact
+        """
+        return value in self.excluded_vals
+
+    def get_valid_values(self, values : Iterable[Optional[str]]) -> List[str]:
+        """Get all values that are neither missing nor artifacts
+
+        :param values: The cell values
+        :return: Returns the remaining values in their original order
+        """
+        excluded_vals = self.excluded_vals
+        return [value for value in values if value not in excluded_vals]
@@ -1,9 +1,13 @@
 import math
 import re
+import numpy as np
 from enum import Enum
-from typing import List, Union, Any, Optional, Dict, Iterable
-from dataclasses import dataclass, asdict
-from graphxplore.Basis import BaseUtils
+from typing import List, Union, Any, Optional, Dict, Iterable, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, fields, is_dataclass
+from graphxplore.Basis import ValueDistribution
+from .value_filter import ValueFilter
+if TYPE_CHECKING:
+    from .column_profile import ColumnSketch
 
 class VariableType(str, Enum):
     """The type of variable.
@@ -266,7 +270,8 @@ class VariableInfo:
 
         :return: Returns the generated dictionary
         """
-        result = asdict(self)
+        # all containers of variable infos only hold immutable values, shallow copies suffice
+        result = {field.name : VariableInfo.__copy_field(getattr(self, field.name)) for field in fields(self)}
         result['variable_type'] = self.variable_type.value
         result['data_type'] = self.data_type.value
         if self.data_type_distribution is not None:
@@ -274,6 +279,21 @@ class VariableInfo:
                                                 for data_type, frac in self.data_type_distribution.items()}
         return result
 
+    @staticmethod
+    def __copy_field(value : Any) -> Any:
+        """Copies a field value like :func:`dataclasses.asdict`, but without deep copies of immutable values
+
+        :param value: The field value
+        :return: Returns the copy
+        """
+        if isinstance(value, list):
+            return list(value)
+        if isinstance(value, dict):
+            return dict(value)
+        if is_dataclass(value):
+            return {field.name : VariableInfo.__copy_field(getattr(value, field.name)) for field in fields(value)}
+        return value
+
     def cast_value_to_data_type(self, val_to_cast : Union[str, int, float]) -> Union[str, int, float, None]:
         """Casts a value to the data type of the variable. Returns `None` if the value could not be cast.
 
@@ -282,6 +302,23 @@ class VariableInfo:
         """
         return self.cast_value(val_to_cast, self.data_type)
 
+    def get_value_filter(self, missing_vals : Iterable[Union[str, None]] = ('', 'NaN', 'Na', 'NA', 'NAN', 'nan', 'na')
+                         ) -> ValueFilter:
+        """Compiles the missing values and the current artifacts of the variable to a :class:`ValueFilter`
+
+        :param missing_vals: The list of possible missing values as string
+        :return: Returns the value filter
+        """
+        return ValueFilter(missing_vals, self.artifacts)
+
+    def get_cast_memo(self, max_size : int = 100000) -> 'CastMemo':
+        """Creates a :class:`CastMemo` for casting values to the data type of the variable
+
+        :param max_size: The maximal number of memoized strings, defaults to 100000
+        :return: Returns the cast memo
+        """
+        return CastMemo(self.data_type, max_size)
+
     @staticmethod
     def cast_value(val_to_cast : str, data_type : DataType) -> Union[str, int, float, None]:
         """Casts a value to the specified data type. Returns `None` if the value could not be cast.
@@ -316,49 +353,64 @@ class VariableInfo:
             check :class:`ArtifactMode`
         :param missing_vals: The list of possible missing values as string
         """
-        detected_artifacts = set(self.artifacts) if self.artifacts is not None else set()
-        cast_vals = {}
+        value_filter = self.get_value_filter(missing_vals)
+        detected_artifacts = set(value_filter.artifacts)
         artifact_count = 0
         missing_count = 0
-        cast_val_orig_dict = {}
+        cast_vals = []
+        counts = []
+        orig_vals = []
 
         # values that do not match the data type -> artifact
+        if self.data_type == DataType.Integer:
+            cast_func = int
+        elif self.data_type == DataType.Decimal:
+            cast_func = float
+        else:
+            cast_func = str
         for val, count in value_count_dict.items():
-            if val is None or val in missing_vals:
-                missing_count += count
-                continue
-            if val in detected_artifacts:
-                artifact_count += count
+            if value_filter.is_excluded(val):
+                if value_filter.is_missing(val):
+                    missing_count += count
+                else:
+                    artifact_count += count
                 continue
-            cast_val = self.cast_value_to_data_type(val)
-            if cast_val is None:
+            try:
+                cast_val = cast_func(val)
+            except (ValueError, TypeError):
                 if artifact_mode != ArtifactMode.NoArtifacts:
                     detected_artifacts.add(val)
                     artifact_count += count
-            else:
-                cast_vals[cast_val] = count
-                cast_val_orig_dict[cast_val] = val
+                continue
+            cast_vals.append(cast_val)
+            counts.append(count)
+            orig_vals.append(val)
 
         if self.variable_type == VariableType.Categorical:
-            sorted_vals = sorted(cast_vals.items(), key=lambda  x: x[1], reverse=True)
-            summed_count = sum(cast_vals.values())
-            explicit_count = 0
-            category_counts = {}
-            top_ten_idx = min(len(sorted_vals), 10)
-            for idx in range(top_ten_idx):
-                cast_val, count = sorted_vals[idx]
-                category_counts[cast_val_orig_dict[cast_val]] = count
-                explicit_count += count
+            if self.data_type == DataType.String:
+                count_arr = np.array(counts, dtype=np.int64)
+            else:
+                # different strings can be cast to the same number. Like in a dictionary, the count and original value
+                # of the last occurrence are kept at the position of the first occurrence
+                _, first_idxs, count_arr, last_idxs = VariableInfo.__merge_equal_cast_values(cast_vals, counts)
+                occurrence_order = np.argsort(first_idxs)
+                count_arr = count_arr[occurrence_order]
+                orig_vals = [orig_vals[idx] for idx in last_idxs[occurrence_order].tolist()]
+            # descending count, ties in order of occurrence
+            count_order = np.argsort(-count_arr, kind='stable')
+            summed_count = int(count_arr.sum())
+            top_ten_idxs = count_order[:10].tolist()
+            category_counts = {orig_vals[idx] : int(count_arr[idx]) for idx in top_ten_idxs}
+            explicit_count = sum(category_counts.values())
             # top 10 values with the highest account for at least 50% of data
             # -> values which appear only once and are not in top 10 -> artifacts
             if explicit_count >= 0.5 * summed_count:
                 other_count = summed_count - explicit_count
-                if artifact_mode == ArtifactMode.DataTypeMismatchAndOutliers and top_ten_idx < len(sorted_vals):
-                    for cast_val, count in sorted_vals[top_ten_idx:]:
-                        if count == 1:
-                            detected_artifacts.add(cast_val_orig_dict[cast_val])
-                            artifact_count += count
-                            other_count -= count
+                if artifact_mode == ArtifactMode.DataTypeMismatchAndOutliers and len(top_ten_idxs) < len(count_arr):
+                    single_idxs = count_order[10:][count_arr[count_order[10:]] == 1].tolist()
+                    detected_artifacts.update(orig_vals[idx] for idx in single_idxs)
+                    artifact_count += len(single_idxs)
+                    other_count -= len(single_idxs)
                 self.value_distribution = CategoricalDistribution(category_counts, other_count, missing_count,
                                                                   artifact_count)
             # top 10 values with the highest count are less than 50% of data -> no artifacts (apart wrong data type)
@@ -368,32 +420,25 @@ class VariableInfo:
         elif self.variable_type == VariableType.Metric:
             if self.data_type == DataType.String:
                 raise AttributeError('Variable ' + self.name + ' is declared as "Metric", but is of type "String"')
-            median, first_quartile, third_quartile = BaseUtils.calculate_median_quartiles(cast_vals)
+            sorted_vals, _, count_arr, last_idxs = VariableInfo.__merge_equal_cast_values(cast_vals, counts)
+            distribution = ValueDistribution(sorted_vals, count_arr)
+            median, first_quartile, third_quartile = distribution.get_median_quartiles()
             inter_quartile_range = third_quartile - first_quartile
             whisker_length = 1.5 * inter_quartile_range
-            sorted_vals = sorted(cast_vals.keys())
-            lower_fence = max(sorted_vals[0], first_quartile - whisker_length)
-            upper_fence = min(sorted_vals[-1], third_quartile + whisker_length)
-            outliers = []
-            for idx in range(len(sorted_vals)):
-                cast_val = sorted_vals[idx]
-                # metric values have no other value within 1.5 x interquartile range -> artifact
-                if artifact_mode == ArtifactMode.DataTypeMismatchAndOutliers:
-                    has_close_neighbor = False
-                    if idx > 0:
-                        left_val = sorted_vals[idx - 1]
-                        if math.fabs(cast_val - left_val) <= whisker_length:
-                            has_close_neighbor = True
-                    if not has_close_neighbor and idx < len(sorted_vals) - 1:
-                        right_val = sorted_vals[idx + 1]
-                        if math.fabs(right_val - cast_val) <= whisker_length:
-                            has_close_neighbor = True
-                    if not has_close_neighbor:
-                        detected_artifacts.add(cast_val_orig_dict[cast_val])
-                        artifact_count += cast_vals[cast_val]
-                if ((cast_val < lower_fence or cast_val > upper_fence)
-                        and cast_val_orig_dict[cast_val] not in detected_artifacts):
-                    outliers.append(cast_val)
+            lower_fence = max(distribution.get_min(), first_quartile - whisker_length)
+            upper_fence = min(distribution.get_max(), third_quartile + whisker_length)
+            is_artifact = np.zeros(len(sorted_vals), dtype=bool)
+            # metric values have no other value within 1.5 x interquartile range -> artifact
+            if artifact_mode == ArtifactMode.DataTypeMismatchAndOutliers:
+                has_close_neighbor = np.zeros(len(sorted_vals), dtype=bool)
+                close_gaps = np.abs(np.diff(sorted_vals)) <= whisker_length
+                has_close_neighbor[1:] |= close_gaps
+                has_close_neighbor[:-1] |= close_gaps
+                is_artifact = ~has_close_neighbor
+                detected_artifacts.update(orig_vals[idx] for idx in last_idxs[is_artifact].tolist())
+                artifact_count += int(count_arr[is_artifact].sum())
+            is_outlier = ((sorted_vals < lower_fence) | (sorted_vals > upper_fence)) & ~is_artifact
+            outliers = sorted_vals[is_outlier].tolist()
             self.value_distribution = MetricDistribution(median, first_quartile, third_quartile, lower_fence,
                                                          upper_fence, outliers, missing_count, artifact_count)
 
@@ -402,6 +447,114 @@ class VariableInfo:
         else:
             self.artifacts = None
 
+    @staticmethod
+    def __merge_equal_cast_values(cast_vals : List[Union[int, float]], counts : List[int]
+                                  ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Sorts cast values and merges equal values. Of equal values, the first occurrence is kept together with the
+        count of the last occurrence
+
+        :param cast_vals: The cast values
+        :param counts: The counts of the cast values
+        :return: Returns the sorted distinct values, the indices of their first and last occurrence, and their counts
+        """
+        vals = ValueDistribution.values_to_array(cast_vals)
+        sorted_idxs = np.argsort(vals, kind='stable')
+        sorted_vals = vals[sorted_idxs]
+        count_arr = np.array(counts, dtype=np.int64)[sorted_idxs]
+        is_first = np.ones(len(sorted_idxs), dtype=bool)
+        is_first[1:] = sorted_vals[1:] != sorted_vals[:-1]
+        if is_first.all():
+            return sorted_vals, sorted_idxs, count_arr, sorted_idxs
+        first_positions = np.flatnonzero(is_first)
+        last_positions = np.append(first_positions[1:], len(sorted_idxs)) - 1
+        return (sorted_vals[first_positions], sorted_idxs[first_positions], count_arr[last_positions],
+                sorted_idxs[last_positions])
+
+    def estimate_artifacts_and_value_distribution(
+            self, sketch : 'ColumnSketch', artifact_mode : ArtifactMode = ArtifactMode.DataTypeMismatchAndOutliers,
+            missing_vals : Iterable[Union[str, None]] = ('', 'NaN', 'Na', 'NA', 'NAN', 'nan', 'na')):
+        """Same as :meth:`detect_artifacts_and_value_distribution`, but based on a
+        :class:`~graphxplore.MetaDataHandling.ColumnSketch` instead of the exact value counts. If the sketch still
+        contains all distinct values with exact counts, the result is identical. Otherwise, categorical distributions
+        are derived from the heavy hitters, and quartiles of metric distributions from the quantile sketch. Data type
+        mismatches are counted exactly, but only listed up to the number of examples kept by the sketch. Outliers and
+        values without close neighbor are only detected among the smallest and largest values tracked by the sketch,
+        and rare categories are not detected as artifacts.
+
+        :param sketch: The sketch of the column values
+        :param artifact_mode: Determines if artifacts should be detected and at what level. For further information
+            check :class:`ArtifactMode`
+        :param missing_vals: The list of possible missing values as string
+        """
+        exact_value_dist = sketch.get_exact_value_dist()
+        if exact_value_dist is not None:
+            self.detect_artifacts_and_value_distribution(exact_value_dist, artifact_mode, missing_vals)
+            return
+        detected_artifacts = set(self.artifacts) if self.artifacts is not None else set()
+        missing_count = sketch.nof_missing
+        mismatches, nof_mismatches = sketch.get_type_mismatches(self.data_type)
+        artifact_count = 0
+        if artifact_mode != ArtifactMode.NoArtifacts:
+            detected_artifacts.update(mismatches.keys())
+            artifact_count += nof_mismatches
+        nof_valid = sum(sketch.type_counts.values()) - nof_mismatches
+
+        if self.variable_type == VariableType.Categorical:
+            category_counts = {}
+            for val, count in sketch.heavy_hitters.get_top():
+                if val in detected_artifacts or self.cast_value_to_data_type(val) is None:
+                    continue
+                category_counts[val] = count
+                if len(category_counts) == 10:
+                    break
+            explicit_count = sum(category_counts.values())
+            if explicit_count >= 0.5 * nof_valid:
+                self.value_distribution = CategoricalDistribution(category_counts, nof_valid - explicit_count,
+                                                                  missing_count, artifact_count)
+            else:
+                self.value_distribution = None
+
+        elif self.variable_type == VariableType.Metric:
+            if self.data_type == DataType.String:
+                raise AttributeError('Variable ' + self.name + ' is declared as "Metric", but is of type "String"')
+            quantiles = sketch.get_quantile_sketch(self.data_type)
+            if quantiles.count == 0:
+                self.value_distribution = None
+            else:
+                median, first_quartile, third_quartile = [
+                    self.cast_value_to_data_type(quantiles.get_quantile(fraction)) for fraction in (0.5, 0.25, 0.75)]
+                inter_quartile_range = third_quartile - first_quartile
+                whisker_length = 1.5 * inter_quartile_range
+                lower_fence = max(self.cast_value_to_data_type(quantiles.get_min()), first_quartile - whisker_length)
+                upper_fence = min(self.cast_value_to_data_type(quantiles.get_max()), third_quartile + whisker_length)
+                extremes, complete = quantiles.get_extremes()
+                outliers = []
+                for idx in range(len(extremes)):
+                    cast_val, count, orig_val = extremes[idx]
+                    cast_val = self.cast_value_to_data_type(cast_val)
+                    if artifact_mode == ArtifactMode.DataTypeMismatchAndOutliers:
+                        # the inner neighbor of the last smallest and first largest tracked value is unknown
+                        has_close_neighbor = not complete and idx in (quantiles.nof_extremes - 1,
+                                                                     quantiles.nof_extremes)
+                        if not has_close_neighbor and idx > 0:
+                            if math.fabs(cast_val - extremes[idx - 1][0]) <= whisker_length:
+                                has_close_neighbor = True
+                        if not has_close_neighbor and idx < len(extremes) - 1:
+                            if math.fabs(extremes[idx + 1][0] - cast_val) <= whisker_length:
+                                has_close_neighbor = True
+                        if not has_close_neighbor:
+                            detected_artifacts.add(orig_val)
+                            artifact_count += count
+                    if (cast_val < lower_fence or cast_val > upper_fence) and orig_val not in detected_artifacts:
+                        outliers.append(cast_val)
+                self.value_distribution = MetricDistribution(median, first_quartile, third_quartile, lower_fence,
+                                                             upper_fence, outliers, missing_count, artifact_count)
+
+        if len(detected_artifacts) > 0:
+            self.artifacts = sorted(detected_artifacts)
+        else:
+            self.artifacts = None
+
     @staticmethod
     def __check_dict_entry(var_name : str, dict_key : str, dict_to_check : dict, data_type : Union[Any, tuple],
                            none_valid : bool = False):
@@ -431,4 +584,58 @@ class VariableInfo:
             if none_valid:
                 error_string += ', None would also be valid'
             raise AttributeError(error_string)
-        return dict_to_check[dict_key]
\ No newline at end of file
+        return dict_to_check[dict_key]
+
+class CastMemo:
+    """This class memoizes the results of :meth:`VariableInfo.cast_value` for the string values of a single variable.
+    Categorical variables have few distinct raw strings, such that most casts are answered by a dictionary lookup
+    instead of an exception-driven conversion. At most ``max_size`` distinct strings are memoized, further strings are
+    cast without memoization. Values of other types are never memoized, since e.g. ``1`` and ``1.0`` are equal
+    dictionary keys, but differ as strings. The number of hits and misses is counted.
+
+    :param data_type: The data type to which values are cast
+    :param max_size: The maximal number of memoized strings, defaults to 100000
+    """
+    def __init__(self, data_type : DataType, max_size : int = 100000):
+        """Constructor method
+        """
+        if max_size < 0:
+            raise AttributeError('Maximal size of cast memo cannot be negative')
+        self.data_type = data_type
+        self.max_size = max_size
+        self.nof_hits = 0
+        self.nof_misses = 0
+        self.__memo = {}
+
+    def __len__(self) -> int:
+        return len(self.__memo)
+
+    def cast(self, val_to_cast : Union[str, int, float]) -> Union[str, int, float, None]:
+        """Casts a value to the data type of the memo. Returns `None` if the value could not be cast.
+
+        :param val_to_cast: The value which should be cast
+        :return: Returns the cast value
+        """
+        if type(val_to_cast) is not str:
+            self.nof_misses += 1
+            return VariableInfo.cast_value(val_to_cast, self.data_type)
+        try:
+            cast_val = self.__memo[val_to_cast]
+        except KeyError:
+            self.nof_misses += 1
+            cast_val = VariableInfo.cast_value(val_to_cast, self.data_type)
+            if len(self.__memo) < self.max_size:
+                self.__memo[val_to_cast] = cast_val
+            return cast_val
+        self.nof_hits += 1
+        return cast_val
+
+    def get_hit_rate(self) -> Optional[float]:
+        """Get the share of casts that were answered by the memo
+
+        :return: Returns the hit rate between 0 and 1, or ``None`` if nothing was cast yet
+        """
+        nof_casts = self.nof_hits + self.nof_misses
+        if nof_casts == 0:
+            return None
+        return self.nof_hits / nof_casts
@@ -0,0 +1,56 @@
+import os
+import pytest
+import pathlib
+ROOT_DIR = str(pathlib.Path(__file__).parents[2])
+import sys
+sys.path.append(ROOT_DIR)
+from graphxplore.Basis import RelationalDataIODevice, BaseUtils, ColumnarDataset, ColumnarTable
+from graphxplore.MetaDataHandling import MetaDataGenerator
+from graphxplore.DataMapping import DataMappingUtils
+
+BASE_PATH = os.path.dirname(__file__)
+DATA_DIR = os.path.join(BASE_PATH, '..', 'MetaDataHandling', 'test_data')
+
+def test_columnar_dataset():
+    csv_data = BaseUtils.load_csv_data(DATA_DIR)
+    dataset = ColumnarDataset.from_data_location(DATA_DIR)
+    assert dataset.to_dict() == csv_data
+    assert ColumnarDataset(csv_data).to_dict() == csv_data
+    assert RelationalDataIODevice.get_available_table_names(dataset) == sorted(csv_data.keys())
+    # values are interned once for all tables
+    assert len(dataset.string_pool) == len(set(val for rows in csv_data.values() for row in rows
+                                               for val in row.values()) | {''})
+    primary_table = dataset['primary_table']
+    assert len(primary_table) == len(csv_data['primary_table'])
+    assert primary_table[-1] == csv_data['primary_table'][-1]
+    assert primary_table.get_memory_size() == 4 * len(primary_table) * len(primary_table.header)
+
+    with RelationalDataIODevice(dataset, 'secondary_table', columns=['PRIMARY']) as reader:
+        assert [row for row in reader] == [{'PRIMARY' : row['PRIMARY']} for row in csv_data['secondary_table']]
+    expected_meta = MetaDataGenerator(csv_data).gather_meta_data()
+    assert MetaDataGenerator(dataset).gather_meta_data().to_dict() == expected_meta.to_dict()
+
+    target = ColumnarDataset()
+    DataMappingUtils.add_primary_key(dataset, 'primary_table', target, 'with_pk', 'NEW_PK', start_idx=5)
+    assert target.get_table_names() == ['with_pk']
+    assert target['with_pk'].get_column_values('NEW_PK') == [str(idx + 5) for idx in range(len(primary_table))]
+    assert target.string_pool is not dataset.string_pool
+
+def test_columnar_table():
+    table = ColumnarTable(['a', 'b'])
+    table.append_row({'a' : 1, 'b' : None})
+    table.append_row({'a' : 'x', 'b' : 0.5})
+    assert list(table.iterate_rows(batch_size=1)) == [{'a' : '1', 'b' : ''}, {'a' : 'x', 'b' : '0.5'}]
+    assert list(table.iterate_rows([])) == [{}, {}]
+    with pytest.raises(AttributeError) as exc:
+        table.append_row({'a' : 1})
+    assert str(exc.value) == 'There is not value for key "b" in input data'
+    with pytest.raises(AttributeError) as exc:
+        ColumnarTable(['a', 'a'])
+    assert str(exc.value) == 'Column names of columnar table must be unique'
+    with pytest.raises(AttributeError) as exc:
+        ColumnarTable.from_rows([])
+    assert str(exc.value) == 'Header must be specified for empty tables'
+
+if __name__ == '__main__':
+    pytest.main()
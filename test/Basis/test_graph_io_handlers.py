@@ -0,0 +1,289 @@
+import os
+import json
+import math
+import threading
+import http.server
+import pytest
+import pathlib
+ROOT_DIR = str(pathlib.Path(__file__).parents[2])
+import sys
+sys.path.append(ROOT_DIR)
+from graphxplore.Basis import (GraphCSVWriter, GraphCSVReader, GraphCSVCompression, GraphType, GraphDatabaseWriter,
+                              GraphDatabaseUtils, RelationalDataIODevice)
+from graphxplore.Basis.BaseGraph import BaseGraph, BaseNode, BaseEdge, BaseLabels, BaseNodeType, BaseEdgeType, BinBoundInfo
+
+def get_test_graph() -> BaseGraph:
+    graph = BaseGraph()
+    for node_id in range(25):
+        if node_id % 5 == 0:
+            graph.nodes.append(BaseNode(node_id, BaseLabels(('Table',), BaseNodeType.Key), 'pk', node_id))
+        elif node_id % 5 == 1:
+            graph.nodes.append(BaseNode(node_id, BaseLabels(('Table',), BaseNodeType.Attribute), 'str_var',
+                                        'val' + str(node_id), 'desc'))
+        elif node_id % 5 == 2:
+            graph.nodes.append(BaseNode(node_id, BaseLabels(('Table', 'Other'), BaseNodeType.Attribute),
+                                        'float_var', node_id + 0.5))
+        elif node_id % 5 == 3:
+            graph.nodes.append(BaseNode(node_id, BaseLabels(('Table',), BaseNodeType.AttributeBin), 'bin_var',
+                                        'normal', bin_info=BinBoundInfo(1.5, 3.5)))
+        else:
+            graph.nodes.append(BaseNode(node_id, BaseLabels(('Table',), BaseNodeType.Attribute), 'int_var',
+                                        node_id))
+    for node_id in range(0, 25, 5):
+        for target in range(node_id + 1, node_id + 5):
+            graph.edges.append(BaseEdge(node_id, target, BaseEdgeType.HAS_ATTR_VAL))
+    return graph
+
+def read_files(graph_dir : str) -> dict:
+    result = {}
+    for file_name in sorted(os.listdir(graph_dir)):
+        with open(os.path.join(graph_dir, file_name), 'rb') as f:
+            result[file_name] = f.read()
+    return result
+
+def test_batch_writing(tmp_path):
+    graph = get_test_graph()
+    single_dir = tmp_path / 'single'
+    batch_dir = tmp_path / 'batch'
+    os.makedirs(single_dir)
+    os.makedirs(batch_dir)
+
+    with GraphCSVWriter(str(single_dir), GraphType.Base) as writer:
+        for node in graph.nodes:
+            writer.write_node(node)
+        for edge in graph.edges:
+            writer.write_edge(edge)
+    GraphCSVWriter.write_graph(str(batch_dir), graph)
+
+    assert read_files(str(single_dir)) == read_files(str(batch_dir))
+
+    read_graph = GraphCSVReader(str(batch_dir), GraphType.Base).read_graph()
+    assert set(read_graph.nodes) == set(graph.nodes)
+    assert len(read_graph.edges) == len(graph.edges)
+
+    with pytest.raises(AttributeError) as exc:
+        GraphCSVWriter(str(batch_dir), GraphType.AttributeAssociation).write_nodes(graph.nodes)
+    assert str(exc.value) == 'Writer not yet initialized'
+
+def test_parallel_writing(tmp_path):
+    graph = get_test_graph()
+    serial_dir = tmp_path / 'serial'
+    parallel_dir = tmp_path / 'parallel'
+    os.makedirs(serial_dir)
+    os.makedirs(parallel_dir)
+    GraphCSVWriter.write_graph(str(serial_dir), graph)
+    GraphCSVWriter.write_graph(str(parallel_dir), graph, nof_processes=2, chunk_size=3)
+    assert read_files(str(serial_dir)) == read_files(str(parallel_dir))
+
+    with pytest.raises(AttributeError) as exc:
+        GraphCSVWriter.write_graph(str(parallel_dir), graph, nof_processes=0)
+    assert str(exc.value) == 'Number of processes must be at least 1'
+
+def test_compressed_writer(tmp_path):
+    graph = get_test_graph()
+    GraphCSVWriter.write_graph(str(tmp_path), graph, GraphCSVCompression.GZip)
+    assert sorted(os.listdir(tmp_path)) == ['Node_Table_Bin.csv.gz', 'Node_Table_Decimal.csv.gz',
+                                            'Node_Table_Integer.csv.gz', 'Node_Table_String.csv.gz',
+                                            'Relationship_Table_Main.csv.gz']
+    read_graph = GraphCSVReader(str(tmp_path), GraphType.Base, GraphCSVCompression.GZip).read_graph()
+    assert set(read_graph.nodes) == set(graph.nodes)
+    assert ([edge.to_csv_row() for edge in read_graph.edges] == [edge.to_csv_row() for edge in graph.edges])
+
+def test_relational_column_projection(tmp_path):
+    with open(tmp_path / 'table.csv', 'w', encoding='utf-8') as f:
+        f.write('id,text,value,flag\n1,"multi\nline",0.5,x\n\n2,short\n3,,1.5,y\n')
+    with RelationalDataIODevice(str(tmp_path), 'table') as reader:
+        full_rows = [row for row in reader]
+    for columns in [['value', 'id'], ['text'], []]:
+        with RelationalDataIODevice(str(tmp_path), 'table', columns=columns + columns) as reader:
+            assert reader.get_header() == columns
+            assert [row for row in reader] == [{column : row[column] for column in columns} for row in full_rows]
+    data_dict = {'table' : full_rows}
+    with RelationalDataIODevice(data_dict, 'table', columns=['flag', 'id']) as reader:
+        assert [row for row in reader] == [{'flag' : 'x', 'id' : '1'}, {'flag' : None, 'id' : '2'},
+                                           {'flag' : 'y', 'id' : '3'}]
+    with RelationalDataIODevice({'empty' : []}, 'empty', columns=['id']) as reader:
+        assert reader.get_header() == ['id']
+        assert [row for row in reader] == []
+
+    for data_location in [str(tmp_path), data_dict]:
+        with pytest.raises(AttributeError) as exc:
+            with RelationalDataIODevice(data_location, 'table', columns=['id', 'missing']):
+                pass
+        assert str(exc.value) == 'Column "missing" does not exist in table "table"'
+    with pytest.raises(AttributeError) as exc:
+        RelationalDataIODevice(str(tmp_path), 'table', write=True, header=['id'], columns=['id'])
+    assert str(exc.value) == 'Column projection is only available for reading'
+
+def test_relational_writing_to_empty_directory(tmp_path):
+    # new files are written as UTF-8, existing files keep their encoding
+    with RelationalDataIODevice(str(tmp_path), 'table', write=True, header=['id', 'name']) as writer:
+        writer.writerow({'id' : 1, 'name' : 'Müller'})
+    with open(tmp_path / 'table.csv', encoding='utf-8') as f:
+        assert f.read() == 'id,name\n1,Müller\n'
+    with open(tmp_path / 'other.csv', 'w', encoding='latin-1') as f:
+        f.write('id,name\n' + '1,Müller\n' * 100)
+    with RelationalDataIODevice(str(tmp_path), 'other', write=True, header=['id', 'name']) as writer:
+        writer.writerow({'id' : 2, 'name' : 'Jäger'})
+    with open(tmp_path / 'other.csv', encoding='latin-1') as f:
+        assert f.read() == 'id,name\n2,Jäger\n'
+
+class MockNeo4jHandler(http.server.BaseHTTPRequestHandler):
+    requests = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        MockNeo4jHandler.requests.append((self.path, body))
+        results = []
+        for statement in body['statements']:
+            batch = statement['parameters']['batch']
+            start_id = 1000 * len(MockNeo4jHandler.requests)
+            results.append({'columns': ['id'], 'data': [{'row': [start_id + idx]} for idx in range(len(batch))]})
+        response = json.dumps({'results': results, 'errors': []}).encode('utf8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        pass
+
+def test_http_database_writing():
+    server = http.server.HTTPServer(('127.0.0.1', 0), MockNeo4jHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        address = 'http://127.0.0.1:' + str(server.server_address[1])
+        graph = get_test_graph()
+        graph.nodes.append(BaseNode(25, BaseLabels(('Table',), BaseNodeType.Attribute), 'float_var', math.nan))
+        writer = GraphDatabaseWriter(GraphType.Base, 'test', address=address, auth=('user', 'pwd'),
+                                     max_request_size=400)
+        for node in graph.nodes:
+            writer.write_node(node)
+        for edge in graph.edges:
+            writer.write_edge(edge)
+        node_id_dict = writer._write_objects_neo4j_http(write_nodes=True, node_id_dict=None)
+        node_requests = list(MockNeo4jHandler.requests)
+        assert len(node_id_dict) == len(graph.nodes)
+        assert len(set(node_id_dict.values())) == len(graph.nodes)
+        # small maximum request size forces multiple requests per query
+        assert len(node_requests) > 5
+        nof_sent_nodes = 0
+        for path, body in node_requests:
+            assert path == '/db/test/tx/commit'
+            assert len(body['statements']) == 1
+            statement = body['statements'][0]
+            assert statement['statement'].startswith('WITH $batch AS batch UNWIND batch AS entry CALL apoc.create.node(')
+            nof_sent_nodes += len(statement['parameters']['batch'])
+            if any(entry['value'] == 'NaN' for entry in statement['parameters']['batch']):
+                assert ("value: CASE WHEN 'value' IN coalesce(entry._non_finite, []) THEN toFloat(entry.value) "
+                        "ELSE entry.value END") in statement['statement']
+        assert nof_sent_nodes == len(graph.nodes)
+
+        writer._write_objects_neo4j_http(write_nodes=False, node_id_dict=node_id_dict)
+        edge_requests = MockNeo4jHandler.requests[len(node_requests):]
+        sent_edges = [entry for path, body in edge_requests for entry in body['statements'][0]['parameters']['batch']]
+        assert len(sent_edges) == len(graph.edges)
+        assert sent_edges[0] == {'edge_type': 'HAS_ATTR_VAL', 'id_s': node_id_dict[0], 'id_t': node_id_dict[1]}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_http_non_finite_parameters():
+    writer = GraphDatabaseWriter(GraphType.Base, 'test', address='http://127.0.0.1:7474', auth=('user', 'pwd'))
+    nodes = [BaseNode(0, BaseLabels(('Table',), BaseNodeType.Attribute), 'str_var', 'abc'),
+             BaseNode(1, BaseLabels(('Table',), BaseNodeType.Attribute), 'float_var', math.nan),
+             BaseNode(2, BaseLabels(('Table',), BaseNodeType.Attribute), 'int_var', 3),
+             BaseNode(3, BaseLabels(('Table',), BaseNodeType.Attribute), 'float_var', -math.inf)]
+    statements = [GraphDatabaseUtils.get_node_write_cypher_statement(node, separate_params=True) for node in nodes]
+    # string, integer and decimal nodes share the same query and end up in the same request
+    assert len(set(query for query, params in statements)) == 1
+    chunks = list(writer._get_http_request_chunks(statements[0][0], [params for query, params in statements]))
+    assert len(chunks) == 1
+    body = json.loads(chunks[0][0])
+    statement = body['statements'][0]
+    # only the entries with non-finite floats are marked for conversion
+    assert [entry['value'] for entry in statement['parameters']['batch']] == ['abc', 'NaN', 3, '-Infinity']
+    assert [entry.get('_non_finite') for entry in statement['parameters']['batch']] == [None, ['value'], None,
+                                                                                        ['value']]
+    assert ("value: CASE WHEN 'value' IN coalesce(entry._non_finite, []) THEN toFloat(entry.value) "
+            "ELSE entry.value END") in statement['statement']
+    assert statement['statement'].count('toFloat') == 1
+
+    list_chunks = list(writer._get_http_request_chunks('CREATE (n {vals: $vals})',
+                                                       [{'vals': [1.5, math.inf]}, {'vals': ['a', 'b']}]))
+    list_statement = json.loads(list_chunks[0][0])['statements'][0]
+    assert list_statement['parameters']['batch'] == [{'vals': [1.5, 'Infinity'], '_non_finite': ['vals']},
+                                                     {'vals': ['a', 'b']}]
+    assert list_statement['statement'] == ("WITH $batch AS batch UNWIND batch AS entry CREATE (n {vals: CASE WHEN "
+                                           "'vals' IN coalesce(entry._non_finite, []) THEN [val IN entry.vals | "
+                                           "toFloat(val)] ELSE entry.vals END})")
+
+def test_describe_databases(monkeypatch):
+    nof_queries = {'list': 0, 'describe': 0}
+
+    def get_existing_databases(address, auth):
+        nof_queries['list'] += 1
+        return ['base', 'aag']
+
+    def execute_query(query, database, address, auth):
+        nof_queries['describe'] += 1
+        if database == 'base':
+            return [{'labels': ['Key', 'Attribute', 'Table'], 'nof_nodes': 10, 'nof_edges': 9,
+                     'indexes': [['Table', ['name']], [['Attribute', 'Key'], ['value']]]}]
+        return [{'labels': ['Attribute', 'Frequent'], 'nof_nodes': 3, 'nof_edges': 1, 'indexes': []}]
+
+    monkeypatch.setattr(GraphDatabaseUtils, 'get_existing_databases', get_existing_databases)
+    monkeypatch.setattr(GraphDatabaseUtils, 'execute_query', execute_query)
+    GraphDatabaseUtils.clear_description_cache()
+
+    descriptions = GraphDatabaseUtils.describe_databases('bolt://mock:7687', ('user', 'pwd'))
+    assert sorted(descriptions.keys()) == ['aag', 'base']
+    base = descriptions['base']
+    assert base.graph_type == GraphType.Base
+    assert base.nof_nodes == 10 and base.nof_edges == 9
+    assert base.contains_labels(['Table', 'Key'])
+    assert not base.contains_labels(['Table', 'Other'])
+    assert base.has_index('Table', ('name',))
+    assert base.has_index('Key', ('value',))
+    assert not base.has_index('Table', ('value',))
+    assert descriptions['aag'].graph_type == GraphType.AttributeAssociation
+    assert nof_queries == {'list': 1, 'describe': 2}
+
+    # served from cache
+    GraphDatabaseUtils.describe_databases('bolt://mock:7687', ('user', 'pwd'))
+    assert nof_queries == {'list': 1, 'describe': 2}
+    # expired, refreshed, or different address
+    GraphDatabaseUtils.describe_databases('bolt://mock:7687', ('user', 'pwd'), max_age=0)
+    assert nof_queries == {'list': 2, 'describe': 4}
+    GraphDatabaseUtils.describe_databases('bolt://mock:7687', ('user', 'pwd'), refresh=True)
+    GraphDatabaseUtils.describe_databases('bolt://other:7687', ('user', 'pwd'))
+    assert nof_queries == {'list': 4, 'describe': 8}
+    GraphDatabaseUtils.clear_description_cache('bolt://mock:7687')
+    GraphDatabaseUtils.describe_databases('bolt://other:7687', ('user', 'pwd'))
+    assert nof_queries == {'list': 4, 'describe': 8}
+    GraphDatabaseUtils.describe_databases('bolt://mock:7687', ('user', 'pwd'))
+    assert nof_queries == {'list': 5, 'describe': 10}
+    GraphDatabaseUtils.clear_description_cache()
+
+def test_index_creation(monkeypatch):
+    queries = []
+
+    def execute_query(query, database, address, auth):
+        queries.append((query, database))
+        return []
+
+    monkeypatch.setattr(GraphDatabaseUtils, 'execute_query', execute_query)
+    GraphDatabaseUtils.create_indexes('test', ['Table', 'Other`Table', 'Table'], address='bolt://mock:7687',
+                                      wait_seconds=10)
+    assert queries == [
+        ('CREATE RANGE INDEX `graphxplore_Other``Table_name` IF NOT EXISTS FOR (n:`Other``Table`) ON (n.`name`)', 'test'),
+        ('CREATE RANGE INDEX `graphxplore_Other``Table_value` IF NOT EXISTS FOR (n:`Other``Table`) ON (n.`value`)',
+         'test'),
+        ('CREATE RANGE INDEX `graphxplore_Table_name` IF NOT EXISTS FOR (n:`Table`) ON (n.`name`)', 'test'),
+        ('CREATE RANGE INDEX `graphxplore_Table_value` IF NOT EXISTS FOR (n:`Table`) ON (n.`value`)', 'test'),
+        ('CALL db.awaitIndexes(10)', 'test')]
+
+if __name__ == '__main__':
+    pytest.main()
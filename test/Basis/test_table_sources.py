@@ -0,0 +1,81 @@
+import os
+import sqlite3
+import itertools
+import pytest
+import pathlib
+ROOT_DIR = str(pathlib.Path(__file__).parents[2])
+import sys
+sys.path.append(ROOT_DIR)
+from graphxplore.Basis import (RelationalDataIODevice, BaseUtils, SQLiteTableSource, ArrowTableSource,
+                               ParquetTableSource)
+from graphxplore.MetaDataHandling import MetaDataGenerator
+
+BASE_PATH = os.path.dirname(__file__)
+DATA_DIR = os.path.join(BASE_PATH, '..', 'MetaDataHandling', 'test_data')
+
+def copy_tables(source, target):
+    for table in RelationalDataIODevice.get_available_table_names(source):
+        with RelationalDataIODevice(source, table) as reader:
+            with RelationalDataIODevice(target, table, write=True, header=reader.get_header()) as writer:
+                for row in reader:
+                    writer.writerow(row)
+
+def check_table_source(source):
+    csv_data = BaseUtils.load_csv_data(DATA_DIR)
+    copy_tables(csv_data, source)
+    assert RelationalDataIODevice.get_available_table_names(source) == sorted(csv_data.keys())
+    for table, rows in csv_data.items():
+        with RelationalDataIODevice(source, table) as reader:
+            assert reader.get_header() == list(rows[0].keys())
+            assert [row for row in reader] == rows
+        columns = list(rows[0].keys())[::-1][:2]
+        assert list(source.read_rows(table, columns)) == [{column : row[column] for column in columns}
+                                                          for row in rows]
+    with pytest.raises(AttributeError) as exc:
+        source.read_rows('primary_table', ['not_a_column'])
+    assert str(exc.value) == 'Column "not_a_column" does not exist in table "primary_table"'
+    with pytest.raises(AttributeError) as exc:
+        RelationalDataIODevice(source, 'not_a_table')
+    assert str(exc.value) == 'Table "not_a_table" does not exist in table source'
+
+    expected_meta = MetaDataGenerator(csv_data).gather_meta_data()
+    assert MetaDataGenerator(source).gather_meta_data().to_dict() == expected_meta.to_dict()
+
+def test_sqlite_source(tmp_path):
+    source = SQLiteTableSource(str(tmp_path / 'data.db'), batch_size=3)
+    with pytest.raises(AttributeError) as exc:
+        RelationalDataIODevice.check_data_location(source)
+    assert str(exc.value) == 'No tables found in table source'
+    check_table_source(source)
+
+def test_early_termination(tmp_path):
+    connections = []
+
+    class TrackingSource(SQLiteTableSource):
+        def _connect(self) -> sqlite3.Connection:
+            connections.append(super()._connect())
+            return connections[-1]
+
+    source = TrackingSource(str(tmp_path / 'data.db'), batch_size=3)
+    copy_tables(BaseUtils.load_csv_data(DATA_DIR), source)
+    connections.clear()
+    with RelationalDataIODevice(source, 'primary_table') as reader:
+        assert len(list(itertools.islice(reader, 2))) == 2
+    # the connection of the unfinished reader is closed
+    assert len(connections) > 0
+    for connection in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute('SELECT 1')
+
+def test_arrow_sources(tmp_path):
+    pyarrow = pytest.importorskip('pyarrow')
+    typed_source = ArrowTableSource({'typed' : pyarrow.table({'id' : [1, 2], 'val' : [1.5, None]})})
+    with RelationalDataIODevice(typed_source, 'typed') as reader:
+        assert [row for row in reader] == [{'id' : '1', 'val' : '1.5'}, {'id' : '2', 'val' : ''}]
+    check_table_source(ArrowTableSource(batch_size=3))
+    parquet_source = ParquetTableSource(str(tmp_path), batch_size=3)
+    check_table_source(parquet_source)
+    assert sorted(os.listdir(tmp_path)) == ['primary_table.parquet', 'secondary_table.parquet']
+
+if __name__ == '__main__':
+    pytest.main()
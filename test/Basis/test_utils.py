@@ -1,9 +1,11 @@
+import os
+import json
 import pytest
 import pathlib
 ROOT_DIR = str(pathlib.Path(__file__).parents[2])
 import sys
 sys.path.append(ROOT_DIR)
-from graphxplore.Basis import BaseUtils
+from graphxplore.Basis import BaseUtils, CSVFormatCache, RelationalDataIODevice, LazyCSVTable
 
 def test_median():
     assert BaseUtils.calculate_median({}) is None
@@ -36,5 +38,141 @@ def test_quintiles():
     assert BaseUtils.calculate_quartile_quintile_sorted_dist([(1, 5), (8999, 1)], False, 4) == 1
     assert BaseUtils.calculate_quartile_quintile_sorted_dist([(1, 4), (8999, 1)], False, 4) == 4500
 
+def test_csv_format_cache(tmp_path, monkeypatch):
+    nof_detections = {'count': 0}
+    detect_encoding = BaseUtils.detect_file_encoding
+
+    def count_detection(file_path):
+        nof_detections['count'] += 1
+        return detect_encoding(file_path)
+
+    monkeypatch.setattr(BaseUtils, 'detect_file_encoding', count_detection)
+    CSVFormatCache.clear()
+    table_path = str(tmp_path / 'table.csv')
+    with open(table_path, 'w', encoding='utf-8') as f:
+        f.write('id;name\n1;"a;b"\n2;c\n')
+
+    for _ in range(3):
+        with RelationalDataIODevice(str(tmp_path), 'table') as reader:
+            assert [row for row in reader] == [{'id': '1', 'name': 'a;b'}, {'id': '2', 'name': 'c'}]
+    assert BaseUtils.load_csv_data(table_path) == {'table': [{'id': '1', 'name': 'a;b'}, {'id': '2', 'name': 'c'}]}
+    assert nof_detections['count'] == 1
+    file_format = CSVFormatCache.get_format(table_path)
+    assert file_format.encoding == 'utf-8'
+    assert file_format.dialect['delimiter'] == ';'
+    assert file_format.header == ['id', 'name']
+
+    # changed file is detected again
+    with open(table_path, 'w', encoding='utf-8') as f:
+        f.write('id,value\n1,x\n')
+    assert CSVFormatCache.get_format(table_path).header == ['id', 'value']
+    assert nof_detections['count'] == 2
+
+    # persisted formats are reused after clearing the in-memory cache
+    CSVFormatCache.set_persistence(True)
+    try:
+        CSVFormatCache.clear()
+        CSVFormatCache.get_format(table_path)
+        assert nof_detections['count'] == 3
+        assert os.path.isfile(str(tmp_path / CSVFormatCache.persistence_file_name))
+        CSVFormatCache.clear()
+        assert CSVFormatCache.get_format(table_path).dialect['delimiter'] == ','
+        assert nof_detections['count'] == 3
+        # malformed persistence files are ignored and replaced
+        persistence_path = str(tmp_path / CSVFormatCache.persistence_file_name)
+        for malformed in ['{"table.csv": {"size', '{"table.csv": [1, 2]}', '[]']:
+            with open(persistence_path, 'w', encoding='utf-8') as f:
+                f.write(malformed)
+            CSVFormatCache.clear()
+            assert CSVFormatCache.get_format(table_path).header == ['id', 'value']
+            with open(persistence_path, encoding='utf-8') as f:
+                assert json.load(f)['table.csv']['format']['header'] == ['id', 'value']
+        assert nof_detections['count'] == 6
+        # no temporary files are left behind
+        assert sorted(os.listdir(str(tmp_path))) == sorted([CSVFormatCache.persistence_file_name, 'table.csv'])
+    finally:
+        CSVFormatCache.set_persistence(False)
+        CSVFormatCache.clear()
+
+def test_csv_file_splitting(tmp_path):
+    table_path = str(tmp_path / 'table.csv')
+    with open(table_path, 'w', encoding='utf-8') as f:
+        f.write('id,"multi\nline header",value\n')
+        for idx in range(200):
+            if idx % 7 == 0:
+                f.write(str(idx) + ',"quoted\n""newline"",\n",' + str(idx / 2) + '\n')
+            else:
+                f.write(str(idx) + ',plain,' + str(idx / 2) + '\n')
+    with RelationalDataIODevice(str(tmp_path), 'table') as reader:
+        expected_rows = [row for row in reader]
+    assert len(expected_rows) == 200
+    assert BaseUtils.count_lines_in_file(table_path) == 2 + 200 + 2 * 29
+    assert BaseUtils.count_lines_in_file(table_path, nof_processes=2) == 2 + 200 + 2 * 29
+
+    for nof_chunks in [1, 2, 7, 50, 1000]:
+        chunks = BaseUtils.split_csv_file(table_path, nof_chunks, nof_processes=2)
+        assert 0 < len(chunks) <= nof_chunks
+        assert all(first[1] == second[0] for first, second in zip(chunks[:-1], chunks[1:]))
+        assert chunks[-1][1] == os.path.getsize(table_path)
+        chunk_rows = []
+        for chunk in chunks:
+            with RelationalDataIODevice(str(tmp_path), 'table', byte_range=chunk) as reader:
+                rows = [row for row in reader]
+            with RelationalDataIODevice(str(tmp_path), 'table', byte_range=chunk, columns=['value']) as reader:
+                assert [row for row in reader] == [{'value' : row['value']} for row in rows]
+            chunk_rows += rows
+        assert chunk_rows == expected_rows
+
+    empty_path = str(tmp_path / 'empty.csv')
+    open(empty_path, 'w').close()
+    assert BaseUtils.split_csv_file(empty_path, 4) == []
+    assert BaseUtils.count_lines_in_file(empty_path) == 0
+
+    for seed in range(5):
+        samples = BaseUtils.sample_csv_file(table_path, 10, 0.2, seed)
+        assert 0 < len(samples) <= 10
+        assert all(first[1] <= second[0] for first, second in zip(samples[:-1], samples[1:]))
+        for sample in samples:
+            with RelationalDataIODevice(str(tmp_path), 'table', byte_range=sample) as reader:
+                rows = [row for row in reader]
+            # sampled ranges start at record boundaries
+            assert len(rows) > 0 and all(row in expected_rows for row in rows)
+    with pytest.raises(AttributeError) as exc:
+        BaseUtils.sample_csv_file(table_path, 10, 0)
+    assert str(exc.value) == 'Block fraction must be larger than 0 and at most 1'
+
+    assert BaseUtils.reservoir_sample(range(5), 10) == [0, 1, 2, 3, 4]
+    sample = BaseUtils.reservoir_sample(iter(range(10000)), 100, seed=3)
+    assert len(set(sample)) == 100 and max(sample) > 5000
+
+def test_lazy_loading(tmp_path):
+    table_path = str(tmp_path / 'table.csv')
+    content = 'id;text;value\r\n1;"quoted\r\nline; ""x""";0.5\r\n\r\n2;short\r\n3;ä;\r\n4;last;1'
+    with open(table_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(content)
+    eager_rows = BaseUtils.load_csv_data(table_path)['table']
+    assert len(eager_rows) == 4
+    lazy_data = BaseUtils.load_csv_data(str(tmp_path), lazy=True)
+    for lazy_table in [lazy_data['table'], LazyCSVTable(content.encode('utf-8'))]:
+        assert len(lazy_table) == 4
+        assert lazy_table.get_header() == ['id', 'text', 'value']
+        assert list(lazy_table) == eager_rows
+        assert [lazy_table[idx] for idx in range(4)] == eager_rows
+        assert lazy_table[-3] == {'id' : '2', 'text' : 'short', 'value' : None}
+        assert lazy_table[1:4:2] == eager_rows[1:4:2]
+        with pytest.raises(IndexError):
+            lazy_table[4]
+    with RelationalDataIODevice(lazy_data, 'table', columns=['value', 'id']) as reader:
+        assert [row for row in reader] == [{'value' : row['value'], 'id' : row['id']} for row in eager_rows]
+
+    with open(table_path, 'a', encoding='utf-8') as f:
+        f.write('\n5;new;2')
+    with pytest.raises(AttributeError) as exc:
+        lazy_data['table'][0]
+    assert str(exc.value) == 'File "' + table_path + '" changed after it was indexed'
+    with pytest.raises(AttributeError) as exc:
+        LazyCSVTable('a,b\n1,2\n'.encode('utf-16'), 'utf-16')
+    assert str(exc.value) == 'Lazy loading requires an ASCII-compatible encoding, but "utf-16" was specified'
+
 if __name__ == '__main__':
     pytest.main()
\ No newline at end of file
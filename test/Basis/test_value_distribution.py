@@ -0,0 +1,57 @@
+import pytest
+import pathlib
+ROOT_DIR = str(pathlib.Path(__file__).parents[2])
+import sys
+sys.path.append(ROOT_DIR)
+from graphxplore.Basis import ValueDistribution, BaseUtils
+
+def test_value_distribution():
+    value_dist = {4 : 1, 1 : 3, 2 : 2, 10 : 2}
+    distribution = ValueDistribution.from_dict(value_dist)
+    assert distribution.values.tolist() == [1, 2, 4, 10]
+    assert distribution.cum_counts.tolist() == [3, 5, 6, 8]
+    assert distribution.total_count == 8
+    assert (distribution.get_min(), distribution.get_max()) == (1, 10)
+    assert isinstance(distribution.get_min(), int)
+    assert distribution.get_mean() == 3.875
+    assert distribution.get_mean() == BaseUtils.calculate_mean(value_dist)
+    assert distribution.get_std() == BaseUtils.calculate_std(value_dist)
+    assert round(distribution.get_std(), 3) == 3.655
+    assert distribution.get_median_quartiles() == BaseUtils.calculate_median_quartiles(value_dist) == (2, 1, 7.0)
+    # quintiles match the helper on sorted distributions
+    for quintile_id in range(1, 5):
+        assert (distribution.get_quantile(quintile_id / 5)
+                == BaseUtils.calculate_quartile_quintile_sorted_dist(sorted(value_dist.items()), False, quintile_id))
+    assert distribution.get_quantile(0) == 1
+    assert distribution.get_quantile(1) == 10
+    assert distribution.get_count_in_range(2, 4) == 3
+    assert distribution.get_count_in_range(5, 9) == 0
+    assert distribution.get_histogram([0, 2, 4, 10]) == [3, 2, 3]
+    assert distribution.get_histogram([-5, 0]) == [0]
+
+    decimals = ValueDistribution.from_dict({0.5 : 1, -1.5 : 1})
+    assert decimals.get_quantile(0.5) == -0.5
+    # large integers are compared exactly
+    large = ValueDistribution.from_dict({2 ** 70 : 1, 2 ** 70 + 1 : 1, 1 : 1})
+    assert large.get_max() == 2 ** 70 + 1
+    assert large.get_quantile(0.5) == 2 ** 70
+
+    empty = ValueDistribution.from_dict({})
+    assert empty.get_mean() is None
+    assert empty.get_std() is None
+    assert empty.get_quantile(0.5) is None
+    assert empty.get_median_quartiles() is None
+    assert empty.get_histogram([0, 1]) == [0]
+
+    with pytest.raises(AttributeError) as exc:
+        distribution.get_quantile(1.5)
+    assert str(exc.value) == 'Quantile fraction must be between 0 and 1'
+    with pytest.raises(AttributeError) as exc:
+        distribution.get_histogram([2, 1])
+    assert str(exc.value) == 'Bin edges must be in ascending order'
+    with pytest.raises(AttributeError) as exc:
+        ValueDistribution.from_dict({'a' : 1})
+    assert str(exc.value) == 'Values of value distribution must be numeric'
+
+if __name__ == '__main__':
+    pytest.main()
@@ -1,3 +1,4 @@
+import copy
 import pytest
 import warnings
 import pathlib
@@ -9,7 +10,7 @@ from graphxplore.Basis.BaseGraph import BaseGraph, BaseNode, BaseEdge, BaseNodeT
 from graphxplore.DataMapping.Conditionals import StringOperator, StringOperatorType
 from graphxplore.GraphDataScience import GroupSelector
 from graphxplore.Dashboard import DashboardBuilder
-from graphxplore.MetaDataHandling import DataType, VariableType, MetaData
+from graphxplore.MetaDataHandling import DataType, VariableType, MetaData, BinningInfo
 
 meta = MetaData(['root', 'first_child', 'second_child', 'child_child'])
 for table in meta.get_table_names():
@@ -48,6 +49,21 @@ def test_init_exceptions():
     with pytest.raises(AttributeError) as exc:
         DashboardBuilder(meta=meta, main_table='root', base_graph_database='invalid_db', groups=groups)
     assert str(exc.value) == 'Group table of group "invalid" does not match main table of dashboard builder'
+    # metadata with equal content, but different serialization matches
+    builder_meta = copy.deepcopy(meta)
+    builder_meta.get_variable('first_child', 'first_child_int').binning = BinningInfo(True, [], ref_high=1)
+    group_meta = copy.deepcopy(meta)
+    group_meta.get_variable('first_child', 'first_child_int').binning = BinningInfo(True, [], ref_high=1.0)
+    assert builder_meta.get_content_hash() != group_meta.get_content_hash()
+    groups = {'first' : GroupSelector('root', group_meta), 'second' : GroupSelector('root', group_meta)}
+    with pytest.raises(AttributeError) as exc:
+        DashboardBuilder(meta=builder_meta, main_table='root', base_graph_database='invalid_db', groups=groups,
+                         address='bolt://localhost:1')
+    assert 'Could not connect to Neo4J DBMS' in str(exc.value)
+    group_meta.get_variable('first_child', 'first_child_int').binning.ref_high = 2
+    with pytest.raises(AttributeError) as exc:
+        DashboardBuilder(meta=builder_meta, main_table='root', base_graph_database='invalid_db', groups=groups)
+    assert str(exc.value) == 'Metadata of group "first" does not match metadata of dashboard builder'
 
 
 def test_queries(neo4j_config):
@@ -6,7 +6,8 @@ ROOT_DIR = str(pathlib.Path(__file__).parents[2])
 import sys
 sys.path.append(ROOT_DIR)
 from graphxplore.MetaDataHandling import MetaData
-from graphxplore.DataMapping import DataMappingUtils
+from graphxplore.MetaDataHandling import DataType
+from graphxplore.DataMapping import DataMappingUtils, ArtifactCleaner
 
 BASE_PATH = os.path.dirname(__file__)
 SOURCE_DIR = os.path.join(BASE_PATH, 'test_data')
@@ -48,6 +49,43 @@ def test_copy():
 
         assert actual == expected
 
+def test_artifact_cleaner(tmp_path):
+    assert (ArtifactCleaner.clean_column(['1', ' 2', 'x', '', None, '999'], DataType.Integer, {'999'})
+            == ['1', '2', '', '', '', ''])
+    assert ArtifactCleaner.clean_column(['99', '1e2', 'Na'], DataType.Decimal) == ['99.0', '100.0', '']
+    assert ArtifactCleaner.clean_column(['a', None, 'NaN'], DataType.String, {'NaN'}) == ['a', '', '']
+
+    source_meta = MetaData.load_from_json(SOURCE_META_PATH)
+    source_meta.get_variable('first_root_table', 'ATTR2').artifacts = ['42']
+    source_meta.get_variable('second_root_table', 'ATTR').artifacts = ['NaN']
+    sequential_dir = tmp_path / 'sequential'
+    parallel_dir = tmp_path / 'parallel'
+    sequential_dir.mkdir()
+    parallel_dir.mkdir()
+    DataMappingUtils.copy_dataset(source_meta, SOURCE_DIR, str(sequential_dir), delete_artifacts=True)
+    # chunks of a single row are cleaned in separate processes
+    ArtifactCleaner(source_meta, nof_processes=2, rows_per_chunk=1).clean_dataset(SOURCE_DIR, str(parallel_dir))
+    data_dict = {}
+    DataMappingUtils.copy_dataset(source_meta, SOURCE_DIR, data_dict, delete_artifacts=True)
+    for table in source_meta.get_table_names():
+        with open(os.path.join(str(sequential_dir), table + '.csv')) as file:
+            expected = file.read()
+        with open(os.path.join(str(parallel_dir), table + '.csv')) as file:
+            assert file.read() == expected
+        with open(os.path.join(str(sequential_dir), table + '.csv')) as file:
+            assert [row for row in csv.DictReader(file)] == data_dict[table]
+    assert data_dict['first_root_table'][0]['ATTR2'] == ''
+    assert data_dict['second_root_table'][1]['ATTR'] == ''
+
+    source_meta.get_variable('third_child_table', 'ATTR').artifacts = ['99']
+    # variables with artifacts are copied as strings, if artifacts are kept
+    data_dict = {}
+    DataMappingUtils.copy_dataset(source_meta, SOURCE_DIR, data_dict)
+    assert data_dict['third_child_table'][0]['ATTR'] == '99'
+    with pytest.raises(AttributeError) as exc:
+        ArtifactCleaner(source_meta, rows_per_chunk=0)
+    assert str(exc.value) == 'Number of rows per chunk must be at least 1'
+
 def test_primary_key_adding():
     target = os.path.join(OUT_DIR, 'pk_added.csv')
     DataMappingUtils.add_primary_key(data_source=SOURCE_DIR, source_table='first_child_table', data_target=OUT_DIR,
@@ -183,7 +183,13 @@ def test_graph_generation(neo4j_config):
                 ' "--neo4j_port", "--neo4j_user" and/or "--neo4j_pwd"')
 
         GraphDatabaseWriter.write_graph(
-            'test', reloaded_graph, overwrite=True, address=neo4j_address, auth=neo4j_auth)
+            'test', reloaded_graph, overwrite=True, address=neo4j_address, auth=neo4j_auth, create_indexes=True)
+
+        description = GraphDatabaseUtils.describe_databases(neo4j_address, neo4j_auth)['test']
+        for table in meta.get_table_names():
+            table_label = meta.get_label(table) if meta.get_label(table) != '' else table
+            assert description.has_index(table_label, ('name',))
+            assert description.has_index(table_label, ('value',))
 
         assert GraphDatabaseUtils.check_graph_type_of_db(
             'test', address=neo4j_address, auth=neo4j_auth) == GraphType.Base
@@ -1,13 +1,16 @@
 import collections
 import json
 import os
+import pickle
 import pytest
 import pathlib
 import csv
 ROOT_DIR = str(pathlib.Path(__file__).parents[2])
 import sys
 sys.path.append(ROOT_DIR)
-from graphxplore.MetaDataHandling import MetaDataGenerator, VariableType, DataType, ArtifactMode
+from graphxplore.Basis import ColumnarDataset
+from graphxplore.MetaDataHandling import (MetaDataGenerator, VariableType, DataType, ArtifactMode, TableProfile,
+                                         HyperLogLog, HeavyHitters, QuantileSketch, ProfileCache)
 
 BASE_PATH = os.path.dirname(__file__)
 
@@ -290,6 +293,216 @@ def test_meta_extraction():
             result_from_dict.get_variable(table, var).description = desc
     assert vanilla_dict == result_from_dict.to_dict()
 
+def test_parallel_meta_extraction():
+    data_dir = os.path.join(BASE_PATH, 'test_data')
+    generated_data = {
+        'patients' : [{'id' : str(idx), 'age' : str(20 + idx % 50), 'code' : 'c' + str(idx % 3),
+                       'note' : 'NaN' if idx % 11 == 0 else 'x' * (idx % 400), 'half_unique' : str(idx % 150)}
+                      for idx in range(300)],
+        'labs' : [{'lab_id' : str(idx), 'id' : str(idx % 300), 'value' : str(idx / 3)} for idx in range(500)]}
+    for csv_data in [data_dir, generated_data]:
+        for nof_read_lines in [1000000, 3, 160]:
+            sequential = MetaDataGenerator(csv_data, nof_read_lines=nof_read_lines).gather_meta_data()
+            parallel = MetaDataGenerator(csv_data, nof_read_lines=nof_read_lines, nof_processes=2,
+                                         rows_per_shard=2).gather_meta_data()
+            assert parallel.to_dict() == sequential.to_dict()
+
+    with pytest.raises(AttributeError) as exc:
+        MetaDataGenerator(data_dir, nof_processes=0)
+    assert str(exc.value) == 'Number of processes must be at least 1'
+
+def test_table_profile():
+    profile = TableProfile('table', ['sex', 'mixed'], str_len_free_text=5)
+    profile.add_rows([{'sex' : 'M', 'mixed' : '1'}, {'sex' : 'F', 'mixed' : '1'}, {'sex' : 'M', 'mixed' : '2.5'}])
+    other = TableProfile('table', ['sex', 'mixed'], str_len_free_text=5)
+    other.add_rows([{'sex' : 'NaN', 'mixed' : 'long text'}, {'sex' : 'F', 'mixed' : None}])
+    profile.merge(other)
+    result = profile.to_dict()
+    assert profile.nof_rows == 5
+    assert result['sex']['value_dist'] == {'M' : 2, 'F' : 2, 'NaN' : 1}
+    assert result['sex']['data_type'] == DataType.String
+    assert result['sex']['contains_missing_vals'] and not result['sex']['values_are_unique']
+    assert result['mixed']['data_type_dist'] == {DataType.String : 0.25, DataType.Integer : 0.5,
+                                                 DataType.Decimal : 0.25}
+    assert result['mixed']['contains_freetext']
+
+def test_sketch_profiling():
+    distinct_count = HyperLogLog()
+    frequent = HeavyHitters(capacity=10)
+    quantiles = QuantileSketch(k=50, nof_extremes=5)
+    other_quantiles = QuantileSketch(k=50, nof_extremes=5)
+    for idx in range(20000):
+        distinct_count.add(str(idx % 5000))
+        frequent.add('frequent' if idx % 2 == 0 else str(idx))
+        (quantiles if idx % 2 == 0 else other_quantiles).add(idx, original=str(idx))
+    assert abs(distinct_count.estimate() - 5000) < 5000 * 3 * distinct_count.get_relative_error()
+    assert frequent.get_top(1)[0][0] == 'frequent' and not frequent.is_exact()
+    assert 10000 - frequent.error <= frequent.get_top(1)[0][1] <= 10000
+    quantiles.merge(other_quantiles)
+    assert quantiles.count == 20000
+    assert abs(quantiles.get_quantile(0.5) - 10000) < 500 and abs(quantiles.get_quantile(0.25) - 5000) < 500
+    extremes, complete = quantiles.get_extremes()
+    assert not complete and [val for val, count, orig in extremes] == [0, 1, 2, 3, 4, 19995, 19996, 19997, 19998, 19999]
+
+    data_dir = os.path.join(BASE_PATH, 'test_data')
+    # all columns of the test data fit into the heavy hitters summary
+    assert (MetaDataGenerator(data_dir, use_sketches=True).gather_meta_data().to_dict()
+            == MetaDataGenerator(data_dir).gather_meta_data().to_dict())
+
+    generated_data = {'table' : [{'id' : str(idx), 'value' : '1000' if idx == 7 else str(idx % 2000),
+                                  'code' : 'code' + str(idx % 5) if idx % 3 else 'other' + str(idx),
+                                  'decimal' : 'bad' if idx % 100 == 0 else str(idx / 7)} for idx in range(30000)]}
+    for nof_processes in [1, 2]:
+        result = MetaDataGenerator(generated_data, use_sketches=True, nof_processes=nof_processes,
+                                   rows_per_shard=7000).gather_meta_data()
+        assert result.get_primary_key('table') == 'id'
+        value_info = result.get_variable('table', 'value')
+        assert value_info.variable_type == VariableType.Metric and value_info.binning.should_bin
+        assert abs(value_info.value_distribution.median - 1000) < 100
+        code_info = result.get_variable('table', 'code')
+        assert code_info.variable_type == VariableType.Categorical
+        assert (set(list(code_info.value_distribution.category_counts.keys())[:5])
+                == {'code' + str(idx) for idx in range(5)})
+        decimal_info = result.get_variable('table', 'decimal')
+        assert decimal_info.data_type == DataType.Decimal and decimal_info.artifacts == ['bad']
+        assert decimal_info.value_distribution.artifact_count == 300
+
+def test_sampled_meta_extraction(tmp_path):
+    # time-ordered export: later rows contain decimal values and a new category
+    rows = [{'id' : str(idx), 'value' : str(idx) if idx < 2000 else str(idx / 3),
+             'code' : 'early' if idx < 2000 else 'late'} for idx in range(10000)]
+    with open(str(tmp_path / 'table.csv'), 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['id', 'value', 'code'])
+        writer.writeheader()
+        writer.writerows(rows)
+    for csv_data in [{'table' : rows}, str(tmp_path), ColumnarDataset({'table' : rows})]:
+        head = MetaDataGenerator(csv_data, nof_read_lines=1000).gather_meta_data()
+        assert head.get_variable('table', 'value').data_type == DataType.Integer
+        assert head.get_variable('table', 'code').value_distribution.category_counts == {'early' : 1000}
+        sampled = MetaDataGenerator(csv_data, nof_read_lines=1000, sample_rows=True,
+                                    nof_sample_blocks=20).gather_meta_data()
+        assert sampled.get_primary_key('table') == 'id'
+        assert sampled.get_variable('table', 'value').data_type == DataType.Decimal
+        code_counts = sampled.get_variable('table', 'code').value_distribution.category_counts
+        assert 600 <= code_counts['late'] <= 1000 and sum(code_counts.values()) >= 900
+        parallel = MetaDataGenerator(csv_data, nof_read_lines=1000, sample_rows=True, nof_sample_blocks=20,
+                                     nof_processes=2).gather_meta_data()
+        assert parallel.to_dict() == sampled.to_dict()
+
+    # rounded up blocks cover more rows than the table has
+    with open(str(tmp_path / 'table.csv'), 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['id', 'value', 'code'])
+        writer.writeheader()
+        writer.writerows(rows[:1001])
+    sampled = MetaDataGenerator(str(tmp_path), nof_read_lines=1000, sample_rows=True,
+                                nof_sample_blocks=3).gather_meta_data()
+    assert sampled.get_primary_key('table') == 'id'
+    assert 900 <= sum(sampled.get_variable('table', 'code').value_distribution.category_counts.values()) <= 1001
+
+    with pytest.raises(AttributeError) as exc:
+        MetaDataGenerator({'table' : rows}, sample_rows=True, use_sketches=True)
+    assert str(exc.value) == 'Rows cannot be sampled, when whole tables are profiled with sketches'
+
+def test_foreign_key_discovery():
+    data = {'patients' : [{'patient_id' : str(idx), 'sex' : 'MF'[idx % 2]} for idx in range(2000)],
+            'visits' : [{'visit_id' : 'v' + str(idx), 'pid' : str(idx * 7 % 1500), 'ward' : 'w' + str(idx % 5)}
+                        for idx in range(3000)],
+            'archived_patients' : [{'patient_id' : str(idx)} for idx in range(1900, 2100)],
+            'labs' : [{'lab_id' : str(idx), 'patient_id' : str(idx % 1800)} for idx in range(4000)]}
+    for use_sketches in [False, True]:
+        generator = MetaDataGenerator(data, use_sketches=use_sketches)
+        result = generator.gather_meta_data()
+        assert result.get_primary_key('visits') == 'visit_id'
+        # renamed keys are only reported
+        # integer keys with overlapping ranges are all reported, the closest first
+        assert [candidate[:3] for candidate in generator.foreign_key_candidates] == [('visits', 'pid', 'patients'),
+                                                                                     ('visits', 'pid', 'labs')]
+        assert generator.foreign_key_candidates[0][3] >= 0.95
+        assert result.get_foreign_keys('visits') == {}
+        # the primary key containing the values is preferred
+        assert result.get_foreign_keys('labs') == {'patient_id' : 'patients'}
+
+    with pytest.raises(AttributeError) as exc:
+        MetaDataGenerator(data, foreign_key_containment=0)
+    assert str(exc.value) == 'Foreign key containment must be larger than 0 and at most 1'
+
+def test_incremental_meta_refresh(tmp_path, capsys):
+    def write_table(table, rows):
+        with open(os.path.join(tmp_path, table + '.csv'), 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+
+    write_table('patients', [{'patient_id' : str(idx), 'sex' : 'MF'[idx % 2]} for idx in range(50)])
+    write_table('visits', [{'visit_id' : str(idx), 'patient_id' : str(idx % 50), 'ward' : 'w' + str(idx % 3)}
+                           for idx in range(200)])
+    write_table('wards', [{'ward' : 'w' + str(idx), 'floor' : str(idx // 2)} for idx in range(3)])
+    cache_path = os.path.join(tmp_path, 'profiles.pickle')
+    # corrupt, truncated or outdated caches are ignored and overwritten
+    with open(cache_path, 'wb') as f:
+        f.write(b'garbage')
+    expected = MetaDataGenerator(str(tmp_path), profile_cache=cache_path).gather_meta_data().to_dict()
+    with open(cache_path, 'rb') as f:
+        valid_cache = f.read()
+    for invalid_cache in [valid_cache[:len(valid_cache) // 2], pickle.dumps({'settings' : None, 'tables' : {}})]:
+        with open(cache_path, 'wb') as f:
+            f.write(invalid_cache)
+        assert ProfileCache.load(cache_path).tables == {}
+        assert MetaDataGenerator(str(tmp_path), profile_cache=cache_path).gather_meta_data().to_dict() == expected
+    assert sorted(os.listdir(tmp_path)) == ['patients.csv', 'profiles.pickle', 'visits.csv', 'wards.csv']
+    generator = MetaDataGenerator(str(tmp_path), profile_cache=cache_path)
+    result = generator.gather_meta_data()
+    assert os.path.isfile(cache_path)
+    assert result.get_foreign_keys('visits') == {'patient_id' : 'patients', 'ward' : 'wards'}
+    result.get_variable('patients', 'sex').description = 'Biological sex'
+    result.assign_label('visits', 'Visit')
+    result.get_variable('visits', 'ward').description = 'The ward'
+
+    # touched, but unchanged files are not profiled again
+    os.utime(os.path.join(tmp_path, 'patients.csv'))
+    write_table('visits', [{'visit_id' : str(idx), 'patient_id' : str(idx % 50), 'ward' : 'x' + str(idx % 4)}
+                           for idx in range(300)])
+    os.remove(os.path.join(tmp_path, 'wards.csv'))
+    generator = MetaDataGenerator(str(tmp_path), profile_cache=cache_path)
+    capsys.readouterr()
+    refreshed = generator.refresh_meta_data(result)
+    output = capsys.readouterr().out
+    assert 'Refreshing 1 of 2 tables' in output
+    assert 'Extracting variable information from table patients' not in output
+    assert refreshed.get_table_names() == ['patients', 'visits']
+    assert refreshed.get_variable('patients', 'sex').description == 'Biological sex'
+    assert refreshed.get_label('visits') == 'Visit'
+    ward_info = refreshed.get_variable('visits', 'ward')
+    assert ward_info.description == 'The ward'
+    assert ward_info.variable_type == VariableType.Categorical
+    assert set(ward_info.value_distribution.category_counts.keys()) == {'x0', 'x1', 'x2', 'x3'}
+    assert refreshed.get_foreign_keys('visits') == {'patient_id' : 'patients'}
+    # the input metadata is not changed
+    assert result.get_foreign_keys('visits') == {'patient_id' : 'patients', 'ward' : 'wards'}
+
+    # the refresh matches a full extraction
+    full_result = MetaDataGenerator(str(tmp_path)).gather_meta_data()
+    for table in full_result.get_table_names():
+        assert refreshed.get_primary_key(table) == full_result.get_primary_key(table)
+        for variable in full_result.get_variable_names(table):
+            assert (refreshed.get_variable(table, variable).value_distribution
+                    == full_result.get_variable(table, variable).value_distribution)
+
+    with pytest.raises(AttributeError) as exc:
+        MetaDataGenerator(str(tmp_path)).refresh_meta_data(result)
+    assert str(exc.value) == 'A profile cache is required for incremental refreshes'
+
+def test_binning_of_short_rows():
+    # None values of short rows count towards the binning and categorical thresholds
+    data = {'table' : [{'id' : str(idx), 'num' : str(idx % 3) if idx < 6 else None} for idx in range(10)]}
+    var_info = MetaDataGenerator(data, binning_threshold=7, categorical_threshold=3).gather_meta_data().get_variable(
+        'table', 'num')
+    assert var_info.variable_type == VariableType.Metric
+    assert var_info.binning.should_bin
+    var_info = MetaDataGenerator(data, binning_threshold=10, categorical_threshold=4).gather_meta_data().get_variable(
+        'table', 'num')
+    assert var_info.variable_type == VariableType.Categorical
+    assert not var_info.binning.should_bin
 
 if __name__ == '__main__':
     pytest.main()
@@ -1,11 +1,12 @@
 import copy
+import pickle
 import pytest
 import pathlib
 ROOT_DIR = str(pathlib.Path(__file__).parents[2])
 import sys
 sys.path.append(ROOT_DIR)
 from dataclasses import asdict
-from graphxplore.MetaDataHandling import MetaData, VariableInfo, VariableType, DataType
+from graphxplore.MetaDataHandling import MetaData, VariableInfo, VariableType, DataType, ValueFilter, CastMemo
 
 def test_value_casting():
     val = 'someString'
@@ -21,6 +22,39 @@ def test_value_casting():
     assert VariableInfo.cast_value(val, DataType.Integer) == 42
     assert VariableInfo.cast_value(val, DataType.Decimal) == 42.0
 
+def test_cast_memo():
+    memo = CastMemo(DataType.Integer, max_size=2)
+    assert memo.get_hit_rate() is None
+    assert [memo.cast(val) for val in ['1', '1', 'x', 'x', '2', '2', '1']] == [1, 1, None, None, 2, 2, 1]
+    # '2' exceeds the maximal size and is not memoized
+    assert len(memo) == 2
+    assert (memo.nof_hits, memo.nof_misses) == (3, 4)
+    assert memo.get_hit_rate() == 3 / 7
+    # only strings are memoized
+    memo = CastMemo(DataType.String)
+    assert memo.cast(1) == '1' and memo.cast(1.0) == '1.0'
+    assert len(memo) == 0
+    decimal_memo = VariableInfo(name='var', table='table', labels=[], variable_type=VariableType.Metric,
+                                data_type=DataType.Decimal).get_cast_memo()
+    assert decimal_memo.cast('3.5') == 3.5 and decimal_memo.cast('3.5') == 3.5
+    assert decimal_memo.nof_hits == 1
+
+def test_value_filter():
+    var_info = VariableInfo(name='var', table='table', labels=[], variable_type=VariableType.Categorical,
+                            data_type=DataType.Integer, artifacts=[str(val) for val in range(1000, 5000)])
+    value_filter = var_info.get_value_filter(missing_vals=('', 'NaN'))
+    assert value_filter.is_missing(None) and value_filter.is_missing('NaN')
+    assert not value_filter.is_missing('4999')
+    assert value_filter.is_artifact('4999') and not value_filter.is_artifact('')
+    assert value_filter.is_excluded('') and value_filter.is_excluded('1000')
+    assert not value_filter.is_excluded('42')
+    assert value_filter.get_valid_values(['42', None, '1000', 'NaN', '7']) == ['42', '7']
+    # later changes of the artifacts are not reflected
+    var_info.artifacts = None
+    assert value_filter.is_artifact('1000')
+    assert not var_info.get_value_filter().is_excluded('1000')
+    assert ValueFilter().is_missing('na')
+
 def test_var_info_dict_init():
     input_dict = {'invalid_key' : 'invalid_val'}
     with pytest.raises(AttributeError) as exc:
@@ -262,6 +296,75 @@ def test_metadata():
 
     assert MetaData.from_dict(actual).to_dict() == actual
 
+def test_table_views():
+    meta = MetaData(['first', 'second'])
+    meta.add_variable('first', 'first_pk')
+    meta.assign_primary_key('first', 'first_pk')
+    meta.add_variable('second', 'second_pk')
+    # views are reused until the table changes
+    names = meta.get_variable_names('second')
+    assert names == ('second_pk',)
+    assert meta.get_variable_names('second') is names
+    assert meta.get_primary_key_info('second') is None
+    meta.assign_primary_key('second', 'second_pk')
+    assert meta.get_primary_key_info('second') is meta.get_variable('second', 'second_pk')
+    meta.add_variable('second', 'first_pk')
+    assert meta.get_variable_names('second') == ('second_pk', 'first_pk')
+    meta.add_foreign_key('second', 'first', 'first_pk')
+    foreign_keys = meta.get_foreign_keys('second')
+    assert foreign_keys == {'first_pk' : 'first'}
+    with pytest.raises(TypeError):
+        foreign_keys['other'] = 'first'
+    meta.change_primary_key('first', 'first_pk')
+    assert meta.get_foreign_keys('second') is foreign_keys
+    meta.remove_variable('first', 'first_pk')
+    assert meta.get_foreign_keys('second') == {}
+    assert meta.get_variable_names('first') == ()
+    assert meta.get_primary_key_info('first') is None
+    var_info = VariableInfo('var', 'second', [], VariableType.Metric, DataType.Integer)
+    assert meta.add_variable('second', 'var', var_info) is var_info
+    assert meta.get_variable_names('second') == ('second_pk', 'first_pk', 'var')
+    with pytest.raises(AttributeError) as exc:
+        meta.add_variable('first', 'var', var_info)
+    assert str(exc.value) == 'Variable info of "var" in table "second" cannot be added as variable "var" of table "first"'
+    meta.remove_table('first')
+    with pytest.raises(AttributeError) as exc:
+        meta.get_variable_names('first')
+    assert str(exc.value) == 'Table "first" not in meta data'
+    with pytest.raises(AttributeError) as exc:
+        meta.get_variable('second', 'invalid')
+    assert str(exc.value) == 'Variable "invalid" is not a variable of table "second" in meta data'
+
+    # metadata with cached views can be pickled
+    meta.get_foreign_keys('second')
+    unpickled = pickle.loads(pickle.dumps(meta))
+    assert unpickled.to_dict() == meta.to_dict()
+    assert unpickled.get_foreign_keys('second') == meta.get_foreign_keys('second')
+    assert unpickled.get_variable_names('second') == ('second_pk', 'first_pk', 'var')
+
+    # views of referencing tables are invalidated, whether they were cached before or not
+    for cache_view in [False, True]:
+        meta = MetaData(['a', 'b', 'c'])
+        for table in ['a', 'b', 'c']:
+            meta.add_variable(table, 'pk')
+        meta.assign_primary_key('a', 'pk')
+        meta.add_foreign_key('b', 'a', 'pk')
+        meta.add_foreign_key('c', 'a', 'pk')
+        if cache_view:
+            assert meta.get_foreign_keys('b') == {'pk' : 'a'}
+        meta.remove_table('a')
+        assert meta.get_foreign_keys('b') == meta.data['b']['foreign_keys'] == {}
+        assert meta.get_variable('b', 'pk').variable_type == VariableType.Categorical
+        meta.add_table('a')
+        meta.add_variable('a', 'a_pk')
+        meta.assign_primary_key('a', 'a_pk')
+        meta.add_variable('c', 'a_pk')
+        meta.add_foreign_key('c', 'a', 'a_pk')
+        if cache_view:
+            assert meta.get_foreign_keys('c') == {'a_pk' : 'a'}
+        meta.remove_variable('a', 'a_pk')
+        assert meta.get_foreign_keys('c') == meta.data['c']['foreign_keys'] == {}
+
 def test_deep_copy():
     first = MetaData(['table1', 'table2'])
     first.add_variable('table1', 'pk1')
@@ -279,6 +382,56 @@ def test_deep_copy():
     second.get_variable('table1', 'pk1').data_type = DataType.Integer
     assert first.get_variable('table1', 'pk1').data_type == DataType.String
 
+def test_metadata_snapshot(tmp_path):
+    meta = MetaData(['table1', 'table2'])
+    meta.add_variable('table1', 'pk1')
+    meta.assign_primary_key('table1', 'pk1')
+    meta.add_variable('table2', 'pk1')
+    meta.add_foreign_key('table2', 'table1', 'pk1')
+    var_info = meta.add_variable('table2', 'var')
+    var_info.artifacts = ['a', 'b']
+    var_info.data_type_distribution = {DataType.String : 1.0}
+    assert var_info.to_dict()['data_type_distribution'] == {'String' : 1.0}
+    # dictionaries do not share containers with the variable
+    var_dict = var_info.to_dict()
+    var_dict['artifacts'].append('c')
+    assert var_info.artifacts == ['a', 'b']
+
+    copied = copy.deepcopy(meta)
+    assert copied.get_content_hash() == meta.get_content_hash()
+    copied.get_variable('table2', 'var').artifacts.append('c')
+    assert copied.get_content_hash() != meta.get_content_hash()
+
+    snapshot_path = str(tmp_path / 'meta.pickle')
+    meta.store_snapshot(snapshot_path)
+    for validate in [False, True]:
+        loaded = MetaData.load_snapshot(snapshot_path, validate)
+        assert loaded.to_dict() == meta.to_dict()
+        assert loaded.get_content_hash() == meta.get_content_hash()
+
+    json_path = str(tmp_path / 'meta.json')
+    meta.store_in_json(json_path)
+    cache_path = str(tmp_path / 'meta_cache.pickle')
+    first_load = MetaData.load_from_json(json_path, snapshot_path=cache_path)
+    assert first_load.to_dict() == meta.to_dict()
+    assert MetaData.load_from_json(json_path, snapshot_path=cache_path).to_dict() == meta.to_dict()
+    # the snapshot is replaced, if the JSON changed
+    copied.store_in_json(json_path)
+    assert MetaData.load_from_json(json_path, snapshot_path=cache_path).to_dict() == copied.to_dict()
+    # corrupt, truncated or outdated snapshots are cache misses and overwritten
+    with open(cache_path, 'rb') as f:
+        valid_snapshot = f.read()
+    for invalid_snapshot in [b'garbage', valid_snapshot[:len(valid_snapshot) // 2],
+                             pickle.dumps({'version' : 0, 'data' : {}})]:
+        with open(cache_path, 'wb') as f:
+            f.write(invalid_snapshot)
+        assert MetaData.load_from_json(json_path, snapshot_path=cache_path).to_dict() == copied.to_dict()
+        assert MetaData.load_snapshot(cache_path).to_dict() == copied.to_dict()
+
+    with pytest.raises(AttributeError) as exc:
+        MetaData.load_snapshot(json_path)
+    assert str(exc.value) == 'File "' + json_path + '" is not a metadata snapshot of version 1'
+
 
 def test_value_distribution():
     metric = VariableInfo('metric', 'table', ['label'], VariableType.Metric, DataType.Integer)
@@ -352,6 +505,25 @@ def test_value_distribution():
     assert fk.value_distribution is None
     assert fk.artifacts is None
 
+    # strings with the same numeric value are merged, the last string and count are kept
+    decimal = VariableInfo('decimal', 'table', ['label'], VariableType.Metric, DataType.Decimal)
+    decimal.detect_artifacts_and_value_distribution({'1' : 3, '2' : 4, '1.0' : 2, '2.5' : 1, '3' : 2, '40' : 1})
+    assert asdict(decimal.value_distribution) == {
+        'artifact_count': 1,
+        'lower_fence': 1.0,
+        'median': 2.0,
+        'missing_count': 0,
+        'outliers': [],
+        'q1': 2.0,
+        'q3': 3.0,
+        'upper_fence': 4.5
+    }
+    assert decimal.artifacts == ['40']
+    decimal.variable_type = VariableType.Categorical
+    decimal.artifacts = None
+    decimal.detect_artifacts_and_value_distribution({'1' : 3, '2' : 4, '1.0' : 2, '2.5' : 1})
+    assert decimal.value_distribution.category_counts == {'2' : 4, '1.0' : 2, '2.5' : 1}
+
 
 if __name__ == '__main__':
     pytest.main()